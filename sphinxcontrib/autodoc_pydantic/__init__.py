@@ -19,8 +19,11 @@ def setup(app: Sphinx) -> dict[str, Any]:
     application.add_configuration_values(app)
     application.add_directives_and_autodocumenters(app)
     application.add_domain_object_types(app)
-    app.add_css_file('autodoc_pydantic.css')
+    application.add_build_caches(app)
+    app.add_css_file(application.CSS_FILENAME)
     app.connect('build-finished', application.add_css_file)
+    app.connect('builder-inited', application.register_js_file)
+    app.connect('build-finished', application.add_js_file)
 
     return {
         'version': __version__,
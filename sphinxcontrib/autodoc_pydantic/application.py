@@ -3,21 +3,37 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
-from pydantic import BaseModel
 from sphinx.domains import ObjType
 
+from sphinxcontrib.autodoc_pydantic.assets import ASSET_DIRECTIVE, AssetDirective
 from sphinxcontrib.autodoc_pydantic.directives import autodocumenters, directives
 from sphinxcontrib.autodoc_pydantic.directives.options import enums
 from sphinxcontrib.autodoc_pydantic.events import (
     add_fallback_css_class,
+    copy_assets,
+    get_outdated_docs,
+    merge_build_state,
+    pregenerate_schemas,
+    prune_model_results,
+    purge_doc,
+    report_schema_store,
+    reset_build_caches,
+    share_erdantic_diagrams,
+    start_diagram_rendering,
+    stop_diagram_rendering,
+    substitute_asset_nodes,
+    substitute_rendered_diagrams,
+    write_profile_report,
 )
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
 EXTENSION_PREFIX = 'autodoc_pydantic_'
+CSS_FILENAME = 'autodoc_pydantic.css'
+JS_FILENAME = 'autodoc_pydantic.js'
 
 AUTODOCUMENTERS = [
     autodocumenters.PydanticFieldDocumenter,
@@ -34,11 +50,13 @@ DOMAIN_DIRECTIVES = {
 }
 
 
-class Config(BaseModel):
+class Config(NamedTuple):
     name: str
     default: Any
     types: type
-    rebuild: Literal['env'] = 'env'
+    affects_content: bool = True
+    # documents affected by changed values are re-read via `env-get-outdated`
+    rebuild: Literal['env', ''] = ''
 
     @property
     def full_name(self) -> str:
@@ -261,6 +279,47 @@ APP_CONFIGURATIONS = [
         default=True,
         types=bool,
     ),
+    Config(
+        name='schema_cache',
+        default=False,
+        types=bool,
+        affects_content=False,
+    ),
+    Config(
+        name='schema_cache_max_size',
+        default=50,
+        types=int,
+        affects_content=False,
+    ),
+    Config(
+        name='schema_files',
+        default=False,
+        types=bool,
+    ),
+    Config(
+        name='schema_workers',
+        default=0,
+        types=int,
+        affects_content=False,
+    ),
+    Config(
+        name='erdantic_workers',
+        default=0,
+        types=int,
+        affects_content=False,
+    ),
+    Config(
+        name='erdantic_timeout',
+        default=60,
+        types=int,
+        affects_content=False,
+    ),
+    Config(
+        name='profile',
+        default=False,
+        types=bool,
+        affects_content=False,
+    ),
 ]
 # fmt: on
 
@@ -278,17 +337,44 @@ OBJ_TYPES_MAPPING = {
 }
 
 
-def add_css_file(app: Sphinx, *_) -> None:  # noqa: ANN002
-    """Adds custom css to HTML output."""
+def copy_static_file(app: Sphinx, path: Path) -> None:
+    """Copy file of given `path` into the static directory of the HTML output
+    unless it exists already.
+
+    """
 
-    filename = 'autodoc_pydantic.css'
     static_path = (Path(app.outdir) / '_static').absolute()
     static_path.mkdir(exist_ok=True, parents=True)
-    path_css = Path(__file__).parent.joinpath('css', filename)
 
-    if not (static_path / filename).exists():
-        content = path_css.read_text()
-        (static_path / filename).write_text(content)
+    if not (static_path / path.name).exists():
+        content = path.read_text()
+        (static_path / path.name).write_text(content)
+
+
+def add_css_file(app: Sphinx, *_) -> None:  # noqa: ANN002
+    """Adds custom css to HTML output."""
+
+    copy_static_file(app, Path(__file__).parent.joinpath('css', CSS_FILENAME))
+
+
+def register_js_file(app: Sphinx) -> None:
+    """Registers javascript which lazily loads JSON schema files if enabled
+    via `autodoc_pydantic_schema_files`.
+
+    """
+
+    if app.config.autodoc_pydantic_schema_files:
+        app.add_js_file(JS_FILENAME)
+
+
+def add_js_file(app: Sphinx, *_) -> None:  # noqa: ANN002
+    """Adds javascript to HTML output if JSON schema files are enabled via
+    `autodoc_pydantic_schema_files`.
+
+    """
+
+    if app.config.autodoc_pydantic_schema_files:
+        copy_static_file(app, Path(__file__).parent.joinpath('js', JS_FILENAME))
 
 
 def add_domain_object_types(app: Sphinx) -> None:
@@ -326,6 +412,8 @@ def add_directives_and_autodocumenters(
     for name, directive in DOMAIN_DIRECTIVES.items():
         app.add_directive_to_domain('py', name, directive)
 
+    app.add_directive(ASSET_DIRECTIVE, AssetDirective)
+
     app.setup_extension('sphinx.ext.autodoc')
     for autodocumenter in AUTODOCUMENTERS:
         app.add_autodocumenter(autodocumenter)
@@ -334,3 +422,26 @@ def add_directives_and_autodocumenters(
         'object-description-transform',
         add_fallback_css_class,
     )
+
+
+def add_build_caches(app: Sphinx) -> None:
+    """Adds event handlers to manage build-scoped caches which are shared
+    between all autodocumenters, to merge state of parallel read workers and
+    to report the optional profiling results.
+
+    """
+
+    app.connect('builder-inited', reset_build_caches)
+    app.connect('env-get-outdated', get_outdated_docs)
+    app.connect('env-purge-doc', purge_doc)
+    app.connect('env-merge-info', merge_build_state)
+    app.connect('env-before-read-docs', pregenerate_schemas)
+    app.connect('doctree-read', share_erdantic_diagrams)
+    app.connect('env-updated', prune_model_results)
+    app.connect('env-updated', start_diagram_rendering)
+    app.connect('doctree-resolved', substitute_rendered_diagrams)
+    app.connect('doctree-resolved', substitute_asset_nodes)
+    app.connect('build-finished', report_schema_store)
+    app.connect('build-finished', write_profile_report)
+    app.connect('build-finished', copy_assets)
+    app.connect('build-finished', stop_diagram_rendering)
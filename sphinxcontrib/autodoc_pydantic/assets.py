@@ -0,0 +1,226 @@
+"""This module contains the content-addressed storage of files which are
+referenced by documents instead of being inlined (e.g. JSON schemas). Assets
+are written next to the doctrees while reading and copied into the static
+directory of the HTML output once the build finished. Documents only contain
+builder-neutral `asset` nodes which are resolved per builder once the doctree
+is resolved.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable
+
+from docutils import nodes
+from docutils.parsers.rst import directives
+from sphinx.util import logging
+from sphinx.util.docutils import SphinxDirective
+
+from sphinxcontrib.autodoc_pydantic.directives.templates import to_lazy_collapsable
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+ENV_ASSET_STORE = 'autodoc_pydantic_asset_store'
+ASSET_STORE_DIRNAME = 'autodoc_pydantic_assets'
+ASSET_STATIC_DIRNAME = '_static'
+ASSET_DIRECTIVE = 'autodoc-pydantic-asset'
+
+
+class AssetStore:
+    """Stores assets by the hash of their content. Hence, identical contents
+    are written only once even if they are referenced by multiple documents or
+    models. Additionally, assets referenced per document are recorded to copy
+    only those into the output directory which are still in use.
+
+    Files are persisted within the doctree directory. This allows documents
+    which are not re-read by incremental builds to still reference existing
+    assets even if the output directory was removed.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._docnames: dict[str, set[str]] = {}
+
+    def add(self, docname: str, directory: str, content: str, suffix: str) -> str:
+        """Store given `content` as an asset of given `docname` within
+        `directory` with given file name `suffix`. Return the asset's path
+        relative to the static directory of the output, e.g.
+        ``schemas/<hash>.json``.
+
+        """
+
+        digest = hashlib.sha256(content.encode()).hexdigest()[:32]
+        name = f'{directory}/{digest}{suffix}'
+
+        if not self.reference(docname, name):
+            path = self.path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # parallel read workers may write identical assets concurrently
+            tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            tmp_path.write_text(content, encoding='utf-8')
+            tmp_path.replace(path)
+            self._docnames.setdefault(docname, set()).add(name)
+
+        return name
+
+    def reference(self, docname: str, name: str) -> bool:
+        """Record the existing asset `name` as an asset of given `docname`.
+        Return False without recording it if the asset's file does not exist
+        (anymore).
+
+        """
+
+        if not (self.path / name).exists():
+            return False
+
+        self._docnames.setdefault(docname, set()).add(name)
+        return True
+
+    def read(self, name: str) -> str | None:
+        """Return the content of asset `name` or None if it does not exist."""
+
+        try:
+            return (self.path / name).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    @property
+    def names(self) -> set[str]:
+        """Return names of all assets which are referenced by any document."""
+
+        return set().union(*self._docnames.values())
+
+    def copy_to(self, outdir: Path) -> int:
+        """Copy all referenced assets into the static directory of given
+        `outdir` unless they exist already. Return the number of copied
+        assets.
+
+        """
+
+        copied = 0
+        for name in sorted(self.names):
+            source = self.path / name
+            target = Path(outdir) / ASSET_STATIC_DIRNAME / name
+            if target.exists() or not source.exists():
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, target)
+            copied += 1
+
+        return copied
+
+    def merge(self, other: AssetStore, docnames: Iterable[str]) -> None:
+        """Merge assets referenced by given `docnames` from `other` which was
+        populated in a parallel sphinx read worker.
+
+        """
+
+        for docname in docnames:
+            if docname in other._docnames:  # noqa: SLF001
+                self._docnames[docname] = other._docnames[docname]  # noqa: SLF001
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all asset references of given `docname`. Files are kept
+        because they may be referenced again once the document is re-read.
+
+        """
+
+        self._docnames.pop(docname, None)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:  # noqa: ANN401
+        return any(name in names for names in self._docnames.values())
+
+
+class asset(nodes.General, nodes.Element):  # noqa: N801
+    """Builder-neutral placeholder of a collapsable block showing the content
+    of an asset. It only holds the asset's name and is replaced once the
+    doctree is resolved (see `substitute_assets`).
+
+    """
+
+
+class AssetDirective(SphinxDirective):
+    """Inserts an `asset` node for the asset given as the only argument. It is
+    used by auto-documenters instead of inlining large contents.
+
+    """
+
+    required_arguments = 1
+    option_spec: ClassVar = {
+        'title': directives.unchanged_required,
+        'class': directives.unchanged_required,
+        'language': directives.unchanged_required,
+    }
+
+    def run(self) -> list[nodes.Node]:
+        node = asset(
+            name=self.arguments[0],
+            title=self.options.get('title', ''),
+            css_class=self.options.get('class', ''),
+            language=self.options.get('language', 'json'),
+        )
+        self.set_source_info(node)
+        return [node]
+
+
+def substitute_assets(app: Sphinx, doctree: nodes.document) -> int:
+    """Replace all `asset` nodes of given `doctree` according to the current
+    builder. HTML builders get a collapsable block which lazily fetches the
+    asset from the static directory while other builders get the asset's
+    content inlined as a literal block. Return the number of replaced nodes.
+
+    """
+
+    store = get_asset_store(app.env)
+    is_html = app.builder.format == 'html'
+    replaced = 0
+
+    findall = getattr(doctree, 'findall', doctree.traverse)
+    for node in list(findall(asset)):
+        replaced += 1
+        if is_html:
+            html = to_lazy_collapsable(
+                src=f'{ASSET_STATIC_DIRNAME}/{node["name"]}',
+                title=node['title'],
+                css_class=node['css_class'],
+                language=node['language'],
+            )
+            node.replace_self(nodes.raw('', html, format='html'))
+            continue
+
+        content = store.read(node['name'])
+        if content is None:
+            logger = logging.getLogger(__name__)
+            logger.warning('asset %s is missing', node['name'], location=node)
+            node.parent.remove(node)
+            continue
+
+        block = nodes.literal_block(content, content, language=node['language'])
+        node.replace_self(block)
+
+    return replaced
+
+
+def get_asset_store(env: BuildEnvironment) -> AssetStore:
+    """Get the `AssetStore` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    store = getattr(env, ENV_ASSET_STORE, None)
+    if store is None:
+        store = AssetStore(path=Path(env.doctreedir) / ASSET_STORE_DIRNAME)
+        setattr(env, ENV_ASSET_STORE, store)
+
+    return store
@@ -0,0 +1,772 @@
+"""This module contains build-scoped caches which are shared between all
+autodocumenters and directives of a single sphinx build.
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+import warnings
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+)
+
+from pydantic import BaseModel
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE
+from sphinx.util import logging
+from sphinx.util.typing import get_type_hints
+
+try:
+    from sphinx.util.typing import stringify_annotation
+except ImportError:
+    # fall back to older name for older versions of Sphinx
+    from sphinx.util.typing import (  # type: ignore[no-redef]
+        stringify as stringify_annotation,
+    )
+
+from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector, StaticInspector
+
+if TYPE_CHECKING:
+    from sphinx.environment import BuildEnvironment
+
+ENV_INSPECTOR_REGISTRY = 'autodoc_pydantic_inspector_registry'
+ENV_SCHEMA_STORE = 'autodoc_pydantic_schema_store'
+ENV_DISK_SCHEMA_CACHE = 'autodoc_pydantic_disk_schema_cache'
+ENV_TYPE_HINTS_CACHE = 'autodoc_pydantic_type_hints_cache'
+ENV_MODEL_RESULT_CACHE = 'autodoc_pydantic_model_result_cache'
+
+DISK_SCHEMA_CACHE_FILENAME = 'autodoc_pydantic_schemas.sqlite'
+SQL_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS schemas (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+DEFS_KEY = '$defs'
+DEFS_REF_PREFIX = DEFAULT_REF_TEMPLATE.split('{', maxsplit=1)[0]
+
+
+_MODEL_KEYS: weakref.WeakKeyDictionary[type[BaseModel], tuple[str, str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_model_key(model: type[BaseModel]) -> tuple[str, str]:
+    """Get qualified name and fingerprint of given `model`. The fingerprint
+    includes the autodoc_pydantic version because rendered results may change
+    between versions. Keys are computed only once per model and process.
+
+    """
+
+    key = _MODEL_KEYS.get(model)
+    if key is None:
+        from sphinxcontrib.autodoc_pydantic import __version__
+
+        name = f'{model.__module__}.{model.__qualname__}'
+        fingerprint = StaticInspector.get_fingerprint(model)
+        key = name, f'{__version__}:{fingerprint}'
+        _MODEL_KEYS[model] = key
+
+    return key
+
+
+class SchemaDefinition(NamedTuple):
+    """Reference to the definition of a pydantic model within the JSON schema
+    of another model.
+
+    """
+
+    name: str
+    """Name of the definition within `$defs`."""
+
+    schema: dict
+    """JSON schema of the model containing the definition."""
+
+
+class SchemaStore:
+    """Provides JSON schemas of pydantic models for the entire build. Schemas
+    are stored per model and schema generation settings (e.g. `by_alias` or
+    `mode`).
+
+    Additionally, the definitions of nested models (`$defs`) are collected.
+    Once a nested model is documented itself, its schema is assembled from an
+    already generated definition instead of generating it again. Definitions
+    are only reused for default generation settings and models which do not
+    override pydantic's `model_json_schema`. Otherwise, a definition may
+    differ from the model's standalone schema.
+
+    Stored schemas are shared and must not be mutated.
+
+    """
+
+    def __init__(self) -> None:
+        self._schemas: weakref.WeakKeyDictionary[type[BaseModel], dict[tuple, dict]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._definitions: weakref.WeakKeyDictionary[
+            type[BaseModel], dict[tuple, SchemaDefinition]
+        ] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.definition_hits = 0
+        self.misses = 0
+
+    def get(self, model: type[BaseModel], **settings: Any) -> dict:  # noqa: ANN401
+        """Get JSON schema for given `model` and schema generation `settings`
+        which are passed to pydantic's `model_json_schema`.
+
+        """
+
+        key = tuple(sorted(settings.items()))
+        schemas = self._schemas.setdefault(model, {})
+
+        if key in schemas:
+            self.hits += 1
+            return schemas[key]
+
+        schema = self._from_definition(model, key)
+        if schema is None:
+            self.misses += 1
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                schema = model.model_json_schema(**settings)
+            self._collect_definitions(model, key, schema)
+        else:
+            self.definition_hits += 1
+
+        schemas[key] = schema
+        return schema
+
+    def _from_definition(self, model: type[BaseModel], key: tuple) -> dict | None:
+        """Assemble the JSON schema of given `model` from a definition that was
+        generated as part of another model's schema. Return None if no such
+        definition exists or if it can't be reused safely.
+
+        """
+
+        definition = self._definitions.get(model, {}).get(key)
+        if definition is None:
+            return None
+
+        definitions = definition.schema[DEFS_KEY]
+        required = self._get_referenced_definitions(definition.name, definitions)
+
+        # recursive models are unpacked differently by pydantic
+        if definition.name in required:
+            return None
+
+        body = dict(definitions[definition.name])
+        if not required:
+            return body
+
+        subset = {name: definitions[name] for name in definitions if name in required}
+        if next(iter(definition.schema)) == DEFS_KEY:
+            return {DEFS_KEY: subset, **body}
+
+        return {**body, DEFS_KEY: subset}
+
+    @classmethod
+    def _get_referenced_definitions(cls, name: str, definitions: dict) -> set[str]:
+        """Get names of all definitions that are transitively referenced by the
+        definition with given `name`.
+
+        """
+
+        referenced: set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for ref in cls._iter_refs(definitions[current]):
+                if ref not in referenced:
+                    referenced.add(ref)
+                    pending.append(ref)
+
+        return referenced
+
+    @classmethod
+    def _iter_refs(cls, value: Any) -> Iterator[str]:  # noqa: ANN401
+        """Yield names of all definitions that are referenced in `value`."""
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == '$ref' and isinstance(item, str):
+                    yield item[len(DEFS_REF_PREFIX) :]
+                else:
+                    yield from cls._iter_refs(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from cls._iter_refs(item)
+
+    def _collect_definitions(
+        self,
+        model: type[BaseModel],
+        key: tuple,
+        schema: dict,
+    ) -> None:
+        """Collect definitions of nested pydantic models contained in `schema`.
+
+        Definitions are only collected if their names are unambiguous. Pydantic
+        prefixes names with module paths (e.g. `module__Model`) if distinct
+        models of the same name are used.
+
+        """
+
+        definitions = schema.get(DEFS_KEY)
+        if not definitions or key or not self._has_default_json_schema(model):
+            return
+
+        if any('__' in name for name in definitions):
+            return
+
+        nested = StaticInspector.get_nested_models(model)[1:]
+        names = [x.__name__ for x in nested]
+        for nested_model in nested:
+            name = nested_model.__name__
+            if not self._has_default_json_schema(nested_model):
+                continue
+
+            if name in definitions and names.count(name) == 1:
+                definition = SchemaDefinition(name=name, schema=schema)
+                self._definitions.setdefault(nested_model, {})[key] = definition
+
+    @staticmethod
+    def _has_default_json_schema(model: type[BaseModel]) -> bool:
+        """Check if given `model` uses pydantic's own `model_json_schema`
+        instead of overriding it.
+
+        """
+
+        default = getattr(BaseModel.model_json_schema, '__func__', None)
+        method = getattr(model.model_json_schema, '__func__', None)
+        return method is default
+
+    def clear(self) -> None:
+        """Remove all schemas and definitions while resetting statistics."""
+
+        self._schemas.clear()
+        self._definitions.clear()
+        self.hits = 0
+        self.definition_hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """Schemas are keyed by model classes which are not pickled along with
+        the build environment. Hence, an empty store is restored instead.
+
+        """
+
+        return self.__class__, ()
+
+
+class DiskSchemaCacheEntry(NamedTuple):
+    """Contains the rendered JSON schema of a pydantic model."""
+
+    non_serializable: list[str]
+    """Names of fields which are not JSON serializable."""
+
+    lines: list[str]
+    """Rendered reST lines of the JSON schema."""
+
+
+class DiskSchemaCache:
+    """Persists rendered JSON schemas of pydantic models across sphinx builds
+    within a single SQLite file. This allows unchanged models to skip schema
+    generation and rendering entirely.
+
+    Entries are keyed by the qualified name of the model. They are only valid
+    as long as the model's fingerprint (see `StaticInspector.get_fingerprint`)
+    and the autodoc_pydantic version remain unchanged. Once the total size of
+    all entries exceeds `max_size` bytes, least recently used entries are
+    evicted.
+
+    Any database error is logged as a warning and handled like a cache miss
+    to never break the build.
+
+    """
+
+    def __init__(self, path: Path, max_size: int) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Provide database connection. It is opened once per process because
+        connections must not be shared with forked parallel sphinx workers.
+
+        """
+
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute(SQL_CREATE_TABLE)
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    @staticmethod
+    def get_key(model: type[BaseModel]) -> tuple[str, str]:
+        """Get name and fingerprint of given `model`."""
+
+        return get_model_key(model)
+
+    def get(self, model: type[BaseModel]) -> DiskSchemaCacheEntry | None:
+        """Get cached entry for given `model`. Return None if there is no
+        valid entry.
+
+        """
+
+        name, fingerprint = self.get_key(model)
+
+        try:
+            row = self.connection.execute(
+                'SELECT fingerprint, content FROM schemas WHERE name = ?',
+                (name,),
+            ).fetchone()
+
+            if row is None or row[0] != fingerprint:
+                self.misses += 1
+                return None
+
+            self.connection.execute(
+                'UPDATE schemas SET accessed = ? WHERE name = ?',
+                (time.time(), name),
+            )
+
+        except sqlite3.Error as e:
+            self._warn(e)
+            return None
+
+        self.hits += 1
+        return DiskSchemaCacheEntry(**json.loads(row[1]))
+
+    def __contains__(self, model: type[BaseModel]) -> bool:
+        """Check if a valid entry exists for given `model` without accessing
+        it. Hence, neither statistics nor access times are updated.
+
+        """
+
+        name, fingerprint = self.get_key(model)
+
+        try:
+            row = self.connection.execute(
+                'SELECT fingerprint FROM schemas WHERE name = ?',
+                (name,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._warn(e)
+            return False
+
+        return row is not None and row[0] == fingerprint
+
+    def set(self, model: type[BaseModel], entry: DiskSchemaCacheEntry) -> None:
+        """Store given `entry` for given `model` while evicting least recently
+        used entries if the cache grows too large.
+
+        """
+
+        name, fingerprint = self.get_key(model)
+        content = json.dumps(entry._asdict())
+
+        try:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO schemas VALUES (?, ?, ?, ?, ?)',
+                (name, fingerprint, content, len(content), time.time()),
+            )
+            self.evict()
+        except sqlite3.Error as e:
+            self._warn(e)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the total size of all
+        entries does not exceed `max_size`.
+
+        """
+
+        query = 'SELECT COALESCE(SUM(size), 0) FROM schemas'
+        total = self.connection.execute(query).fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        query = 'SELECT name, size FROM schemas ORDER BY accessed'
+        evicted = []
+        for name, size in self.connection.execute(query).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((name,))
+            total -= size
+
+        self.connection.executemany('DELETE FROM schemas WHERE name = ?', evicted)
+
+    def _warn(self, error: sqlite3.Error) -> None:
+        logger = logging.getLogger(__name__)
+        logger.warning(
+            'autodoc_pydantic schema cache %s is not usable: %s',
+            self.path,
+            error,
+            location='autodoc_pydantic',
+        )
+
+    def close(self) -> None:
+        """Close the database connection of the current process."""
+
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+
+        self._connection = None
+        self._pid = None
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """The cache is not pickled along with the build environment because
+        its path and size depend on the configuration of the current build.
+        Hence, None is restored instead and the cache is created again from
+        the current configuration on first access.
+
+        """
+
+        return type(None), ()
+
+
+class ModelResultCache:
+    """Keeps picklable results of expensive computations per pydantic model,
+    e.g. stringified type hints or DOT sources of erdantic diagrams. In
+    contrast to other build caches, results are keyed by the qualified name of
+    the model and are pickled along with the build environment. Hence, results
+    of parallel sphinx read workers are merged back via `env-merge-info` and
+    are reused by subsequent incremental builds. Therefore, only small results
+    should be stored here.
+
+    Results are only valid as long as the model's fingerprint and the
+    autodoc_pydantic version remain unchanged (see `get_model_key`). The
+    documents storing results are tracked to drop results of models which are
+    not documented anymore.
+
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[str, tuple[str, dict[Hashable, Any]]] = {}
+        self._docnames: dict[str, set[str]] = {}
+
+    def get(self, model: type[BaseModel], key: Hashable) -> Any:  # noqa: ANN401
+        """Get result stored under `key` for given `model`. Return None if
+        there is no valid result.
+
+        """
+
+        name, fingerprint = get_model_key(model)
+        entry = self._results.get(name)
+        if entry is None or entry[0] != fingerprint:
+            return None
+
+        return entry[1].get(key)
+
+    def set(
+        self,
+        model: type[BaseModel],
+        key: Hashable,
+        value: Any,  # noqa: ANN401
+        docname: str | None = None,
+    ) -> None:
+        """Store `value` under `key` for given `model` while discarding all
+        outdated results of the model. Optionally, register `docname` as a
+        consumer of the model's results.
+
+        """
+
+        name, fingerprint = get_model_key(model)
+        entry = self._results.get(name)
+        if entry is None or entry[0] != fingerprint:
+            entry = (fingerprint, {})
+            self._results[name] = entry
+
+        entry[1][key] = value
+
+        if docname is not None:
+            self._docnames.setdefault(docname, set()).add(name)
+
+    def merge(self, other: ModelResultCache, docnames: Iterable[str]) -> None:
+        """Merge results stored by given `docnames` of `other` which was
+        populated in a parallel sphinx read worker.
+
+        """
+
+        for docname in docnames:
+            names = other._docnames.get(docname)  # noqa: SLF001
+            if names is None:
+                continue
+
+            self._docnames.setdefault(docname, set()).update(names)
+            for name in names:
+                fingerprint, results = other._results[name]  # noqa: SLF001
+                entry = self._results.get(name)
+                if entry is None or entry[0] != fingerprint:
+                    self._results[name] = (fingerprint, dict(results))
+                else:
+                    entry[1].update(results)
+
+    def purge_doc(self, docname: str) -> None:
+        """Unregister given `docname` as a consumer. Results are kept until
+        `prune` is called because they are likely reused once the document is
+        read again.
+
+        """
+
+        self._docnames.pop(docname, None)
+
+    def prune(self) -> None:
+        """Remove results of all models which are not used by any document."""
+
+        used = set().union(*self._docnames.values())
+        for name in self._results.keys() - used:
+            del self._results[name]
+
+    def clear(self) -> None:
+        """Remove all results."""
+
+        self._results.clear()
+        self._docnames.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class TypeHintsCache:
+    """Provides stringified type hints of pydantic models for the entire
+    build. Resolving type hints is expensive for models with forward
+    references and deep inheritance and would otherwise be repeated for every
+    field of the field summary.
+
+    Type hints are stored per model and type alias configuration (see
+    `autodoc_type_aliases`). Only their string representations are kept
+    because resolved type hints may reference the model itself which would
+    prevent it from being garbage collected.
+
+    """
+
+    def __init__(self, result_cache: ModelResultCache | None = None) -> None:
+        self.result_cache = result_cache
+        self._type_hints: weakref.WeakKeyDictionary[
+            type[BaseModel], dict[tuple, dict[str, str]]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self,
+        model: type[BaseModel],
+        type_aliases: dict[str, str] | None = None,
+        docname: str | None = None,
+    ) -> dict[str, str]:
+        """Get stringified type hints of given `model` keyed by attribute name
+        while respecting `type_aliases`. If available, type hints are taken
+        from and stored in the `result_cache` on behalf of `docname`.
+
+        """
+
+        key = tuple(sorted((type_aliases or {}).items()))
+        type_hints = self._type_hints.setdefault(model, {})
+
+        if key not in type_hints:
+            result_key = ('type-hints', key)
+            cached = None
+            if self.result_cache is not None:
+                cached = self.result_cache.get(model, result_key)
+
+            if cached is None:
+                annotations = get_type_hints(model, None, type_aliases)
+                cached = {
+                    name: stringify_annotation(annotation)
+                    for name, annotation in annotations.items()
+                }
+
+            type_hints[key] = cached
+            if self.result_cache is not None:
+                self.result_cache.set(model, result_key, cached, docname=docname)
+
+        return type_hints[key]
+
+    def clear(self) -> None:
+        """Remove all type hints."""
+
+        self._type_hints.clear()
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """Type hints are keyed by model classes which are not pickled along
+        with the build environment. Hence, an empty cache is restored instead.
+
+        """
+
+        return self.__class__, (self.result_cache,)
+
+
+class InspectorRegistry:
+    """Provides exactly one `ModelInspector` per pydantic model for the entire
+    build. Creating a `ModelInspector` is expensive because field-validator
+    mappings, config values and references are collected upon instantiation.
+    Without the registry, this would be repeated for every model, field and
+    validator documenter.
+
+    Models are only weakly referenced to allow short-lived models (e.g. created
+    via `create_model`) to be garbage collected. Additionally, the document
+    names requesting an inspector are tracked to allow purging all inspectors
+    of a document once it is re-read.
+
+    """
+
+    def __init__(self, schema_store: SchemaStore | None = None) -> None:
+        self.schema_store = schema_store
+        self._inspectors: weakref.WeakKeyDictionary[type[BaseModel], ModelInspector] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._docnames: defaultdict[str, weakref.WeakSet[type[BaseModel]]] = (
+            defaultdict(weakref.WeakSet)
+        )
+
+    def get(self, model: type[BaseModel], docname: str | None = None) -> ModelInspector:
+        """Get the `ModelInspector` for given `model`. It is created on first
+        access. Optionally, register `docname` as a consumer of the inspector.
+
+        """
+
+        inspector = self._inspectors.get(model)
+        if inspector is None:
+            inspector = ModelInspector(model, weak=True, schema_store=self.schema_store)
+            self._inspectors[model] = inspector
+
+        if docname is not None:
+            self._docnames[docname].add(model)
+
+        return inspector
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all inspectors which were requested by given `docname`."""
+
+        for model in self._docnames.pop(docname, ()):
+            self._inspectors.pop(model, None)
+
+    def clear(self) -> None:
+        """Remove all inspectors."""
+
+        self._inspectors.clear()
+        self._docnames.clear()
+
+    def __len__(self) -> int:
+        return len(self._inspectors)
+
+    def __contains__(self, model: Any) -> bool:  # noqa: ANN401
+        return model in self._inspectors
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """Inspectors can't be pickled along with the build environment. Hence,
+        an empty registry is restored instead.
+
+        """
+
+        return self.__class__, (self.schema_store,)
+
+
+def get_inspector_registry(env: BuildEnvironment) -> InspectorRegistry:
+    """Get the `InspectorRegistry` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    registry = getattr(env, ENV_INSPECTOR_REGISTRY, None)
+    if registry is None:
+        registry = InspectorRegistry(schema_store=get_schema_store(env))
+        setattr(env, ENV_INSPECTOR_REGISTRY, registry)
+
+    return registry
+
+
+def get_schema_store(env: BuildEnvironment) -> SchemaStore:
+    """Get the `SchemaStore` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    store = getattr(env, ENV_SCHEMA_STORE, None)
+    if store is None:
+        store = SchemaStore()
+        setattr(env, ENV_SCHEMA_STORE, store)
+
+    return store
+
+
+def get_disk_schema_cache(env: BuildEnvironment) -> DiskSchemaCache | None:
+    """Get the `DiskSchemaCache` attached to given sphinx build `env`. It is
+    created on first access. Return None if the cache is not enabled via
+    `autodoc_pydantic_schema_cache`.
+
+    """
+
+    if not env.config.autodoc_pydantic_schema_cache:
+        return None
+
+    cache = getattr(env, ENV_DISK_SCHEMA_CACHE, None)
+    if cache is None:
+        path = Path(env.doctreedir) / DISK_SCHEMA_CACHE_FILENAME
+        max_size = env.config.autodoc_pydantic_schema_cache_max_size * 1024**2
+        cache = DiskSchemaCache(path=path, max_size=max_size)
+        setattr(env, ENV_DISK_SCHEMA_CACHE, cache)
+
+    return cache
+
+
+def reset_disk_schema_cache(env: BuildEnvironment) -> None:
+    """Close the `DiskSchemaCache` attached to given sphinx build `env` and
+    detach it. A new one is created from the current configuration on next
+    access.
+
+    """
+
+    cache = getattr(env, ENV_DISK_SCHEMA_CACHE, None)
+    if cache is not None:
+        cache.close()
+
+    setattr(env, ENV_DISK_SCHEMA_CACHE, None)
+
+
+def get_type_hints_cache(env: BuildEnvironment) -> TypeHintsCache:
+    """Get the `TypeHintsCache` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    cache = getattr(env, ENV_TYPE_HINTS_CACHE, None)
+    if cache is None:
+        cache = TypeHintsCache(result_cache=get_model_result_cache(env))
+        setattr(env, ENV_TYPE_HINTS_CACHE, cache)
+
+    return cache
+
+
+def get_model_result_cache(env: BuildEnvironment) -> ModelResultCache:
+    """Get the `ModelResultCache` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    cache = getattr(env, ENV_MODEL_RESULT_CACHE, None)
+    if cache is None:
+        cache = ModelResultCache()
+        setattr(env, ENV_MODEL_RESULT_CACHE, cache)
+
+    return cache
@@ -0,0 +1,168 @@
+"""This module contains the tracking of pydantic models which are rendered
+per document. It allows sphinx to re-read exactly those documents whose models
+or autodoc_pydantic configuration changed.
+
+"""
+
+from __future__ import annotations
+
+import pydoc
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from sphinx.environment import BuildEnvironment
+
+ENV_MODEL_DEPENDENCIES = 'autodoc_pydantic_model_dependencies'
+
+
+class ModelDependencies:
+    """Records the pydantic models rendered per document along with their
+    fingerprints (see `StaticInspector.get_fingerprint`). Fingerprints cover
+    nested models, too. Hence, documents are re-read once a model changes even
+    if it is defined in another module than the documented one.
+
+    Additionally, all documents using pydantic directives are recorded along
+    with a snapshot of the autodoc_pydantic configuration. Once it changes,
+    only these documents are re-read instead of all documents.
+
+    Contains plain data only which is pickled along with the build
+    environment.
+
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.config = config
+        self._docnames: dict[str, dict[str, str]] = {}
+
+    def add_document(self, docname: str) -> None:
+        """Record given `docname` as a document using pydantic directives."""
+
+        self._docnames.setdefault(docname, {})
+
+    def add_model(self, docname: str, model: type[BaseModel]) -> None:
+        """Record given `model` as being rendered by given `docname`."""
+
+        from sphinxcontrib.autodoc_pydantic.cache import get_model_key
+
+        name, fingerprint = get_model_key(model)
+        self._docnames.setdefault(docname, {})[name] = fingerprint
+
+    def get_models(self, docname: str) -> dict[str, str]:
+        """Get fingerprints of all models rendered by `docname` keyed by the
+        qualified names of the models.
+
+        """
+
+        return dict(self._docnames.get(docname, {}))
+
+    def get_outdated(
+        self,
+        config: dict[str, Any],
+        exclude: Iterable[str] = (),
+    ) -> set[str]:
+        """Get all recorded documents which need to be re-read because the
+        given autodoc_pydantic `config` or any of their models changed. The
+        configuration snapshot is updated accordingly. Documents given via
+        `exclude` are not inspected because they are re-read anyway.
+
+        """
+
+        if config != self.config:
+            self.config = config
+            return set(self._docnames)
+
+        excluded = set(exclude)
+        fingerprints: dict[str, str | None] = {}
+        outdated = set()
+
+        for docname, models in self._docnames.items():
+            if docname in excluded:
+                continue
+
+            for name, fingerprint in models.items():
+                if name not in fingerprints:
+                    fingerprints[name] = self._get_fingerprint(name)
+
+                current = fingerprints[name]
+                if current is not None and current != fingerprint:
+                    outdated.add(docname)
+                    break
+
+        return outdated
+
+    @staticmethod
+    def _get_fingerprint(name: str) -> str | None:
+        """Get current fingerprint of the model with given qualified `name`.
+        An empty fingerprint is returned if the object is not a pydantic model
+        anymore. Return None if the model can't be located at all, e.g. for
+        models created within functions. Then, sphinx' own change detection
+        applies.
+
+        """
+
+        try:
+            obj = pydoc.locate(name)
+        except Exception:  # noqa: BLE001
+            return None
+
+        if obj is None:
+            return None
+
+        from sphinxcontrib.autodoc_pydantic.cache import get_model_key
+        from sphinxcontrib.autodoc_pydantic.inspection import StaticInspector
+
+        if not StaticInspector.is_pydantic_model(obj):
+            return ''
+
+        return get_model_key(obj)[1]
+
+    def merge(self, other: ModelDependencies, docnames: Iterable[str]) -> None:
+        """Merge recorded models of given `docnames` from `other` which was
+        populated in a parallel sphinx read worker.
+
+        """
+
+        for docname in docnames:
+            if docname in other._docnames:  # noqa: SLF001
+                self._docnames[docname] = other._docnames[docname]  # noqa: SLF001
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all recorded models of given `docname`."""
+
+        self._docnames.pop(docname, None)
+
+    def __len__(self) -> int:
+        return len(self._docnames)
+
+    def __contains__(self, docname: Any) -> bool:  # noqa: ANN401
+        return docname in self._docnames
+
+
+def get_content_configuration(env: BuildEnvironment) -> dict[str, Any]:
+    """Get values of all autodoc_pydantic configurations which affect the
+    generated content.
+
+    """
+
+    from sphinxcontrib.autodoc_pydantic.application import APP_CONFIGURATIONS
+
+    return {
+        config.full_name: env.config[config.full_name]
+        for config in APP_CONFIGURATIONS
+        if config.affects_content
+    }
+
+
+def get_model_dependencies(env: BuildEnvironment) -> ModelDependencies:
+    """Get the `ModelDependencies` attached to given sphinx build `env`. It is
+    created on first access with a snapshot of the current configuration.
+
+    """
+
+    dependencies = getattr(env, ENV_MODEL_DEPENDENCIES, None)
+    if dependencies is None:
+        dependencies = ModelDependencies(config=get_content_configuration(env))
+        setattr(env, ENV_MODEL_DEPENDENCIES, dependencies)
+
+    return dependencies
@@ -0,0 +1,346 @@
+"""This module contains the optional rendering of erdantic diagrams in a
+bounded pool of graphviz processes. Diagrams are collected while reading
+documents and rendered in parallel with the remaining build. Rendered images
+replace the graphviz nodes of the diagrams once documents are written.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from docutils import nodes
+from sphinx.util import logging
+from sphinx.util.osutil import relative_uri
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+ENV_DIAGRAM_REGISTRY = 'autodoc_pydantic_diagram_registry'
+ENV_DIAGRAM_RENDERER = 'autodoc_pydantic_diagram_renderer'
+
+TPL_DIAGRAM = (
+    '<div class="graphviz">'
+    '<object data="{uri}" type="image/svg+xml" class="graphviz {css_class}">'
+    '<p class="warning">{alt}</p>'
+    '</object></div>\n'
+)
+
+
+def get_digest(code: str) -> str:
+    """Get the content hash of given DOT `code` ignoring surrounding
+    whitespace.
+
+    """
+
+    return hashlib.sha256(code.strip().encode()).hexdigest()[:32]
+
+
+class DiagramRegistry:
+    """Records DOT sources of diagrams per document keyed by their content
+    hash. Identical diagrams of different models or documents share the same
+    hash and are rendered only once.
+
+    Contains plain data only which is pickled along with the build
+    environment.
+
+    """
+
+    def __init__(self) -> None:
+        self._docnames: dict[str, dict[str, str]] = {}
+
+    def add(self, docname: str, code: str) -> str:
+        """Record given DOT `code` as a diagram of `docname`. Return its
+        content hash.
+
+        """
+
+        digest = get_digest(code)
+        self._docnames.setdefault(docname, {})[digest] = code
+        return digest
+
+    def get(self, docname: str) -> dict[str, str]:
+        """Get DOT sources of all diagrams of `docname` keyed by their
+        content hashes.
+
+        """
+
+        return dict(self._docnames.get(docname, {}))
+
+    @property
+    def diagrams(self) -> dict[str, str]:
+        """Return DOT sources of all diagrams keyed by their content hashes."""
+
+        diagrams: dict[str, str] = {}
+        for codes in self._docnames.values():
+            diagrams.update(codes)
+
+        return diagrams
+
+    def merge(self, other: DiagramRegistry, docnames: Iterable[str]) -> None:
+        """Merge diagrams of given `docnames` from `other` which was populated
+        in a parallel sphinx read worker.
+
+        """
+
+        for docname in docnames:
+            if docname in other._docnames:  # noqa: SLF001
+                self._docnames[docname] = other._docnames[docname]  # noqa: SLF001
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all diagrams of given `docname`."""
+
+        self._docnames.pop(docname, None)
+
+    def __len__(self) -> int:
+        return len(self.diagrams)
+
+    def __contains__(self, docname: Any) -> bool:  # noqa: ANN401
+        return docname in self._docnames
+
+
+class DiagramRenderer:
+    """Renders diagrams as SVG images via graphviz in a thread pool with at
+    most `workers` concurrent graphviz processes. Each graphviz process is
+    killed once it exceeds `timeout` seconds.
+
+    Images are named by the content hash of their DOT source and are written
+    to `imagedir`. Existing images are not rendered again.
+
+    """
+
+    def __init__(
+        self,
+        imagedir: Path,
+        command: list[str],
+        workers: int,
+        timeout: float,
+    ) -> None:
+        self.imagedir = imagedir
+        self.command = command
+        self.workers = workers
+        self.timeout = timeout
+        self._futures: dict[str, Future[None]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @staticmethod
+    def get_filename(digest: str) -> str:
+        """Get the image file name of the diagram with given `digest`."""
+
+        return f'erdantic-{digest}.svg'
+
+    def start(self, diagrams: dict[str, str]) -> int:
+        """Start rendering given `diagrams` which map content hashes to DOT
+        sources in the background. Return the number of diagrams to be
+        rendered.
+
+        """
+
+        pending = {
+            digest: code
+            for digest, code in diagrams.items()
+            if digest not in self._futures
+            and not (self.imagedir / self.get_filename(digest)).exists()
+        }
+        if not pending:
+            return 0
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix='autodoc_pydantic_diagrams',
+            )
+
+        self.imagedir.mkdir(parents=True, exist_ok=True)
+        for digest, code in pending.items():
+            path = self.imagedir / self.get_filename(digest)
+            self._futures[digest] = self._executor.submit(self.render, code, path)
+
+        return len(pending)
+
+    def render(self, code: str, path: Path) -> None:
+        """Render DOT `code` as SVG image to given `path`. This is run within
+        the thread pool.
+
+        """
+
+        tmp_path = path.with_name(f'{path.name}.tmp')
+        try:
+            subprocess.run(
+                [*self.command, '-Tsvg', f'-o{tmp_path}'],  # noqa: S603
+                input=code.encode(),
+                capture_output=True,
+                check=True,
+                timeout=self.timeout,
+            )
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def wait(self, digest: str) -> str | None:
+        """Wait for the diagram with given `digest` to be rendered. Return its
+        image file name or None if rendering failed or timed out.
+
+        """
+
+        future = self._futures.get(digest)
+        if future is not None:
+            try:
+                future.result()
+            except (OSError, subprocess.SubprocessError) as e:
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    'autodoc_pydantic diagram could not be rendered: %s',
+                    e,
+                    location='autodoc_pydantic',
+                )
+                return None
+
+        filename = self.get_filename(digest)
+        if not (self.imagedir / filename).exists():
+            return None
+
+        return filename
+
+    def shutdown(self) -> None:
+        """Stop rendering diagrams which did not start yet."""
+
+        for future in self._futures.values():
+            future.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self._futures.clear()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """The thread pool can't be pickled along with the build environment.
+        Hence, an idle renderer is restored instead.
+
+        """
+
+        return self.__class__, (
+            self.imagedir,
+            self.command,
+            self.workers,
+            self.timeout,
+        )
+
+
+def substitute_diagrams(
+    app: Sphinx,
+    renderer: DiagramRenderer,
+    doctree: nodes.document,
+    docname: str,
+) -> int:
+    """Replace graphviz nodes of all diagrams of `docname` within `doctree`
+    with their rendered images. Diagrams which could not be rendered are
+    replaced with a notice. Return the number of replaced nodes.
+
+    """
+
+    diagrams = get_diagram_registry(app.env).get(docname)
+    if not diagrams:
+        return 0
+
+    from sphinx.ext.graphviz import graphviz
+
+    imgpath = relative_uri(app.builder.get_target_uri(docname), app.builder.imagedir)
+    replaced = 0
+
+    findall = getattr(doctree, 'findall', doctree.traverse)
+    for node in list(findall(graphviz)):
+        digest = get_digest(node['code'])
+        if digest not in diagrams:
+            continue
+
+        filename = renderer.wait(digest)
+        if filename is None:
+            notice = 'Entity Relationship Diagram could not be rendered.'
+            node.replace_self(nodes.paragraph(notice, notice))
+        else:
+            html = TPL_DIAGRAM.format(
+                uri=posixpath.join(imgpath, filename),
+                css_class='autodoc-pydantic-erd',
+                alt='Entity Relationship Diagram',
+            )
+            node.replace_self(nodes.raw('', html, format='html'))
+
+        replaced += 1
+
+    return replaced
+
+
+def get_diagram_registry(env: BuildEnvironment) -> DiagramRegistry:
+    """Get the `DiagramRegistry` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    registry = getattr(env, ENV_DIAGRAM_REGISTRY, None)
+    if registry is None:
+        registry = DiagramRegistry()
+        setattr(env, ENV_DIAGRAM_REGISTRY, registry)
+
+    return registry
+
+
+def create_diagram_renderer(app: Sphinx) -> DiagramRenderer | None:
+    """Create a new `DiagramRenderer` for the current build of given sphinx
+    `app` and attach it to the build environment. Return None if rendering
+    diagrams in a pool is not enabled via `autodoc_pydantic_erdantic_workers`
+    or not supported by the builder. Diagrams are only rendered as SVG images.
+    Hence, the graphviz extension renders diagrams as usual if another
+    `graphviz_output_format` is configured.
+
+    """
+
+    setattr(app.env, ENV_DIAGRAM_RENDERER, None)
+
+    workers = app.config.autodoc_pydantic_erdantic_workers
+    if not workers or app.builder.format != 'html':
+        return None
+
+    output_format = getattr(app.config, 'graphviz_output_format', 'png')
+    if output_format != 'svg':
+        logger = logging.getLogger(__name__)
+        logger.info(
+            'autodoc_pydantic_erdantic_workers requires graphviz_output_format '
+            "'svg', diagrams are rendered by the graphviz extension instead"
+        )
+        return None
+
+    if workers < 0:
+        workers = os.cpu_count() or 1
+
+    command = [getattr(app.config, 'graphviz_dot', 'dot')]
+    command.extend(getattr(app.config, 'graphviz_dot_args', []))
+
+    renderer = DiagramRenderer(
+        imagedir=Path(app.outdir) / app.builder.imagedir,
+        command=command,
+        workers=workers,
+        timeout=app.config.autodoc_pydantic_erdantic_timeout,
+    )
+    setattr(app.env, ENV_DIAGRAM_RENDERER, renderer)
+    return renderer
+
+
+def get_diagram_renderer(env: BuildEnvironment) -> DiagramRenderer | None:
+    """Get the `DiagramRenderer` of the current build attached to given sphinx
+    build `env` if available.
+
+    """
+
+    return getattr(env, ENV_DIAGRAM_RENDERER, None)
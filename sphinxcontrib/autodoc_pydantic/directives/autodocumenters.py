@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable
+import contextlib
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Iterable,
+    Iterator,
+)
 
 import sphinx
-from pydantic import BaseModel
-from pydantic_settings import BaseSettings
 from sphinx.ext.autodoc import (
     AttributeDocumenter,
     ClassDocumenter,
@@ -16,15 +23,6 @@ from sphinx.ext.autodoc import (
 )
 from sphinx.util.docstrings import prepare_docstring
 from sphinx.util.inspect import object_description
-from sphinx.util.typing import OptionSpec, get_type_hints
-
-try:
-    from sphinx.util.typing import stringify_annotation
-except ImportError:
-    # fall back to older name for older versions of Sphinx
-    from sphinx.util.typing import (  # type: ignore[no-redef]
-        stringify as stringify_annotation,
-    )
 
 from sphinxcontrib.autodoc_pydantic.directives.options.composites import AutoDocOptions
 from sphinxcontrib.autodoc_pydantic.directives.options.definition import (
@@ -39,19 +37,27 @@ from sphinxcontrib.autodoc_pydantic.directives.options.enums import (
     OptionsJsonErrorStrategy,
     OptionsSummaryListOrder,
 )
-from sphinxcontrib.autodoc_pydantic.directives.templates import to_collapsable
+from sphinxcontrib.autodoc_pydantic.directives.templates import (
+    iter_collapsable,
+    iter_lines,
+    to_collapsable,
+)
 from sphinxcontrib.autodoc_pydantic.directives.utility import (
     intercept_type_annotations_py_gt_39,
 )
-from sphinxcontrib.autodoc_pydantic.inspection import (
-    ASTERISK_FIELD_NAME,
-    ModelInspector,
-    ValidatorFieldMap,
-)
+from sphinxcontrib.autodoc_pydantic.profiling import get_profiler
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from docutils.statemachine import StringList
     from pydantic import BaseModel
+    from sphinx.util.typing import OptionSpec
+
+    from sphinxcontrib.autodoc_pydantic.inspection import (
+        ModelInspector,
+        ValidatorFieldMap,
+    )
 
 
 class PydanticAutoDoc:
@@ -66,6 +72,9 @@ class PydanticAutoDoc:
         self._inspect: ModelInspector | None = None
         self._options = AutoDocOptions(self._documenter)
         self._model: type[BaseModel] | None = None
+        self._non_inherited_members: frozenset[str] | None = None
+        self._base_class_names: tuple[str, ...] | None = None
+        self._tagorder_index: dict[str, int] | None = None
 
     @property
     def model(self) -> type[BaseModel]:
@@ -84,6 +93,55 @@ class PydanticAutoDoc:
 
         return self._model
 
+    def profile(self, phase: str) -> ContextManager[None]:
+        """Measure the duration of the enclosed block for the documented model
+        if profiling is enabled via `autodoc_pydantic_profile`. For child
+        documenters, the member name is appended to the given `phase`.
+
+        """
+
+        profiler = get_profiler(self._documenter.env)
+        if profiler is None:
+            return contextlib.nullcontext()
+
+        def get_phase() -> str:
+            objpath = self._documenter.objpath
+            if self._is_child and objpath:
+                return f'{phase} {objpath[-1]}'
+            return phase
+
+        return profiler.measure(
+            get_model=self._get_model_path,
+            get_phase=get_phase,
+            docname=self._documenter.env.docname,
+        )
+
+    def add_dependency(self) -> None:
+        """Record the documented model as a dependency of the current document
+        which is re-read once the model changes.
+
+        """
+
+        from sphinxcontrib.autodoc_pydantic.dependencies import (
+            get_model_dependencies,
+        )
+
+        env = self._documenter.env
+        get_model_dependencies(env).add_model(env.docname, self.model)
+
+    def _get_model_path(self) -> str | None:
+        """Get the fully qualified path of the documented model or None if it
+        is not available (yet).
+
+        """
+
+        documenter = self._documenter
+        model = documenter.parent if self._is_child else documenter.object
+        if not isinstance(model, type):
+            return None
+
+        return f'{model.__module__}.{model.__qualname__}'
+
     @property
     def options(self) -> AutoDocOptions:
         """Provides access to :obj:`PydanticDocumenterOptions` to handle
@@ -111,14 +169,19 @@ class PydanticAutoDoc:
         then already correctly provided and the ``ModelInspector`` works as
         expected.
 
+        The ``ModelInspector`` itself is shared between all documenters of a
+        build via the :obj:`InspectorRegistry` of the build environment.
+
         """
 
         if self._inspect:
             return self._inspect
 
-        obj = self._documenter.parent if self._is_child else self._documenter.object
+        from sphinxcontrib.autodoc_pydantic.cache import get_inspector_registry
 
-        self._inspect = ModelInspector(obj)
+        env = self._documenter.env
+        registry = get_inspector_registry(env)
+        self._inspect = registry.get(self.model, docname=env.docname)
         return self._inspect
 
     def get_field_name_or_alias(self, field_name: str) -> str:
@@ -132,16 +195,77 @@ class PydanticAutoDoc:
 
         return field_name
 
-    def get_non_inherited_members(self) -> set[str]:
+    def get_non_inherited_members(self) -> frozenset[str]:
         """Return all member names of autodocumented object which are
-        prefiltered to exclude inherited members.
+        prefiltered to exclude inherited members. They are collected only once
+        per documenter because walking all members is expensive for large
+        models and required by multiple summary sections.
+
+        """
+
+        if self._non_inherited_members is None:
+            object_members = self._documenter.get_object_members(want_all=True)[1]
+            self._non_inherited_members = frozenset(
+                x.__name__  # type: ignore[union-attr]
+                for x in object_members
+            )
+
+        return self._non_inherited_members
+
+    def get_base_class_names(self) -> tuple[str, ...]:
+        """Return class names of the model's MRO which are collected only once
+        per documenter.
+
+        """
+
+        if self._base_class_names is None:
+            self._base_class_names = tuple(x.__name__ for x in self.model.__mro__)
+
+        return self._base_class_names
+
+    def get_tagorder_index(self) -> dict[str, int]:
+        """Return source positions of all members of the model and its base
+        classes keyed by member name as provided by the module analyzer's
+        tagorder. Module level names take precedence over class members while
+        members of base classes are resolved in MRO order. The index is built
+        once per documenter to allow constant time lookups when sorting
+        summaries by source.
 
         """
-        object_members = self._documenter.get_object_members(want_all=True)[1]
-        return {x.__name__ for x in object_members}  # type: ignore[union-attr]
 
-    def get_base_class_names(self) -> list[str]:
-        return [x.__name__ for x in self.model.__mro__]
+        if self._tagorder_index is not None:
+            return self._tagorder_index
+
+        analyzer = self._documenter.analyzer
+        if analyzer is None:
+            self._tagorder_index = {}
+            return self._tagorder_index
+
+        mro_positions: dict[str, int] = {}
+        for position, base in enumerate(self.get_base_class_names()):
+            mro_positions.setdefault(base, position)
+
+        module_members: dict[str, int] = {}
+        class_members: dict[str, tuple[int, int]] = {}
+        for qualname, tagorder in analyzer.tagorder.items():
+            base, _, name = qualname.rpartition('.')
+            if not base:
+                module_members[name] = tagorder
+                continue
+
+            mro_position = mro_positions.get(base)
+            if mro_position is None:
+                continue
+
+            current = class_members.get(name)
+            if current is None or mro_position < current[0]:
+                class_members[name] = (mro_position, tagorder)
+
+        index = {name: tagorder for name, (_, tagorder) in class_members.items()}
+        index.update(module_members)
+
+        self._tagorder_index = index
+        return index
 
     def resolve_inherited_validator_reference(self, ref: str) -> str:
         """Provide correct validator reference in case validator is inherited
@@ -203,23 +327,34 @@ class PydanticModelDocumenter(ClassDocumenter):
         """Filter only pydantic models."""
 
         is_val = super().can_document_member(member, membername, isattr, parent)
-        is_model = ModelInspector.static.is_pydantic_model(member)
-        return is_val and is_model
+        if not is_val:
+            return False
+
+        from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
+        return ModelInspector.static.is_pydantic_model(member)
 
     def __init__(self, *args) -> None:  # noqa: ANN002
         super().__init__(*args)
-        exclude_members = self.options.setdefault('exclude-members', set())
+        self.pydantic = PydanticAutoDoc(self, is_child=False)
+        options = self.pydantic.options.writable()
+        exclude_members = options.setdefault('exclude-members', set())
         exclude_members.add('model_fields')
         exclude_members.add('model_config')
         exclude_members.add('model_computed_fields')
-        self.pydantic = PydanticAutoDoc(self, is_child=False)
+
+    def add_directive_header(self, sig: str) -> None:
+        """Delegate header options."""
+        super().add_directive_header(sig)
+
+        self.pydantic.options.pass_options_to_directive()
 
     def document_members(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
         """Modify member options before starting to document members."""
 
         self.pydantic.options.set_members_all()
         if self.options.get('undoc-members') is False:
-            self.options.pop('undoc-members')
+            self.pydantic.options.writable().pop('undoc-members')
 
         if self.pydantic.options.is_false('show-validator-members', prefix=True):
             self.hide_validator_members()
@@ -277,27 +412,148 @@ class PydanticModelDocumenter(ClassDocumenter):
         if self.doc_as_attr:
             return
 
+        self.pydantic.add_dependency()
+
         if self.pydantic.options.is_true('erdantic-figure', prefix=True):
-            self.add_erdantic_figure()
+            with self.pydantic.profile('erdantic-figure'):
+                self.add_erdantic_figure()
 
         if self.pydantic.options.is_true('show-json', prefix=True):
-            self.add_collapsable_schema()
+            with self.pydantic.profile('json-schema'):
+                self.add_collapsable_schema()
 
         if self.pydantic.options.is_true('show-config-summary', prefix=True):
-            self.add_config_summary()
+            with self.pydantic.profile('config-summary'):
+                self.add_config_summary()
 
         if self.pydantic.options.is_true('show-field-summary', prefix=True):
-            self.add_field_summary()
+            with self.pydantic.profile('field-summary'):
+                self.add_field_summary()
 
         if self.pydantic.options.is_true('show-validator-summary', prefix=True):
-            self.add_validators_summary()
+            with self.pydantic.profile('validator-summary'):
+                self.add_validators_summary()
 
     def add_collapsable_schema(self) -> None:
-        """Adds collapse code block containing JSON schema."""
+        """Adds collapse code block containing JSON schema. If enabled, the
+        rendered schema is retrieved from the disk schema cache. Otherwise,
+        the schema is rendered and streamed line by line into the
+        documenter's content without creating intermediate copies.
+
+        """
+
+        if self._is_schema_file_enabled():
+            self.add_schema_file()
+            return
+
+        from sphinxcontrib.autodoc_pydantic.cache import (
+            DiskSchemaCacheEntry,
+            get_disk_schema_cache,
+        )
+
+        cache = get_disk_schema_cache(self.env)
+        source_name = self.get_sourcename()
 
-        non_serializable = self.pydantic.inspect.fields.non_json_serializable
+        entry = cache.get(self.object) if cache else None
+        if entry is None:
+            non_serializable, schema = self._get_schema()
+            lines: Iterable[str] = self._iter_json_schema_rest(schema)
+            if cache:
+                entry = DiskSchemaCacheEntry(non_serializable, list(lines))
+                cache.set(self.object, entry)
+                lines = entry.lines
+        else:
+            non_serializable, lines = entry
+
+        self._handle_non_serializable_fields(non_serializable)
+
+        for line in lines:
+            self.add_line(line, source_name)
+
+    def _is_schema_file_enabled(self) -> bool:
+        """Check if JSON schemas are written to separate files."""
+
+        return self.env.config.autodoc_pydantic_schema_files
+
+    def add_schema_file(self) -> None:
+        """Adds a builder-neutral asset node referencing the JSON schema which
+        is written to a separate file. HTML builders show a collapsable block
+        which lazily loads the schema once expanded while other builders
+        inline it. Schema files are content-addressed. Hence, identical
+        schemas are written only once. Only the file's name is kept in the
+        model result cache to reuse existing files in subsequent builds.
+
+        """
+
+        import json
+
+        from sphinxcontrib.autodoc_pydantic.assets import (
+            ASSET_DIRECTIVE,
+            get_asset_store,
+        )
+        from sphinxcontrib.autodoc_pydantic.cache import get_model_result_cache
+
+        store = get_asset_store(self.env)
+        docname = self.env.docname
+        result_cache = get_model_result_cache(self.env)
+
+        result = result_cache.get(self.object, 'schema-file')
+        if result is None or not store.reference(docname, result[1]):
+            non_serializable, schema = self._get_schema()
+            self._handle_non_serializable_fields(non_serializable)
+
+            content = json.dumps(schema, default=str, indent=3)
+            name = store.add(
+                docname=docname,
+                directory='schemas',
+                content=content,
+                suffix='.json',
+            )
+            result = (non_serializable, name)
+        else:
+            self._handle_non_serializable_fields(result[0])
+
+        result_cache.set(self.object, 'schema-file', result, docname=docname)
+
+        lines = [
+            f'.. {ASSET_DIRECTIVE}:: {result[1]}',
+            '   :title: Show JSON schema',
+            '   :class: autodoc_pydantic_collapsable_json',
+            '',
+        ]
+
+        source_name = self.get_sourcename()
+        for line in lines:
+            self.add_line(line, source_name)
+
+    def _get_schema(self) -> tuple[list[str], dict]:
+        """Get names of non JSON serializable fields along with the sanitized
+        JSON schema. A schema which was pre-generated in a process pool is
+        preferred if available. Schemas are deliberately not kept in the
+        model result cache to avoid bloating the pickled build environment.
+        Instead, rendered schemas are persisted by the disk schema cache.
+
+        """
+
+        from sphinxcontrib.autodoc_pydantic.pregeneration import (
+            get_pregenerated_schemas,
+        )
+
+        pregenerated = get_pregenerated_schemas(self.env).get(self.object)
+        if pregenerated is not None:
+            return pregenerated.non_serializable, pregenerated.schema
+
+        return (
+            self.pydantic.inspect.fields.non_json_serializable,
+            self.pydantic.inspect.schema.sanitized,
+        )
+
+    def _handle_non_serializable_fields(self, non_serializable: list[str]) -> None:
+        """Warn or raise about non serializable fields according to
+        `show-json-error-strategy`.
+
+        """
 
-        # handle non serializable fields
         strategy = self.pydantic.options.get_value('show-json-error-strategy')
         if non_serializable:
             error_msg = (
@@ -318,12 +574,6 @@ class PydanticModelDocumenter(ClassDocumenter):
                 )
                 raise sphinx.errors.ExtensionError(error_msg)
 
-        schema = self.pydantic.inspect.schema.sanitized
-        schema_rest = self._convert_json_schema_to_rest(schema)
-        source_name = self.get_sourcename()
-        for line in schema_rest:
-            self.add_line(line, source_name)
-
     def add_erdantic_figure(self) -> None:
         """Adds an erdantic entity relation diagram to the doc of an
         pydantic model.
@@ -344,13 +594,16 @@ class PydanticModelDocumenter(ClassDocumenter):
 
         source_name = self.get_sourcename()
         # Graphviz [DOT language](https://graphviz.org/doc/info/lang.html)
-        figure_dot = (
-            erd.to_dot(self.object, graph_attr={'label': ''})
-            .replace('\t', '   ')
-            .split('\n')
-        )
+        code = self._get_erdantic_dot(erd).replace('\t', '   ')
+
+        if self.env.config.autodoc_pydantic_erdantic_workers:
+            from sphinxcontrib.autodoc_pydantic.diagrams import get_diagram_registry
+
+            get_diagram_registry(self.env).add(self.env.docname, code)
+
+        figure_dot = code.split('\n')
         lines_dot = ['   ' + line for line in figure_dot]
-        lines = ['.. graphviz::', '', *lines_dot, '']
+        lines = ['.. graphviz::', '   :class: autodoc-pydantic-erd', '', *lines_dot, '']
 
         if self.pydantic.options.is_true('erdantic-figure-collapsed', prefix=True):
             lines = to_collapsable(
@@ -361,6 +614,26 @@ class PydanticModelDocumenter(ClassDocumenter):
         for line in lines:
             self.add_line(line, source_name)
 
+    def _get_erdantic_dot(self, erd: ModuleType) -> str:
+        """Get the entity relationship diagram in DOT language. It is cached
+        per model fingerprint which covers all reachable models. Hence,
+        erdantic only traverses the model graph again once any reachable model
+        changed.
+
+        """
+
+        from sphinxcontrib.autodoc_pydantic.cache import get_model_result_cache
+
+        result_cache = get_model_result_cache(self.env)
+        key = ('erdantic-dot', erd.__version__)
+
+        dot = result_cache.get(self.object, key)
+        if dot is None:
+            dot = erd.to_dot(self.object, graph_attr={'label': ''})
+
+        result_cache.set(self.object, key, dot, docname=self.env.docname)
+        return dot
+
     def add_config_summary(self) -> None:
         """Adds summary section describing the model configuration."""
 
@@ -414,8 +687,7 @@ class PydanticModelDocumenter(ClassDocumenter):
 
         """
 
-        base_class_validators = self._get_base_model_validators()
-        inherited_validators = self._get_inherited_validators()
+        base_class_validators, inherited_validators = self._get_validator_references()
         references = base_class_validators + inherited_validators
 
         sort_func = self._get_reference_sort_func(references)
@@ -458,54 +730,38 @@ class PydanticModelDocumenter(ClassDocumenter):
 
         self.add_line('', source_name)
 
-    def _get_base_model_validators(self) -> list[ValidatorFieldMap]:
-        """Return the validators on the model being documented"""
+    def _get_validator_references(
+        self,
+    ) -> tuple[list[ValidatorFieldMap], list[ValidatorFieldMap]]:
+        """Partition validator-field mappings into validators of the model
+        being documented and inherited validators to be documented in a single
+        pass. Inherited validators are only returned if inheritance is enabled.
 
-        result = []
+        """
 
         base_model_fields = set(self._get_base_model_fields())
         base_object = self.object_name
-        references = self.pydantic.inspect.references.mappings
+        references = self.pydantic.inspect.references
+
+        show_inherited = self.pydantic.options.exists('inherited-members')
+        squash_set = self.options['inherited-members'] if show_inherited else ()
+
+        base_model_validators = []
+        inherited_validators = []
 
         # The validator is considered part of the base_object if
         # the field that is being validated is on the object being
         # documented, if the method that is doing the validating
         # is on that object (even if that method is validating
         # an inherited field)
-        for ref in references:
-            if ref.field_name in base_model_fields:
-                result.append(ref)
-            else:
-                validator_class = ref.validator_ref.split('.')[-2]
-                if validator_class == base_object:
-                    result.append(ref)
-        return result
-
-    def _get_inherited_validators(self) -> list[ValidatorFieldMap]:
-        """Return the validators on inherited fields to be documented,
-        if any"""
-
-        if not self.pydantic.options.exists('inherited-members'):
-            return []
-
-        squash_set = self.options['inherited-members']
-        references = self.pydantic.inspect.references.mappings
-        base_object = self.object_name
-        already_documented = self._get_base_model_validators()
-
-        result = []
-        for ref in references:
-            if ref in already_documented:
-                continue
-
-            validator_class = ref.validator_ref.split('.')[-2]
-            foreign_validator = validator_class != base_object
-            not_ignored = validator_class not in squash_set
+        for ref in references.mappings:
+            validator_class = references.get_validator_class(ref)
+            if ref.field_name in base_model_fields or validator_class == base_object:
+                base_model_validators.append(ref)
+            elif show_inherited and validator_class not in squash_set:
+                inherited_validators.append(ref)
 
-            if foreign_validator and not_ignored:
-                result.append(ref)
-
-        return result
+        return base_model_validators, inherited_validators
 
     def add_field_summary(self) -> None:
         """Adds summary section describing all fields."""
@@ -549,13 +805,11 @@ class PydanticModelDocumenter(ClassDocumenter):
         if self.analyzer is None:
             return None
 
-        if name in self.analyzer.tagorder:
-            return self.analyzer.tagorder.get(name)
+        tagorder = self.pydantic.get_tagorder_index().get(name)
+        if tagorder is not None:
+            return tagorder
 
-        for base in self.pydantic.get_base_class_names():
-            name_with_class = f'{base}.{name}'
-            if name_with_class in self.analyzer.tagorder:
-                return self.analyzer.tagorder.get(name_with_class)
+        from sphinxcontrib.autodoc_pydantic.inspection import ASTERISK_FIELD_NAME
 
         if name == ASTERISK_FIELD_NAME:
             return -1
@@ -607,22 +861,31 @@ class PydanticModelDocumenter(ClassDocumenter):
 
     def _stringify_type(self, field_name: str) -> str:
         """Get proper string representation of type for given `member_nane`
-        relying on sphinx functionality.
+        relying on sphinx functionality. Type hints are resolved only once per
+        model and type alias configuration for the entire build.
 
         """
 
+        from sphinxcontrib.autodoc_pydantic.cache import get_type_hints_cache
+
         type_aliases = self.config.autodoc_type_aliases
-        annotations = get_type_hints(self.object, None, type_aliases)
-        return stringify_annotation(annotations.get(field_name, ''))
+        type_hints = get_type_hints_cache(self.env).get(
+            self.object, type_aliases, docname=self.env.docname
+        )
+        return type_hints.get(field_name, '')
 
     @staticmethod
-    def _convert_json_schema_to_rest(schema: dict) -> list[str]:
-        """Convert model's schema dict into reST."""
-        schema_str = json.dumps(schema, default=str, indent=3)
-        lines = [f'   {line}' for line in schema_str.split('\n')]
-        lines = ['.. code-block:: json', '', *lines]
-        return to_collapsable(
-            lines,
+    def _iter_json_schema_rest(schema: dict) -> Iterator[str]:
+        """Lazily convert model's schema dict into reST lines. The JSON is
+        encoded incrementally and never held as a complete string.
+
+        """
+        import json
+
+        encoder = json.JSONEncoder(default=str, indent=3)
+        lines = iter_lines(encoder.iterencode(schema), prefix='   ')
+        return iter_collapsable(
+            itertools.chain(['.. code-block:: json', ''], lines),
             'Show JSON schema',
             'autodoc_pydantic_collapsable_json',
         )
@@ -663,7 +926,9 @@ class PydanticSettingsDocumenter(PydanticModelDocumenter):
 
         is_val = super().can_document_member(member, membername, isattr, parent)
         if is_val:
-            return issubclass(member, BaseSettings)
+            from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
+            return ModelInspector.static.is_pydantic_settings(member)
 
         return False
 
@@ -688,6 +953,12 @@ class PydanticFieldDocumenter(AttributeDocumenter):
         super().__init__(*args)
         self.pydantic = PydanticAutoDoc(self, is_child=True)
 
+    def generate(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Optionally measure the time spent to document this field."""
+
+        with self.pydantic.profile('field'):
+            super().generate(*args, **kwargs)
+
     @classmethod
     def can_document_member(
         cls,
@@ -699,14 +970,16 @@ class PydanticFieldDocumenter(AttributeDocumenter):
         """Filter only pydantic fields."""
 
         is_valid = super().can_document_member(member, membername, isattr, parent)
+        if not (is_valid and isattr):
+            return False
 
-        is_field = ModelInspector.static.is_pydantic_field(
+        from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
+        return ModelInspector.static.is_pydantic_field(
             parent=parent.object,
             field_name=membername,
         )
 
-        return is_valid and is_field and isattr
-
     @property
     def pydantic_field_name(self) -> str:
         """Provide the pydantic field name which refers to the member name of
@@ -722,6 +995,7 @@ class PydanticFieldDocumenter(AttributeDocumenter):
 
         self.add_default_value_or_marker()
         self.add_alias()
+        self.pydantic.options.pass_options_to_directive()
 
     @property
     def needs_required_marker(self) -> bool:
@@ -815,6 +1089,8 @@ class PydanticFieldDocumenter(AttributeDocumenter):
     ) -> None:
         """Delegate additional content creation."""
 
+        self.pydantic.add_dependency()
+
         if self.needs_doc_string:
             super().add_content(more_content, **kwargs)
         if self.needs_description:
@@ -926,6 +1202,18 @@ class PydanticValidatorDocumenter(MethodDocumenter):
         super().__init__(*args)
         self.pydantic = PydanticAutoDoc(self, is_child=True)
 
+    def add_directive_header(self, sig: str) -> None:
+        """Delegate header options."""
+        super().add_directive_header(sig)
+
+        self.pydantic.options.pass_options_to_directive()
+
+    def generate(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Optionally measure the time spent to document this validator."""
+
+        with self.pydantic.profile('validator'):
+            super().generate(*args, **kwargs)
+
     @classmethod
     def can_document_member(
         cls,
@@ -937,10 +1225,12 @@ class PydanticValidatorDocumenter(MethodDocumenter):
         """Filter only pydantic validators."""
 
         is_val = super().can_document_member(member, membername, isattr, parent)
-        is_validator = ModelInspector.static.is_validator_by_name(
-            membername, parent.object
-        )
-        return is_val and is_validator
+        if not is_val:
+            return False
+
+        from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
+        return ModelInspector.static.is_validator_by_name(membername, parent.object)
 
     def format_args(self, **kwargs: Any) -> str:  # noqa: ANN401
         """Return empty arguments if validator should be replaced."""
@@ -957,6 +1247,7 @@ class PydanticValidatorDocumenter(MethodDocumenter):
     ) -> None:
         """Optionally show validator content."""
 
+        self.pydantic.add_dependency()
         super().add_content(more_content, **kwargs)
 
         if self.pydantic.options.is_true('validator-list-fields'):
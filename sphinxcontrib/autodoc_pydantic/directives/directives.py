@@ -10,6 +10,7 @@ from docutils.parsers.rst.directives import unchanged
 from sphinx.addnodes import desc_annotation, desc_name, desc_signature, pending_xref
 from sphinx.domains.python import PyAttribute, PyClasslike, PyMethod, py_sig_re
 
+from sphinxcontrib.autodoc_pydantic.dependencies import get_model_dependencies
 from sphinxcontrib.autodoc_pydantic.directives.options.composites import (
     DirectiveOptions,
 )
@@ -21,11 +22,15 @@ from sphinxcontrib.autodoc_pydantic.directives.utility import (
     create_field_href,
     remove_node_by_tagname,
 )
-from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector, ValidatorFieldMap
 
 if TYPE_CHECKING:
     from sphinx.util.typing import OptionSpec
 
+    from sphinxcontrib.autodoc_pydantic.inspection import (
+        ModelInspector,
+        ValidatorFieldMap,
+    )
+
 TUPLE_STR = Tuple[str, str]
 
 
@@ -38,6 +43,16 @@ class PydanticDirectiveMixin:
         super().__init__(*args)
         self.pyautodoc = DirectiveOptions(self)
 
+    def run(self) -> list[Node]:
+        """Record the current document as a consumer of pydantic directives
+        which is re-read once the configuration of autodoc_pydantic changes.
+
+        """
+
+        env = self.env  # type: ignore[attr-defined]
+        get_model_dependencies(env).add_document(env.docname)
+        return super().run()  # type: ignore[misc]
+
     def get_signature_prefix(self, *_) -> list[Node]:  # noqa: ANN002
         """Overwrite original signature prefix with custom pydantic ones."""
 
@@ -236,6 +251,9 @@ class PydanticValidator(PydanticDirectiveMixin, PyMethod):
     def replace_return_node(self, signode: desc_signature) -> None:
         """Replaces the return node with references to validated fields."""
 
+        from sphinxcontrib.autodoc_pydantic.cache import get_inspector_registry
+        from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
         remove_node_by_tagname(signode.children, 'desc_parameterlist')
 
         # replace nodes
@@ -244,7 +262,9 @@ class PydanticValidator(PydanticDirectiveMixin, PyMethod):
 
         # get imports, names and fields of validator
         name = signode['fullname'].split('.')[-1]
-        inspector = ModelInspector.from_child_signode(signode)
+        model = ModelInspector.model_from_child_signode(signode)
+        registry = get_inspector_registry(self.env)
+        inspector = registry.get(model, docname=self.env.docname)
         mappings = inspector.references.filter_by_validator_name(name)
 
         # add field reference nodes
@@ -6,13 +6,116 @@ management of directive options.
 
 from __future__ import annotations
 
-import functools
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from sphinx.ext.autodoc import ALL, Options
 
 from sphinxcontrib.autodoc_pydantic.directives.utility import NONE
 
+if TYPE_CHECKING:
+    from sphinx.config import Config
+    from sphinx.environment import BuildEnvironment
+
+ENV_OPTION_RESOLVER = 'autodoc_pydantic_option_resolver'
+CONFIGURATION_PREFIX = 'autodoc_pydantic_'
+
+
+class OptionResolver:
+    """Build-wide lookup table of app environment configuration values keyed
+    by object type and option name. Resolving the configuration name of an
+    option requires string operations and a scan of all configuration values
+    which is otherwise repeated for every option of every documenter. Since
+    configuration values do not change during a build, each option is resolved
+    only once per object type.
+
+    Object type None is used for options whose configuration name does not
+    depend on the object type (e.g. options of directives).
+
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[tuple[str | None, str], Any] = {}
+        self._prefixed: dict[tuple[str, str], str] = {}
+        self._configuration_names: frozenset[str] | None = None
+
+    def get_configuration_names(self, config: Config) -> frozenset[str]:
+        """Return all configuration names of `autodoc_pydantic` without their
+        common prefix.
+
+        """
+
+        if self._configuration_names is None:
+            self._configuration_names = frozenset(
+                item.name[len(CONFIGURATION_PREFIX) :]
+                for item in config
+                if item.name.startswith(CONFIGURATION_PREFIX)
+            )
+
+        return self._configuration_names
+
+    def get_prefixed_name(self, prefix: str, name: str) -> str:
+        """Return option `name` prefixed with given documenter `prefix`."""
+
+        key = (prefix, name)
+        prefixed = self._prefixed.get(key)
+        if prefixed is None:
+            prefixed = self._prefixed[key] = f'{prefix}-{name}'
+
+        return prefixed
+
+    def get_value(
+        self,
+        config: Config,
+        objtype: str | None,
+        name: str,
+        determine_app_cfg_name: Callable[[str], str],
+    ) -> Any:  # noqa: ANN401
+        """Get the configuration value of option `name` for given `objtype`.
+        On first access, the configuration name is provided by
+        `determine_app_cfg_name`. If it does not exist, NONE is returned.
+
+        """
+
+        key = (objtype, name)
+        try:
+            return self._values[key]
+        except KeyError:
+            config_name = determine_app_cfg_name(name)
+            value = self._values[key] = getattr(config, config_name, NONE)
+            return value
+
+    def clear(self) -> None:
+        """Remove all resolved options."""
+
+        self._values.clear()
+        self._prefixed.clear()
+        self._configuration_names = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """Configuration values may change between builds. Hence, an empty
+        lookup table is restored instead.
+
+        """
+
+        return self.__class__, ()
+
+
+def get_option_resolver(env: BuildEnvironment) -> OptionResolver:
+    """Get the `OptionResolver` attached to given sphinx build `env`. It is
+    created on first access.
+
+    """
+
+    resolver = getattr(env, ENV_OPTION_RESOLVER, None)
+    if resolver is None:
+        resolver = OptionResolver()
+        setattr(env, ENV_OPTION_RESOLVER, resolver)
+
+    return resolver
+
 
 class DirectiveOptions:
     """Composite class providing methods to manage getting and setting
@@ -26,15 +129,37 @@ class DirectiveOptions:
     apply autodoc pydantic's rules (e.g. modifying :members:). Since the
     `option` attribute may be shared between documenter instances (may be a
     bug) in sphinx, an independent copy of the `option` attribute is created
-    for every autodoc pydantic autodocumenter. This relates to #21.
+    before it is modified for the first time via :obj:`writable`. This relates
+    to #21. Documenters which only read options (e.g. most field and validator
+    documenters) do not copy options at all.
+
+    Configuration values are resolved via the build-wide `OptionResolver`.
 
     """
 
+    objtype: str | None = None
+    """Object type used to resolve configuration names. Directive options do
+    not depend on the object type."""
+
     def __init__(self, parent: Any) -> None:  # noqa: ANN401
         self.parent = parent
-        self.parent.options = Options(self.parent.options)
+        self._is_copied = False
+        self.resolver = get_option_resolver(self.parent.env)
         self.add_default_options()
 
+    def writable(self) -> Options:
+        """Return the parent's options to be modified. On first access, they
+        are replaced with an independent copy because they may be shared with
+        other documenter instances.
+
+        """
+
+        if not self._is_copied:
+            self.parent.options = Options(self.parent.options)
+            self._is_copied = True
+
+        return self.parent.options
+
     def add_default_options(self) -> None:
         """Adds all default options."""
 
@@ -81,8 +206,12 @@ class DirectiveOptions:
 
         """
 
-        config_name = self.determine_app_cfg_name(name)
-        return getattr(self.parent.env.config, config_name, NONE)
+        return self.resolver.get_value(
+            self.parent.env.config,
+            self.objtype,
+            name,
+            self.determine_app_cfg_name,
+        )
 
     def get_value(
         self,
@@ -108,7 +237,7 @@ class DirectiveOptions:
         """
 
         if prefix:
-            name = f'{self.parent.pyautodoc_prefix}-{name}'
+            name = self.resolver.get_prefixed_name(self.parent.pyautodoc_prefix, name)
 
         if name in self.parent.options:
             return self.parent.options[name]
@@ -187,7 +316,7 @@ class DirectiveOptions:
         """
 
         if (name not in self.parent.options) and (self.is_available(name)):
-            self.parent.options[name] = self.get_app_cfg_by_name(name)
+            self.writable()[name] = self.get_app_cfg_by_name(name)
 
     def set_members_all(self) -> None:
         """Specifically sets the :members: option to ALL if activated via
@@ -198,9 +327,9 @@ class DirectiveOptions:
 
         option = self.parent.options.get('members', NONE)
         if option is None or option is False:
-            self.parent.options['members'] = []
+            self.writable()['members'] = []
         elif self.get_app_cfg_by_name('members'):
-            self.parent.options['members'] = ALL
+            self.writable()['members'] = ALL
 
 
 class AutoDocOptions(DirectiveOptions):
@@ -210,12 +339,11 @@ class AutoDocOptions(DirectiveOptions):
     """
 
     def __init__(self, *args) -> None:  # noqa: ANN002
-        self._configuration_names: set[str] | None = None
+        self.objtype = args[0].objtype
         super().__init__(*args)
-        self.add_pass_through_to_directive()
 
     @property
-    def configuration_names(self) -> set[str]:
+    def configuration_names(self) -> frozenset[str]:
         """Returns all configuration names that exist for `autodoc_pydantic`.
 
         This is used by :obj:`determine_app_cfg_name` to identify
@@ -225,15 +353,7 @@ class AutoDocOptions(DirectiveOptions):
 
         """
 
-        if not self._configuration_names:
-            prefix = 'autodoc_pydantic_'
-            self._configuration_names = {
-                config.name.replace(prefix, '')
-                for config in self.parent.env.config
-                if config.name.startswith(prefix)
-            }
-
-        return self._configuration_names
+        return self.resolver.get_configuration_names(self.parent.env.config)
 
     def determine_app_cfg_name(self, name: str) -> str:
         """Provide full app environment configuration name for given option
@@ -267,25 +387,16 @@ class AutoDocOptions(DirectiveOptions):
 
         return f'autodoc_pydantic_{sanitized}'
 
-    def add_pass_through_to_directive(self) -> None:
-        """Intercepts documenters `add_directive_header` and adds pass through."""
-
-        func = self.parent.add_directive_header
+    def pass_options_to_directive(self) -> None:
+        """Pass all options of the documenter which are relevant for the
+        generated directive through. This is called by the documenters'
+        `add_directive_header`.
 
-        pass_through = ['__doc_disable_except__']
-        specific = getattr(self.parent, 'pyautodoc_pass_to_directive', [])
-        pass_through.extend(specific)
-
-        @functools.wraps(func)
-        def wrapped(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
-            result = func(*args, **kwargs)
-            for option in pass_through:
-                self.pass_option_to_directive(option)
-
-            return result
+        """
 
-        # see https://github.com/python/mypy/issues/2427
-        self.parent.add_directive_header = wrapped  # type: ignore[method-assign]
+        self.pass_option_to_directive('__doc_disable_except__')
+        for name in getattr(self.parent, 'pyautodoc_pass_to_directive', ()):
+            self.pass_option_to_directive(name)
 
     def pass_option_to_directive(self, name: str) -> None:
         """Pass an autodoc option through to the generated directive."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Iterable, Iterator
+
 TPL_COLLAPSE = """
 .. raw:: html
 
@@ -17,6 +19,18 @@ TPL_COLLAPSE = """
 """
 
 
+TPL_COLLAPSE_HEAD, _, TPL_COLLAPSE_TAIL = TPL_COLLAPSE.partition('{lines}')
+
+TPL_COLLAPSE_LAZY = """
+<p><details  class="{details_class}" data-autodoc-pydantic-src="{src}">
+<summary>{summary}</summary>
+<div class="highlight-{language} notranslate">
+<div class="highlight"><pre></pre></div>
+</div>
+</details></p>
+"""
+
+
 def to_collapsable(lines: list[str], title: str, css_class: str) -> list[str]:
     """Place given lines into a collapsable HTML block.
 
@@ -31,10 +45,93 @@ def to_collapsable(lines: list[str], title: str, css_class: str) -> list[str]:
 
     """
 
-    lines_joined = '\n'.join(lines)
-    lines_formatted = TPL_COLLAPSE.format(
-        lines=lines_joined,
+    return list(iter_collapsable(lines, title, css_class))
+
+
+def to_lazy_collapsable(
+    src: str,
+    title: str,
+    css_class: str,
+    language: str = 'json',
+) -> str:
+    """Create the HTML of a collapsable block whose content is fetched from
+    given `src` once it is expanded for the first time.
+
+    Parameters
+    ----------
+    src: str
+        Path of the content relative to the root of the HTML output.
+    title: str
+        The name of the collapsable block title.
+    css_class: str
+        Name of the css class for the collapsable block.
+    language: str
+        Language used to style the fetched content.
+
+    """
+
+    return TPL_COLLAPSE_LAZY.format(
+        src=src,
         summary=title,
         details_class=css_class,
+        language=language,
     )
-    return lines_formatted.split('\n')
+
+
+def iter_collapsable(
+    lines: Iterable[str],
+    title: str,
+    css_class: str,
+) -> Iterator[str]:
+    """Lazily place given lines into a collapsable HTML block. In contrast to
+    formatting `TPL_COLLAPSE`, content lines are passed through one by one
+    which allows to stream large contents without copying them.
+
+    Parameters
+    ----------
+    lines: iterable
+        The actual content, that should be placed into a collapsable block.
+        Lines must not contain line breaks.
+    title: str
+        The name of the collapsable block title.
+    css_class: str
+        Name of the css class for the collapsable block.
+
+    """
+
+    head = TPL_COLLAPSE_HEAD.format(summary=title, details_class=css_class)
+    yield from head.split('\n')[:-1]
+
+    is_empty = True
+    for line in lines:
+        is_empty = False
+        yield line
+
+    if is_empty:
+        yield ''
+
+    yield from TPL_COLLAPSE_TAIL.split('\n')[1:]
+
+
+def iter_lines(chunks: Iterable[str], prefix: str = '') -> Iterator[str]:
+    """Join given text `chunks` (e.g. as provided by
+    `json.JSONEncoder.iterencode`) into lines which are yielded one by one
+    with given `prefix`. Only the currently incomplete line is kept in memory.
+
+    """
+
+    buffer: list[str] = []
+    for chunk in chunks:
+        if '\n' not in chunk:
+            buffer.append(chunk)
+            continue
+
+        first, *middle, last = chunk.split('\n')
+        buffer.append(first)
+        yield prefix + ''.join(buffer)
+        for line in middle:
+            yield prefix + line
+
+        buffer = [last]
+
+    yield prefix + ''.join(buffer)
@@ -1,5 +1,37 @@
-from sphinx.addnodes import desc_content
-from sphinx.application import Sphinx
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from sphinx.util import logging
+
+from sphinxcontrib.autodoc_pydantic.assets import (
+    ENV_ASSET_STORE,
+    get_asset_store,
+    substitute_assets,
+)
+from sphinxcontrib.autodoc_pydantic.dependencies import (
+    ENV_MODEL_DEPENDENCIES,
+    get_content_configuration,
+    get_model_dependencies,
+)
+from sphinxcontrib.autodoc_pydantic.directives.options.composites import (
+    get_option_resolver,
+)
+from sphinxcontrib.autodoc_pydantic.profiling import get_profiler
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from docutils.nodes import document
+    from sphinx.addnodes import desc_content
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+CACHE_MODULE = 'sphinxcontrib.autodoc_pydantic.cache'
+PREGENERATION_MODULE = 'sphinxcontrib.autodoc_pydantic.pregeneration'
+DIAGRAMS_MODULE = 'sphinxcontrib.autodoc_pydantic.diagrams'
+GRAPHVIZ_MODULE = 'sphinx.ext.graphviz'
 
 OBJTYPES_CSS_FALLBACKS = {
     'pydantic_model': 'class',
@@ -31,3 +63,366 @@ def add_fallback_css_class(
     idx = classes.index(objtype)
     fallback = OBJTYPES_CSS_FALLBACKS[objtype]
     classes.insert(idx, fallback)
+
+
+def get_cache_module() -> ModuleType | None:
+    """Get the `cache` module only if it was imported already. It is imported
+    lazily once the first pydantic object is documented. Before, no build
+    caches can exist which need to be handled.
+
+    """
+
+    return sys.modules.get(CACHE_MODULE)
+
+
+def reset_build_caches(app: Sphinx) -> None:
+    """Used as `builder-inited` sphinx event to start every build with an
+    empty option resolver, inspector registry, schema store, type hints cache,
+    pre-generated schemas and profiler. The disk schema cache is created again
+    from the current configuration.
+
+    """
+
+    get_option_resolver(app.env).clear()
+
+    profiler = get_profiler(app.env)
+    if profiler:
+        profiler.clear()
+
+    pregeneration = sys.modules.get(PREGENERATION_MODULE)
+    if pregeneration is not None:
+        pregeneration.get_pregenerated_schemas(app.env).clear()
+
+    cache = get_cache_module()
+    if cache is None:
+        return
+
+    cache.get_inspector_registry(app.env).clear()
+    cache.get_schema_store(app.env).clear()
+    cache.get_type_hints_cache(app.env).clear()
+    cache.reset_disk_schema_cache(app.env)
+
+
+def get_outdated_docs(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    added: set[str],
+    changed: set[str],
+    removed: set[str],
+) -> set[str]:
+    """Used as `env-get-outdated` sphinx event to re-read all documents whose
+    rendered pydantic models changed. If the configuration of autodoc_pydantic
+    changed, all documents using pydantic directives are re-read instead.
+
+    Environments which were created without tracking dependencies (e.g. by
+    older versions) are re-read entirely once.
+
+    """
+
+    if not hasattr(env, ENV_MODEL_DEPENDENCIES):
+        get_model_dependencies(env)
+        return set(env.found_docs)
+
+    dependencies = get_model_dependencies(env)
+    config = get_content_configuration(env)
+    return dependencies.get_outdated(config, exclude=added | changed | removed)
+
+
+def purge_doc(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    docname: str,
+) -> None:
+    """Used as `env-purge-doc` sphinx event to drop all cached inspectors,
+    model results, timings, dependencies, asset references and diagrams which
+    were recorded by the document to be re-read.
+
+    """
+
+    profiler = get_profiler(env)
+    if profiler is not None:
+        profiler.purge_doc(docname)
+
+    get_model_dependencies(env).purge_doc(docname)
+    get_asset_store(env).purge_doc(docname)
+
+    diagrams = sys.modules.get(DIAGRAMS_MODULE)
+    if diagrams is not None:
+        diagrams.get_diagram_registry(env).purge_doc(docname)
+
+    cache = get_cache_module()
+    if cache is not None:
+        cache.get_inspector_registry(env).purge_doc(docname)
+        cache.get_model_result_cache(env).purge_doc(docname)
+
+
+def merge_build_state(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Used as `env-merge-info` sphinx event to merge model results, timings,
+    dependencies, asset references and diagrams of given `docnames` from the
+    environment of a parallel sphinx read worker. Otherwise, they would be
+    lost once the worker finishes.
+
+    """
+
+    profiler = get_profiler(env)
+    other_profiler = get_profiler(other)
+    if profiler is not None and other_profiler is not None:
+        profiler.merge(other_profiler, docnames)
+
+    other_dependencies = getattr(other, ENV_MODEL_DEPENDENCIES, None)
+    if other_dependencies is not None:
+        get_model_dependencies(env).merge(other_dependencies, docnames)
+
+    other_assets = getattr(other, ENV_ASSET_STORE, None)
+    if other_assets is not None:
+        get_asset_store(env).merge(other_assets, docnames)
+
+    # the diagrams module is imported once results of the worker are unpickled
+    diagrams = sys.modules.get(DIAGRAMS_MODULE)
+    if diagrams is not None:
+        other_diagrams = getattr(other, diagrams.ENV_DIAGRAM_REGISTRY, None)
+        if other_diagrams is not None:
+            diagrams.get_diagram_registry(env).merge(other_diagrams, docnames)
+
+    # the cache module is imported once results of the worker are unpickled
+    cache = get_cache_module()
+    if cache is None:
+        return
+
+    other_results = getattr(other, cache.ENV_MODEL_RESULT_CACHE, None)
+    if other_results is not None:
+        cache.get_model_result_cache(env).merge(other_results, docnames)
+
+
+def prune_model_results(app: Sphinx, env: BuildEnvironment) -> list[str]:  # noqa: ARG001
+    """Used as `env-updated` sphinx event to drop model results of all models
+    which are not documented anymore once all documents were read.
+
+    """
+
+    cache = get_cache_module()
+    if cache is not None:
+        cache.get_model_result_cache(env).prune()
+
+    return []
+
+
+def share_erdantic_diagrams(app: Sphinx, doctree: document) -> None:  # noqa: ARG001
+    """Used as `doctree-read` sphinx event to remove the document name from the
+    options of graphviz nodes of erdantic diagrams. The graphviz extension
+    names images by the hash of the DOT source along with its options. Hence,
+    identical diagrams are rendered only once into a shared image instead of
+    once per document. Erdantic diagrams do not reference any files relative
+    to their document which the document name is otherwise required for.
+
+    """
+
+    graphviz = sys.modules.get(GRAPHVIZ_MODULE)
+    if graphviz is None:
+        return
+
+    findall = getattr(doctree, 'findall', doctree.traverse)
+    for node in findall(graphviz.graphviz):
+        if 'autodoc-pydantic-erd' in node['classes']:
+            node['options'].pop('docname', None)
+
+
+def start_diagram_rendering(app: Sphinx, env: BuildEnvironment) -> list[str]:
+    """Used as `env-updated` sphinx event to start rendering all erdantic
+    diagrams in a pool of graphviz processes once all documents were read if
+    enabled via `autodoc_pydantic_erdantic_workers`. Rendering continues in
+    the background while sphinx proceeds with the build.
+
+    """
+
+    diagrams = sys.modules.get(DIAGRAMS_MODULE)
+    if diagrams is None:
+        return []
+
+    renderer = diagrams.create_diagram_renderer(app)
+    if renderer is None:
+        return []
+
+    started = renderer.start(diagrams.get_diagram_registry(env).diagrams)
+    if started:
+        logger = logging.getLogger(__name__)
+        logger.info(
+            'autodoc_pydantic rendering %d diagrams with %d workers',
+            started,
+            min(renderer.workers, started),
+        )
+
+    return []
+
+
+def substitute_rendered_diagrams(
+    app: Sphinx,
+    doctree: document,
+    docname: str,
+) -> None:
+    """Used as `doctree-resolved` sphinx event to replace graphviz nodes of
+    erdantic diagrams with the images rendered in the background. Only
+    diagrams of the given document are waited for.
+
+    """
+
+    diagrams = sys.modules.get(DIAGRAMS_MODULE)
+    if diagrams is None:
+        return
+
+    renderer = diagrams.get_diagram_renderer(app.env)
+    if renderer is not None:
+        diagrams.substitute_diagrams(app, renderer, doctree, docname)
+
+
+def substitute_asset_nodes(
+    app: Sphinx,
+    doctree: document,
+    docname: str,  # noqa: ARG001
+) -> None:
+    """Used as `doctree-resolved` sphinx event to replace asset nodes (e.g.
+    of JSON schema files) according to the current builder. Doctrees are
+    shared between builders. Hence, this can't be decided while reading.
+
+    """
+
+    substitute_assets(app, doctree)
+
+
+def stop_diagram_rendering(
+    app: Sphinx,
+    exception: Exception | None,  # noqa: ARG001
+) -> None:
+    """Used as `build-finished` sphinx event to stop rendering diagrams which
+    are not required anymore, e.g. if the build failed.
+
+    """
+
+    diagrams = sys.modules.get(DIAGRAMS_MODULE)
+    if diagrams is None:
+        return
+
+    renderer = diagrams.get_diagram_renderer(app.env)
+    if renderer is not None:
+        renderer.shutdown()
+
+
+def pregenerate_schemas(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    docnames: list[str],
+) -> None:
+    """Used as `env-before-read-docs` sphinx event to generate JSON schemas of
+    all models referenced by the documents to be read in a process pool if
+    enabled via `autodoc_pydantic_schema_workers`. Models with a valid entry
+    in the disk schema cache are skipped.
+
+    """
+
+    if not env.config.autodoc_pydantic_schema_workers or not docnames:
+        return
+
+    # imported only if enabled because it requires pydantic and the inspection
+    from sphinxcontrib.autodoc_pydantic import pregeneration
+    from sphinxcontrib.autodoc_pydantic.cache import get_disk_schema_cache
+
+    models = pregeneration.collect_models(env, docnames)
+    disk_cache = get_disk_schema_cache(env)
+    if disk_cache:
+        models = {
+            model: path for model, path in models.items() if model not in disk_cache
+        }
+
+    if not models:
+        return
+
+    logger = logging.getLogger(__name__)
+    workers = pregeneration.get_worker_count(env)
+    schemas = pregeneration.get_pregenerated_schemas(env)
+
+    try:
+        generated = schemas.generate(models, workers)
+    except OSError as e:
+        logger.warning(
+            'autodoc_pydantic JSON schemas could not be pre-generated: %s',
+            e,
+            location='autodoc_pydantic',
+        )
+        return
+
+    logger.info(
+        'autodoc_pydantic pre-generated %d of %d JSON schemas with %d workers',
+        generated,
+        len(models),
+        min(workers, len(models)),
+    )
+
+
+def report_schema_store(app: Sphinx, exception: Exception | None) -> None:
+    """Used as `build-finished` sphinx event to report hit and miss counts of
+    the schema store and the disk schema cache.
+
+    """
+
+    cache = get_cache_module()
+    if exception or cache is None:
+        return
+
+    logger = logging.getLogger(__name__)
+
+    store = cache.get_schema_store(app.env)
+    if store.hits or store.definition_hits or store.misses:
+        logger.info(
+            'autodoc_pydantic schema store: %d hits, %d definition hits, %d misses',
+            store.hits,
+            store.definition_hits,
+            store.misses,
+        )
+
+    disk_cache = cache.get_disk_schema_cache(app.env)
+    if disk_cache and (disk_cache.hits or disk_cache.misses):
+        logger.info(
+            'autodoc_pydantic schema cache: %d hits, %d misses',
+            disk_cache.hits,
+            disk_cache.misses,
+        )
+
+
+def write_profile_report(app: Sphinx, exception: Exception | None) -> None:
+    """Used as `build-finished` sphinx event to write the profiling report
+    into the output directory if enabled via `autodoc_pydantic_profile`.
+
+    """
+
+    profiler = get_profiler(app.env)
+    if exception or not profiler:
+        return
+
+    path = profiler.write_report(app.outdir)
+    logger = logging.getLogger(__name__)
+    logger.info('autodoc_pydantic profile written to %s', path)
+
+
+def copy_assets(app: Sphinx, exception: Exception | None) -> None:
+    """Used as `build-finished` sphinx event to copy assets referenced by any
+    document (e.g. JSON schema files) into the static directory of the HTML
+    output.
+
+    """
+
+    if exception or app.builder.format != 'html':
+        return
+
+    store = getattr(app.env, ENV_ASSET_STORE, None)
+    if not store:
+        return
+
+    copied = store.copy_to(app.outdir)
+    if copied:
+        logger = logging.getLogger(__name__)
+        logger.info('autodoc_pydantic copied %d assets', copied)
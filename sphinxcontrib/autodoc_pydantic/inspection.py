@@ -6,12 +6,18 @@ schema of pydantical models.
 
 from __future__ import annotations
 
+import enum
+import hashlib
 import inspect
 import itertools
 import pydoc
+import re
+import sys
+import typing
 import warnings
+import weakref
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 try:
     from typing import TypeGuard
@@ -19,23 +25,43 @@ except ImportError:
     from typing_extensions import TypeGuard
 
 from pydantic import BaseModel, ConfigDict, PydanticInvalidForJsonSchema, create_model
-from pydantic_settings import BaseSettings
+from pydantic.version import VERSION as PYDANTIC_VERSION
 
 ASTERISK_FIELD_NAME = 'all fields'
 
+REGEX_MEMORY_ADDRESS = re.compile(r' at 0x[0-9a-fA-F]+')
+
+DECORATOR_TYPES = (
+    'validators',
+    'field_validators',
+    'root_validators',
+    'field_serializers',
+    'model_serializers',
+    'model_validators',
+    'computed_fields',
+)
+
 if TYPE_CHECKING:
     from pydantic.fields import FieldInfo
     from sphinx.addnodes import desc_signature
 
+    from sphinxcontrib.autodoc_pydantic.cache import SchemaStore
 
-class ValidatorAdapter(NamedTuple):
+
+class ValidatorAdapter:
     """Provide standardized interface to pydantic's validator objects with
     additional metadata (e.g. root validator) for internal usage in
     autodoc_pydantic.
 
+    Adapters are created for every validator of every inspected model. Hence,
+    they only hold a single slot for the underlying validator function.
+
     """
 
-    func: Callable
+    __slots__ = ('func',)
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
 
     @property
     def name(self) -> str:
@@ -67,12 +93,64 @@ class ValidatorAdapter(NamedTuple):
 
         return f'{self.func.__module__}.{self.func.__qualname__}'
 
+    @property
+    def owner_path(self) -> str:
+        """Return the interned object path of the class or module defining the
+        validators function. It is shared by all validators of the same owner.
+
+        """
+
+        qualname, _, _ = self.func.__qualname__.rpartition('.')
+        if not qualname:
+            return sys.intern(self.func.__module__)
+
+        return sys.intern(f'{self.func.__module__}.{qualname}')
+
+    @property
+    def attribute_name(self) -> str:
+        """Return the interned attribute name of the validators function
+        within its owner.
+
+        """
+
+        return sys.intern(self.func.__qualname__.rpartition('.')[2])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidatorAdapter):
+            return NotImplemented
+
+        return self.func == other.func
+
     def __hash__(self) -> int:
-        return id(f'{self}')
+        """Hash on the underlying validator function consistent with
+        equality. Functions and bound methods are hashed by identity which is
+        cheap and stable for their lifetime.
+
+        """
+
+        return hash(self.func)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(func={self.func!r})'
+
+
+class ValidatorFieldMap:
+    """Contains single mapping of a pydantic validator and field.
+
+    Mappings are created for every combination of validators and fields of
+    every inspected model. To keep them compact, they only reference interned
+    paths of the model and the validator's owner which are shared between
+    mappings while references are formatted on access.
 
+    """
 
-class ValidatorFieldMap(NamedTuple):
-    """Contains single mapping of a pydantic validator and field."""
+    __slots__ = (
+        'field_name',
+        'validator_name',
+        'model_path',
+        'validator_path',
+        'validator_attribute',
+    )
 
     field_name: str
     """Name of the field."""
@@ -80,11 +158,64 @@ class ValidatorFieldMap(NamedTuple):
     validator_name: str
     """Name of the validator."""
 
-    field_ref: str
-    """Reference to field."""
+    model_path: str
+    """Interned path of the model containing the field."""
+
+    validator_path: str
+    """Interned path of the class or module defining the validator."""
 
-    validator_ref: str
-    """Reference to validataor."""
+    validator_attribute: str
+    """Interned attribute name of the validator within its owner."""
+
+    def __init__(
+        self,
+        field_name: str,
+        model_path: str,
+        validator: ValidatorAdapter,
+    ) -> None:
+        self.field_name = field_name
+        self.validator_name = validator.name
+        self.model_path = model_path
+        self.validator_path = validator.owner_path
+        self.validator_attribute = validator.attribute_name
+
+    @property
+    def field_ref(self) -> str:
+        """Reference to field."""
+
+        return f'{self.model_path}.{self.field_name}'
+
+    @property
+    def validator_ref(self) -> str:
+        """Reference to validator."""
+
+        return f'{self.validator_path}.{self.validator_attribute}'
+
+    def _key(self) -> tuple[str, str, str, str, str]:
+        return (
+            self.field_name,
+            self.validator_name,
+            self.model_path,
+            self.validator_path,
+            self.validator_attribute,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidatorFieldMap):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(field_name={self.field_name!r}, '
+            f'validator_name={self.validator_name!r}, '
+            f'field_ref={self.field_ref!r}, '
+            f'validator_ref={self.validator_ref!r})'
+        )
 
 
 class BaseInspectionComposite:
@@ -96,7 +227,12 @@ class BaseInspectionComposite:
 
     def __init__(self, parent: ModelInspector) -> None:
         self._parent: ModelInspector = parent
-        self.model = self._parent.model
+
+    @property
+    def model(self) -> type[BaseModel]:
+        """Return the pydantic model of the parent `ModelInspector`."""
+
+        return self._parent.model
 
 
 class FieldInspector(BaseInspectionComposite):
@@ -104,8 +240,17 @@ class FieldInspector(BaseInspectionComposite):
 
     def __init__(self, parent: ModelInspector) -> None:
         super().__init__(parent)
-        # json schema can reliably be created only at model level
-        self.attribute = self.model.model_fields
+        self._json_serializable: dict[str, bool] = {}
+        self._non_json_serializable: list[str] | None = None
+
+    @property
+    def attribute(self) -> dict[str, FieldInfo]:
+        """Return the pydantic fields of the model. They are not stored on the
+        inspector because field annotations may reference the model itself.
+
+        """
+
+        return self.model.model_fields
 
     @property
     def names(self) -> list[str]:
@@ -187,8 +332,11 @@ class FieldInspector(BaseInspectionComposite):
 
         """
 
-        field = self.get(field_name)
-        return self._is_json_serializable(field)
+        if field_name not in self._json_serializable:
+            field = self.get(field_name)
+            self._json_serializable[field_name] = self._is_json_serializable(field)
+
+        return self._json_serializable[field_name]
 
     @classmethod
     def _is_json_serializable(cls, field: FieldInfo) -> bool:
@@ -198,15 +346,27 @@ class FieldInspector(BaseInspectionComposite):
             warnings.simplefilter('ignore')
             return cls._test_field_serializabiltiy(field)
 
-    @staticmethod
-    def _test_field_serializabiltiy(field: FieldInfo) -> bool:
+    @classmethod
+    def _test_field_serializabiltiy(cls, field: FieldInfo) -> bool:
         """Test JSON serializability for given pydantic `FieldInfo`."""
 
+        return cls._test_fields_serializability({'test_field': field})
+
+    @staticmethod
+    def _test_fields_serializability(fields: dict[str, FieldInfo]) -> bool:
+        """Test JSON serializability for all given pydantic `FieldInfo`s at
+        once.
+
+        """
+
         model_config = ConfigDict(arbitrary_types_allowed=True)
 
         try:
-            field_args = (field.annotation, field.default)
-            model = create_model('_', __config__=model_config, test_field=field_args)
+            field_args: dict[str, Any] = {
+                name: (field.annotation, field.default)
+                for name, field in fields.items()
+            }
+            model = create_model('_', __config__=model_config, **field_args)
             model.model_json_schema()
 
         except Exception:  # noqa: BLE001
@@ -215,11 +375,50 @@ class FieldInspector(BaseInspectionComposite):
         else:
             return True
 
+    def _bisect_non_json_serializable(self, names: list[str]) -> list[str]:
+        """Find non JSON serializable fields among given field `names` by
+        testing them together and bisecting only those groups which fail.
+
+        """
+
+        fields = {name: self.get(name) for name in names}
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            is_serializable = self._test_fields_serializability(fields)
+
+        if is_serializable or len(names) == 1:
+            self._json_serializable.update(dict.fromkeys(names, is_serializable))
+            return [] if is_serializable else names
+
+        middle = len(names) // 2
+        left = self._bisect_non_json_serializable(names[:middle])
+        right = self._bisect_non_json_serializable(names[middle:])
+        return left + right
+
+    def _find_non_json_serializable(self) -> list[str]:
+        """Find non JSON serializable fields. If the schema of the entire model
+        can be generated, all fields are serializable. Only otherwise, fields
+        are probed via bisection.
+
+        """
+
+        if self._parent.schema.is_serializable:
+            self._json_serializable.update(dict.fromkeys(self.names, True))
+            return []
+
+        if not self.names:
+            return []
+
+        return self._bisect_non_json_serializable(self.names)
+
     @property
     def non_json_serializable(self) -> list[str]:
         """Get all fields that can't be safely JSON serialized."""
 
-        return [name for name in self.names if not self.is_json_serializable(name)]
+        if self._non_json_serializable is None:
+            self._non_json_serializable = self._find_non_json_serializable()
+
+        return list(self._non_json_serializable)
 
     def __bool__(self) -> bool:
         """Equals to False if no fields are present."""
@@ -235,14 +434,19 @@ class ValidatorInspector(BaseInspectionComposite):
 
     def __init__(self, parent: ModelInspector) -> None:
         super().__init__(parent)
+        self._values: frozenset[ValidatorAdapter] | None = None
+        self._names: frozenset[str] | None = None
 
     @property
-    def values(self) -> set[ValidatorAdapter]:
-        """Returns set of all available validators."""
+    def values(self) -> frozenset[ValidatorAdapter]:
+        """Returns set of all available validators. It is computed only once."""
 
-        all_validators = self._parent.field_validator_mappings.values()
-        flattened = itertools.chain.from_iterable(all_validators)
-        return set(flattened)
+        if self._values is None:
+            all_validators = self._parent.field_validator_mappings.values()
+            flattened = itertools.chain.from_iterable(all_validators)
+            self._values = frozenset(flattened)
+
+        return self._values
 
     def get_reused_validators_names(self) -> list[str]:
         """Identify all reused validators. This is done implicitly by relying
@@ -257,10 +461,16 @@ class ValidatorInspector(BaseInspectionComposite):
         ]
 
     @property
-    def names(self) -> set[str]:
-        """Return names of all validators of pydantic model."""
+    def names(self) -> frozenset[str]:
+        """Return names of all validators of pydantic model. They are computed
+        only once.
+
+        """
 
-        return {validator.name for validator in self.values}
+        if self._names is None:
+            self._names = frozenset(validator.name for validator in self.values)
+
+        return self._names
 
     def __bool__(self) -> bool:
         """Equals to False if no validators are present."""
@@ -274,6 +484,11 @@ class ConfigInspector(BaseInspectionComposite):
 
     """
 
+    _settings_defaults: dict[str, Any] | None = None
+    _values: weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(self, parent: ModelInspector) -> None:
         super().__init__(parent)
         self.items = self._get_values_per_type()
@@ -288,19 +503,58 @@ class ConfigInspector(BaseInspectionComposite):
         otherwise the `BaseSettings` always show up a lot of irrelevant default
         values. Hence, the default values are removed.
 
+        Values are memoized per model class because settings are diffed
+        against their defaults which is repeated for every documented member.
+
         """
 
-        cfg = self.model.model_config
+        values = self._values.get(self.model)
+        if values is None:
+            cfg = self.model.model_config
 
-        if issubclass(self.model, BaseSettings):
-            default = tuple(BaseSettings.model_config.items())
-            available = tuple(cfg.items())
-            result = [given for given in available if given not in default]
-            values = dict(result)
-        else:
-            values = dict(cfg)
+            if StaticInspector.is_pydantic_settings(self.model):
+                defaults = self.get_settings_defaults()
+                values = {
+                    key: value
+                    for key, value in cfg.items()
+                    if key not in defaults or not self._is_equal(value, defaults[key])
+                }
+            else:
+                values = dict(cfg)
 
-        return values
+            self._values[self.model] = values
+
+        return dict(values)
+
+    @classmethod
+    def get_settings_defaults(cls) -> dict[str, Any]:
+        """Return the default configuration of `BaseSettings`. It is computed
+        only once per process because it never changes.
+
+        """
+
+        if cls._settings_defaults is None:
+            from pydantic_settings import BaseSettings
+
+            cls._settings_defaults = dict(BaseSettings.model_config)
+
+        return cls._settings_defaults
+
+    @staticmethod
+    def _is_equal(value: Any, default: Any) -> bool:  # noqa: ANN401
+        """Compare config `value` with its `default`. Identity is checked first
+        because inherited values are usually the very same objects. Values
+        which can't be compared are considered to be different.
+
+        """
+
+        if value is default:
+            return True
+
+        try:
+            return bool(value == default)
+        except Exception:  # noqa: BLE001
+            return False
 
     @property
     def is_configured(self) -> bool:
@@ -315,18 +569,24 @@ class ReferenceInspector(BaseInspectionComposite):
 
     Importantly, `mappings` provides the set of all `ValidatorFieldMap`
     instances which contain all references between fields and validators.
+    Additionally, mappings are indexed by field and validator names to allow
+    constant time lookups while preserving the order of their creation. Class
+    names of validators are precomputed per validator owner.
 
     """
 
     def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
         super().__init__(*args, **kwargs)
+        self._by_field_name: dict[str, tuple[ValidatorFieldMap, ...]] = {}
+        self._by_validator_name: dict[str, tuple[ValidatorFieldMap, ...]] = {}
+        self._validator_classes: dict[str, str] = {}
         self.mappings = self._create_mappings()
 
     @property
     def model_path(self) -> str:
-        """Retrieve the full path of the model."""
+        """Retrieve the interned full path of the model."""
 
-        return f'{self.model.__module__}.{self.model.__name__}'
+        return sys.intern(f'{self.model.__module__}.{self.model.__name__}')
 
     def create_model_reference(self, name: str) -> str:
         """Create reference for given attribute `name` returning full path
@@ -338,10 +598,13 @@ class ReferenceInspector(BaseInspectionComposite):
 
     def _create_mappings(self) -> set[ValidatorFieldMap]:
         """Generate reference mappings between validators and corresponding
-        fields.
+        fields. Indexes by field and validator names are populated alongside.
 
         """
-        mappings = set()
+        mappings: set[ValidatorFieldMap] = set()
+        by_field_name: dict[str, list[ValidatorFieldMap]] = defaultdict(list)
+        by_validator_name: dict[str, list[ValidatorFieldMap]] = defaultdict(list)
+        model_path = self.model_path
 
         for field, validators in self._parent.field_validator_mappings.items():
             is_aserisk = field == '*'
@@ -350,27 +613,51 @@ class ReferenceInspector(BaseInspectionComposite):
             for validator in validators:
                 mapping = ValidatorFieldMap(
                     field_name=field_name,
-                    field_ref=f'{self.model_path}.{field_name}',
-                    validator_name=validator.name,
-                    validator_ref=validator.object_path,
+                    model_path=model_path,
+                    validator=validator,
                 )
+                if mapping in mappings:
+                    continue
+
                 mappings.add(mapping)
+                by_field_name[field_name].append(mapping)
+                by_validator_name[validator.name].append(mapping)
+
+                validator_path = mapping.validator_path
+                if validator_path not in self._validator_classes:
+                    class_name = validator_path.rpartition('.')[2]
+                    self._validator_classes[validator_path] = class_name
+
+        # tuples do not over-allocate like growing lists
+        self._by_field_name = {k: tuple(v) for k, v in by_field_name.items()}
+        self._by_validator_name = {k: tuple(v) for k, v in by_validator_name.items()}
 
         return mappings
 
+    def get_validator_class(self, mapping: ValidatorFieldMap) -> str:
+        """Return the name of the class defining the validator of given
+        `mapping` which is the last part of its validator path.
+
+        """
+
+        return self._validator_classes[mapping.validator_path]
+
     def filter_by_validator_name(self, name: str) -> list[ValidatorFieldMap]:
         """Return mappings for given validator `name`."""
 
-        return [mapping for mapping in self.mappings if mapping.validator_name == name]
+        return list(self._by_validator_name.get(name, ()))
 
     def filter_by_field_name(self, name: str) -> list[ValidatorFieldMap]:
-        """Return mappings for given field `name`."""
+        """Return mappings for given field `name` including mappings of
+        validators which apply to all fields.
 
-        return [
-            mapping
-            for mapping in self.mappings
-            if mapping.field_name in (name, ASTERISK_FIELD_NAME)
-        ]
+        """
+
+        mappings = self._by_field_name.get(name, ())
+        if name == ASTERISK_FIELD_NAME:
+            return list(mappings)
+
+        return [*mappings, *self._by_field_name.get(ASTERISK_FIELD_NAME, ())]
 
 
 class SchemaInspector(BaseInspectionComposite):
@@ -379,6 +666,56 @@ class SchemaInspector(BaseInspectionComposite):
 
     """
 
+    def __init__(self, parent: ModelInspector) -> None:
+        super().__init__(parent)
+        self._schema: dict | None = None
+        self._error: Exception | None = None
+
+    @property
+    def raw(self) -> dict:
+        """Get model's `schema` as generated by pydantic. It is generated only
+        once. If generation fails, the same exception is raised again upon
+        every access. Its traceback is reset before raising it to avoid
+        extending the traceback and keeping all frames alive.
+
+        """
+
+        if self._schema is None and self._error is None:
+            try:
+                self._schema = self._generate()
+            except Exception as e:  # noqa: BLE001
+                self._error = e.with_traceback(None)
+
+        if self._error is not None:
+            raise self._error.with_traceback(None)
+
+        return self._schema  # type: ignore[return-value]
+
+    def _generate(self) -> dict:
+        """Generate model's `schema` while preferring the build-wide schema
+        store of the parent `ModelInspector` if available.
+
+        """
+
+        store = self._parent.schema_store
+        if store is not None:
+            return store.get(self.model)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return self.model.model_json_schema()
+
+    @property
+    def is_serializable(self) -> bool:
+        """Check if model's `schema` can be generated."""
+
+        try:
+            _ = self.raw
+        except Exception:  # noqa: BLE001
+            return False
+        else:
+            return True
+
     @property
     def sanitized(self) -> dict:
         """Get model's `schema` while handling non serializable fields. Such
@@ -387,9 +724,7 @@ class SchemaInspector(BaseInspectionComposite):
         """
 
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                schema = self.model.model_json_schema()
+            schema = self.raw
 
         except (TypeError, ValueError, PydanticInvalidForJsonSchema):
             new_model = self.create_sanitized_model()
@@ -414,6 +749,10 @@ class SchemaInspector(BaseInspectionComposite):
 class StaticInspector:
     """Namespace under `ModelInspector` for static methods."""
 
+    _validator_names: weakref.WeakKeyDictionary[type[BaseModel], frozenset[str]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     @staticmethod
     def is_pydantic_model(obj: Any) -> TypeGuard[type[BaseModel]]:  # noqa: ANN401
         """Determine if object is a valid pydantic model."""
@@ -423,6 +762,23 @@ class StaticInspector:
         except TypeError:
             return False
 
+    @staticmethod
+    def is_pydantic_settings(obj: Any) -> bool:  # noqa: ANN401
+        """Determine if object is a valid pydantic settings class. Settings
+        can't exist unless `pydantic_settings` was already imported which is
+        why it is never imported here.
+
+        """
+
+        module = sys.modules.get('pydantic_settings')
+        if module is None:
+            return False
+
+        try:
+            return issubclass(obj, module.BaseSettings)
+        except TypeError:
+            return False
+
     @classmethod
     def is_pydantic_field(cls, parent: Any, field_name: str) -> bool:  # noqa: ANN401
         """Determine if given `field` is a pydantic field."""
@@ -440,18 +796,140 @@ class StaticInspector:
         """
 
         if cls.is_pydantic_model(obj):
-            inspector = ModelInspector(obj)
-            return name in inspector.validators.names
+            return name in cls.get_validator_names(obj)
         return False
 
+    @classmethod
+    def get_validator_names(cls, model: type[BaseModel]) -> frozenset[str]:
+        """Return names of all validators of given pydantic `model`. In
+        contrast to `ValidatorInspector.names`, they are read directly from
+        pydantic's decorators and are memoized per model. This is relevant
+        because it is called for every member of every documented class.
+
+        """
+
+        names = cls._validator_names.get(model)
+        if names is None:
+            decorators = model.__pydantic_decorators__
+            field_validators = (
+                x.func for x in decorators.field_validators.values() if x.info.fields
+            )
+            model_validators = (x.func for x in decorators.model_validators.values())
+            validators = itertools.chain(field_validators, model_validators)
+            names = frozenset(func.__name__ for func in validators)
+            cls._validator_names[model] = names
+
+        return names
+
+    @staticmethod
+    def get_nested_models(model: type[BaseModel]) -> list[type[BaseModel]]:
+        """Get given `model` and all pydantic models which are referenced by
+        its field annotations including transitively referenced ones.
+
+        """
+
+        found: list[type[BaseModel]] = []
+        pending: list[Any] = [model]
+        while pending:
+            current = pending.pop()
+            if StaticInspector.is_pydantic_model(current):
+                if current in found:
+                    continue
+                found.append(current)
+                fields = current.model_fields.values()
+                pending.extend(field.annotation for field in fields)
+            else:
+                pending.extend(typing.get_args(current))
+
+        return found
+
+    @staticmethod
+    def _stable_repr(obj: Any) -> str:  # noqa: ANN401
+        """Return representation of `obj` without memory addresses which
+        change between python processes.
+
+        """
+
+        return REGEX_MEMORY_ADDRESS.sub('', repr(obj))
+
+    @classmethod
+    def _iter_fingerprint_parts(cls, model: type[BaseModel]) -> typing.Iterator[str]:
+        """Yield all parts of a single model which are relevant for its
+        fingerprint.
+
+        """
+
+        yield f'{model.__module__}.{model.__qualname__}'
+        yield cls._stable_repr(model.__doc__)
+
+        for name, field in model.model_fields.items():
+            yield f'{name}: {cls._stable_repr(field)}'
+            for annotation in cls._iter_annotation_types(field.annotation):
+                if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+                    members = [(x.name, x.value) for x in annotation]
+                    yield cls._stable_repr(members)
+
+        decorators = model.__pydantic_decorators__
+        for decorator_type in DECORATOR_TYPES:
+            for name, decorator in getattr(decorators, decorator_type, {}).items():
+                func = getattr(decorator.func, '__qualname__', '')
+                yield f'{decorator_type}.{name}.{func}: {decorator.info!r}'
+
+        config = sorted(model.model_config.items())
+        yield cls._stable_repr(config)
+
+    @staticmethod
+    def _iter_annotation_types(annotation: Any) -> typing.Iterator[Any]:  # noqa: ANN401
+        """Yield given `annotation` and all nested type arguments."""
+
+        pending = [annotation]
+        while pending:
+            current = pending.pop()
+            yield current
+            pending.extend(typing.get_args(current))
+
+    @classmethod
+    def get_fingerprint(cls, model: type[BaseModel]) -> str:
+        """Create a fingerprint for given `model` which changes whenever its
+        fields, validators, config or docstring change. Nested models and the
+        pydantic version are taken into account, too.
+
+        """
+
+        digest = hashlib.sha256(PYDANTIC_VERSION.encode())
+        for nested in cls.get_nested_models(model):
+            for part in cls._iter_fingerprint_parts(nested):
+                digest.update(part.encode())
+
+        return digest.hexdigest()
+
 
 class ModelInspector:
     """Provides inspection functionality for pydantic models."""
 
     static = StaticInspector
 
-    def __init__(self, model: type[BaseModel]) -> None:
-        self.model = model
+    def __init__(
+        self,
+        model: type[BaseModel],
+        weak: bool = False,  # noqa: FBT001, FBT002
+        schema_store: SchemaStore | None = None,
+    ) -> None:
+        """Inspect given pydantic `model`. If `weak` is True, only a weak
+        reference to the model is kept which allows long-lived inspectors (e.g.
+        cached ones) to not prevent the model from being garbage collected.
+        Optionally, JSON schemas are retrieved from given `schema_store`.
+
+        """
+
+        self.schema_store = schema_store
+
+        self._model_ref: Callable[[], type[BaseModel] | None]
+        if weak:
+            self._model_ref = weakref.ref(model)
+        else:
+            self._model_ref = lambda: model
+
         self.field_validator_mappings = self.get_field_validator_mapping()
 
         self.config = ConfigInspector(self)
@@ -483,10 +961,21 @@ class ModelInspector:
 
         return mapping
 
+    @property
+    def model(self) -> type[BaseModel]:
+        """Return the inspected pydantic model."""
+
+        model = self._model_ref()
+        if model is None:
+            msg = 'Inspected pydantic model does not exist anymore.'
+            raise ReferenceError(msg)
+
+        return model
+
     @classmethod
-    def from_child_signode(cls, signode: desc_signature) -> ModelInspector:
-        """Create instance from a child `signode` as used within sphinx
-        directives.
+    def model_from_child_signode(cls, signode: desc_signature) -> type[BaseModel]:
+        """Locate the pydantic model from a child `signode` as used within
+        sphinx directives.
 
         """
 
@@ -502,4 +991,13 @@ class ModelInspector:
 
             raise ValueError(err)
 
-        return cls(model)
+        return model
+
+    @classmethod
+    def from_child_signode(cls, signode: desc_signature) -> ModelInspector:
+        """Create instance from a child `signode` as used within sphinx
+        directives.
+
+        """
+
+        return cls(cls.model_from_child_signode(signode))
@@ -0,0 +1,44 @@
+/*
+ * Lazily loads the content of collapsable blocks (e.g. JSON schemas) which
+ * were written to separate files by autodoc_pydantic once they are expanded.
+ */
+document.addEventListener("DOMContentLoaded", () => {
+  const root =
+    document.documentElement.dataset.content_root ??
+    (typeof DOCUMENTATION_OPTIONS !== "undefined"
+      ? DOCUMENTATION_OPTIONS.URL_ROOT
+      : "");
+
+  document
+    .querySelectorAll("details[data-autodoc-pydantic-src]")
+    .forEach((details) => {
+      details.addEventListener("toggle", () => {
+        if (!details.open || details.dataset.autodocPydanticLoaded) {
+          return;
+        }
+
+        const src = root + details.dataset.autodocPydanticSrc;
+        const pre = details.querySelector("pre");
+        details.dataset.autodocPydanticLoaded = "true";
+
+        fetch(src)
+          .then((response) => {
+            if (!response.ok) {
+              throw new Error(response.statusText);
+            }
+            return response.text();
+          })
+          .then((content) => {
+            pre.textContent = content;
+          })
+          .catch(() => {
+            // e.g. browsers may not allow to fetch local files
+            const link = document.createElement("a");
+            link.href = src;
+            link.textContent = src;
+            pre.replaceChildren(link);
+            delete details.dataset.autodocPydanticLoaded;
+          });
+      });
+    });
+});
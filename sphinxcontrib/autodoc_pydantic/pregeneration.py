@@ -0,0 +1,230 @@
+"""This module contains the optional pre-generation of JSON schemas in a
+process pool before sphinx reads any documents. Schema generation is CPU-bound
+and would otherwise run serially within every sphinx read worker.
+
+"""
+
+from __future__ import annotations
+
+import os
+import pydoc
+import re
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple
+
+from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector, StaticInspector
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from sphinx.environment import BuildEnvironment
+
+ENV_PREGENERATED_SCHEMAS = 'autodoc_pydantic_pregenerated_schemas'
+
+MODEL_DIRECTIVES = ('autopydantic_model', 'autopydantic_settings')
+MODULE_DIRECTIVES = ('module', 'currentmodule')
+
+REGEX_DIRECTIVE = re.compile(
+    r'^[ \t]*(?:\.\.[ \t]+|[`:]{3,}\{)(?:py:)?(?P<directive>[\w]+)(?:::|\})'
+    r'[ \t]+(?P<argument>[\w.]+)',
+    re.MULTILINE,
+)
+"""Matches directives with their first argument in reST (e.g.
+`.. autopydantic_model:: target.Model`) and MyST (e.g.
+```{autopydantic_model} target.Model`)."""
+
+
+class PregeneratedSchema(NamedTuple):
+    """Contains the sanitized JSON schema of a pydantic model."""
+
+    non_serializable: list[str]
+    """Names of fields which are not JSON serializable."""
+
+    schema: dict
+    """Sanitized JSON schema as provided by `SchemaInspector.sanitized`."""
+
+
+class PregeneratedSchemas:
+    """Holds JSON schemas of pydantic models which were generated in a process
+    pool before documents are read. Parallel sphinx read workers are forked
+    afterwards and hence inherit all pre-generated schemas.
+
+    Schemas are only used if the fingerprint of the model within the worker
+    process matches the fingerprint of the model documented by sphinx (see
+    `StaticInspector.get_fingerprint`).
+
+    """
+
+    def __init__(self) -> None:
+        self._schemas: weakref.WeakKeyDictionary[
+            type[BaseModel], PregeneratedSchema
+        ] = weakref.WeakKeyDictionary()
+
+    def get(self, model: type[BaseModel]) -> PregeneratedSchema | None:
+        """Get pre-generated schema for given `model` if available."""
+
+        return self._schemas.get(model)
+
+    def generate(self, models: dict[type[BaseModel], str], workers: int) -> int:
+        """Generate schemas of given `models` which map pydantic models to
+        their importable paths using at most `workers` processes. Models whose
+        schemas can't be generated in a worker process are skipped and handled
+        by the autodocumenter as usual. Return the number of generated schemas.
+
+        """
+
+        pending = {model: path for model, path in models.items() if model not in self}
+        if not pending:
+            return 0
+
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=init_worker,
+            initargs=(list(sys.path),),
+        )
+
+        generated = 0
+        with executor:
+            futures = {
+                executor.submit(generate_schema, path): model
+                for model, path in pending.items()
+            }
+            for future in as_completed(futures):
+                model = futures[future]
+                try:
+                    fingerprint, schema = future.result()
+                except Exception:  # noqa: BLE001, S112
+                    continue
+
+                if fingerprint == StaticInspector.get_fingerprint(model):
+                    self._schemas[model] = schema
+                    generated += 1
+
+        return generated
+
+    def clear(self) -> None:
+        """Remove all schemas."""
+
+        self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __contains__(self, model: Any) -> bool:  # noqa: ANN401
+        return model in self._schemas
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """Schemas are keyed by model classes which are not pickled along with
+        the build environment. Hence, an empty container is restored instead.
+
+        """
+
+        return self.__class__, ()
+
+
+def init_worker(path: list[str]) -> None:
+    """Initialize worker process with the module search `path` of the sphinx
+    process which may have been modified by `conf.py`.
+
+    """
+
+    sys.path[:] = path
+
+
+def generate_schema(path: str) -> tuple[str, PregeneratedSchema]:
+    """Import the pydantic model located at `path` and generate its sanitized
+    JSON schema. Return the model's fingerprint along with the schema. This is
+    run within worker processes.
+
+    """
+
+    model = pydoc.locate(path)
+    if not StaticInspector.is_pydantic_model(model):
+        msg = f"'{path}' is not a pydantic model."
+        raise TypeError(msg)
+
+    inspector = ModelInspector(model)
+    schema = PregeneratedSchema(
+        non_serializable=inspector.fields.non_json_serializable,
+        schema=inspector.schema.sanitized,
+    )
+
+    return StaticInspector.get_fingerprint(model), schema
+
+
+def iter_model_paths(source: str) -> Iterator[str]:
+    """Yield candidate paths of all models referenced by `autopydantic_model`
+    and `autopydantic_settings` directives within `source`. Relative paths are
+    prefixed with the module set by preceding `module` or `currentmodule`
+    directives.
+
+    """
+
+    module = None
+    for match in REGEX_DIRECTIVE.finditer(source):
+        directive, argument = match.group('directive', 'argument')
+        if directive in MODULE_DIRECTIVES:
+            module = argument
+        elif directive in MODEL_DIRECTIVES:
+            if module:
+                yield f'{module}.{argument}'
+            yield argument
+
+
+def collect_models(
+    env: BuildEnvironment,
+    docnames: list[str],
+) -> dict[type[BaseModel], str]:
+    """Collect all pydantic models referenced by given `docnames` and return
+    them along with their importable paths. Paths which can't be imported are
+    ignored.
+
+    """
+
+    models: dict[type[BaseModel], str] = {}
+    for docname in docnames:
+        try:
+            source = Path(env.doc2path(docname)).read_text(errors='replace')
+        except OSError:
+            continue
+
+        for path in iter_model_paths(source):
+            try:
+                model = pydoc.locate(path)
+            except Exception:  # noqa: BLE001, S112
+                continue
+
+            if StaticInspector.is_pydantic_model(model):
+                models.setdefault(model, path)
+
+    return models
+
+
+def get_worker_count(env: BuildEnvironment) -> int:
+    """Get the number of worker processes configured via
+    `autodoc_pydantic_schema_workers`. A negative value refers to the number
+    of available CPUs.
+
+    """
+
+    workers = env.config.autodoc_pydantic_schema_workers
+    if workers < 0:
+        return os.cpu_count() or 1
+
+    return workers
+
+
+def get_pregenerated_schemas(env: BuildEnvironment) -> PregeneratedSchemas:
+    """Get the `PregeneratedSchemas` attached to given sphinx build `env`. It
+    is created on first access.
+
+    """
+
+    schemas = getattr(env, ENV_PREGENERATED_SCHEMAS, None)
+    if schemas is None:
+        schemas = PregeneratedSchemas()
+        setattr(env, ENV_PREGENERATED_SCHEMAS, schemas)
+
+    return schemas
@@ -0,0 +1,227 @@
+"""This module contains the opt-in profiler which measures the time spent by
+autodocumenters per pydantic model and documentation phase.
+
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    from sphinx.environment import BuildEnvironment
+
+ENV_PROFILER = 'autodoc_pydantic_profiler'
+PROFILE_REPORT_FILENAME = 'autodoc_pydantic_profile'
+PROFILE_REPORT_TOP_N = 25
+
+
+class ProfileEntry(NamedTuple):
+    """Contains the timing of a single documentation phase of a model."""
+
+    model: str
+    """Fully qualified path of the pydantic model."""
+
+    phase: str
+    """Name of the documentation phase."""
+
+    calls: int
+    """Number of measurements."""
+
+    total: float
+    """Accumulated duration in seconds."""
+
+
+class Profiler:
+    """Accumulates durations of documentation phases per pydantic model, e.g.
+    the generation of the JSON schema or documenting a single field.
+
+    Timings are recorded per document and are plain data which is pickled
+    along with the build environment. This allows merging timings of parallel
+    sphinx read workers for exactly the documents they have read.
+
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, dict[str, dict[str, list[float]]]] = {}
+
+    def record(
+        self,
+        model: str,
+        phase: str,
+        duration: float,
+        docname: str = '',
+    ) -> None:
+        """Add `duration` in seconds for given `model` and `phase` which was
+        measured while reading `docname`.
+
+        """
+
+        models = self.timings.setdefault(docname, {})
+        timing = models.setdefault(model, {}).setdefault(phase, [0, 0.0])
+        timing[0] += 1
+        timing[1] += duration
+
+    @contextmanager
+    def measure(
+        self,
+        get_model: Callable[[], str | None],
+        get_phase: Callable[[], str],
+        docname: str = '',
+    ) -> Iterator[None]:
+        """Measure the duration of the enclosed block. Model and phase are
+        resolved only after the block was executed because autodocumenters
+        import their objects lazily. Nothing is recorded if the model can't
+        be resolved.
+
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            model = get_model()
+            if model is not None:
+                self.record(model, get_phase(), duration, docname)
+
+    def merge(self, other: Profiler, docnames: Iterable[str]) -> None:
+        """Merge timings of given `docnames` recorded by `other` within a
+        parallel sphinx read worker.
+
+        """
+
+        for docname in docnames:
+            if docname in other.timings:
+                self.timings[docname] = other.timings[docname]
+
+    def purge_doc(self, docname: str) -> None:
+        """Remove all timings recorded while reading given `docname`."""
+
+        self.timings.pop(docname, None)
+
+    @property
+    def totals(self) -> dict[str, dict[str, list[float]]]:
+        """Return calls and durations per model and phase accumulated over
+        all documents.
+
+        """
+
+        totals: dict[str, dict[str, list[float]]] = {}
+        for models in self.timings.values():
+            for model, phases in models.items():
+                for phase, (calls, total) in phases.items():
+                    timing = totals.setdefault(model, {}).setdefault(phase, [0, 0.0])
+                    timing[0] += calls
+                    timing[1] += total
+
+        return totals
+
+    @property
+    def entries(self) -> list[ProfileEntry]:
+        """Return all timings sorted by their accumulated duration."""
+
+        entries = [
+            ProfileEntry(model=model, phase=phase, calls=int(calls), total=total)
+            for model, phases in self.totals.items()
+            for phase, (calls, total) in phases.items()
+        ]
+
+        return sorted(entries, key=lambda x: (-x.total, x.model, x.phase))
+
+    def to_dict(self) -> dict:
+        """Create JSON serializable report with models sorted by their
+        accumulated duration.
+
+        """
+
+        timings = self.totals
+        totals = {
+            model: sum(total for _, total in phases.values())
+            for model, phases in timings.items()
+        }
+        models = sorted(totals, key=lambda x: (-totals[x], x))
+
+        return {
+            'total': sum(totals.values()),
+            'models': {
+                model: {
+                    'total': totals[model],
+                    'phases': {
+                        phase: {'calls': int(calls), 'total': total}
+                        for phase, (calls, total) in sorted(
+                            timings[model].items(), key=lambda x: -x[1][1]
+                        )
+                    },
+                }
+                for model in models
+            },
+        }
+
+    def to_table(self, top_n: int = PROFILE_REPORT_TOP_N) -> str:
+        """Create text table containing the `top_n` slowest phases."""
+
+        entries = self.entries[:top_n]
+        rows = [('Total (s)', 'Calls', 'Mean (ms)', 'Model', 'Phase')]
+        rows.extend(
+            (
+                f'{entry.total:.4f}',
+                str(entry.calls),
+                f'{entry.total / entry.calls * 1000:.3f}',
+                entry.model,
+                entry.phase,
+            )
+            for entry in entries
+        )
+
+        widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]))]
+        lines = [
+            '  '.join(col.ljust(width) for col, width in zip(row, widths))
+            for row in rows
+        ]
+        lines.insert(1, '  '.join('-' * width for width in widths))
+
+        return '\n'.join(line.rstrip() for line in lines) + '\n'
+
+    def write_report(self, outdir: str | Path) -> Path:
+        """Write JSON report and text table of the slowest phases into
+        `outdir`. Return the path of the JSON report.
+
+        """
+
+        import json
+
+        path = Path(outdir) / f'{PROFILE_REPORT_FILENAME}.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        path.with_suffix('.txt').write_text(self.to_table())
+
+        return path
+
+    def clear(self) -> None:
+        """Remove all timings."""
+
+        self.timings.clear()
+
+    def __len__(self) -> int:
+        return sum(len(phases) for phases in self.totals.values())
+
+
+def get_profiler(env: BuildEnvironment) -> Profiler | None:
+    """Get the `Profiler` attached to given sphinx build `env`. It is created
+    on first access. Return None if profiling is not enabled via
+    `autodoc_pydantic_profile`.
+
+    """
+
+    if not env.config.autodoc_pydantic_profile:
+        return None
+
+    profiler = getattr(env, ENV_PROFILER, None)
+    if profiler is None:
+        profiler = Profiler()
+        setattr(env, ENV_PROFILER, profiler)
+
+    return profiler
@@ -0,0 +1,211 @@
+"""Generator for synthetic pydantic models and settings used by the benchmark
+suite. Generated models are registered within a dedicated module which makes
+them importable by auto-documenters via their object path.
+
+"""
+
+import sys
+import types
+from dataclasses import dataclass
+from typing import List, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+MODULE_NAME = 'autodoc_pydantic_benchmark_models'
+
+
+class NonSerializable:
+    """Arbitrary type which can't be represented in a JSON schema."""
+
+
+class ArbitraryModel(BaseModel):
+    """Root of all generated models allowing arbitrary types."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ArbitrarySettings(BaseSettings):
+    """Root of all generated settings allowing arbitrary types."""
+
+    model_config = SettingsConfigDict(arbitrary_types_allowed=True)
+
+
+class DeferredModel(BaseModel):
+    """Root of generated models which are only inspected but never validated.
+    Building the core schema is deferred to create many models quickly."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Specification of a synthetic pydantic model."""
+
+    name: str
+    """Name of the generated model."""
+
+    fields: int = 10
+    """Number of fields."""
+
+    validators: int = 0
+    """Number of field validators. Validators are assigned to fields in a
+    round-robin fashion."""
+
+    depth: int = 0
+    """Nesting depth of sub-models referenced via the `nested` field."""
+
+    inheritance: int = 0
+    """Length of the inheritance chain with each base adding a single field."""
+
+    non_serializable: int = 0
+    """Number of additional fields which are not JSON serializable."""
+
+    settings: bool = False
+    """Generate pydantic settings instead of a model."""
+
+    @property
+    def object_path(self) -> str:
+        """Fully qualified path of the generated model."""
+
+        return f'{MODULE_NAME}.{self.name}'
+
+    @property
+    def documenter(self) -> str:
+        """Name of the auto-documenter to be used."""
+
+        return 'pydantic_settings' if self.settings else 'pydantic_model'
+
+
+def get_module() -> types.ModuleType:
+    """Get the module containing all generated models."""
+
+    if MODULE_NAME not in sys.modules:
+        module = types.ModuleType(MODULE_NAME, 'Synthetic benchmark models.')
+        sys.modules[MODULE_NAME] = module
+
+    return sys.modules[MODULE_NAME]
+
+
+def create_validator(name: str, field_name: str) -> classmethod:
+    """Create field validator with given `name` for `field_name`."""
+
+    def validator(cls, v):
+        return v
+
+    validator.__name__ = name
+    validator.__qualname__ = name
+    return field_validator(field_name)(validator)
+
+
+def register(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Make given `model` importable from the benchmark module."""
+
+    setattr(get_module(), model.__name__, model)
+    return model
+
+
+def create_nested_models(spec: ModelSpec) -> Optional[Type[BaseModel]]:
+    """Create chain of nested models with `spec.depth` levels and return the
+    outermost one.
+
+    """
+
+    nested = None
+    for level in range(spec.depth):
+        fields = {'value': (int, Field(level, description=f'Level {level}.'))}
+        if nested is not None:
+            fields['child'] = (Optional[nested], None)
+
+        nested = register(
+            create_model(
+                f'{spec.name}Nested{level}',
+                __module__=MODULE_NAME,
+                **fields,
+            )
+        )
+
+    return nested
+
+
+def create_base(spec: ModelSpec) -> Type[BaseModel]:
+    """Create inheritance chain with `spec.inheritance` levels and return the
+    most derived base.
+
+    """
+
+    base = ArbitrarySettings if spec.settings else ArbitraryModel
+    for level in range(spec.inheritance):
+        base = create_model(
+            f'{spec.name}Base{level}',
+            __base__=base,
+            __module__=MODULE_NAME,
+            **{f'inherited_{level}': (int, level)},
+        )
+        base.__doc__ = f'Base {level}.'
+        register(base)
+
+    return base
+
+
+def create_model_from_spec(spec: ModelSpec) -> Type[BaseModel]:
+    """Create synthetic pydantic model for given `spec`. All models including
+    nested models and bases are importable from `MODULE_NAME`.
+
+    """
+
+    field_names = [f'field_{idx}' for idx in range(spec.fields)]
+    fields = {
+        name: (int, Field(idx, description=f'Field {idx}.', ge=0))
+        for idx, name in enumerate(field_names)
+    }
+
+    for idx in range(spec.non_serializable):
+        fields[f'custom_{idx}'] = (NonSerializable, NonSerializable())
+
+    nested = create_nested_models(spec)
+    if nested is not None:
+        fields['nested'] = (Optional[nested], None)
+
+    validators = {
+        f'check_{idx}': create_validator(
+            f'check_{idx}', field_names[idx % len(field_names)]
+        )
+        for idx in range(spec.validators)
+    }
+
+    model = create_model(
+        spec.name,
+        __base__=create_base(spec),
+        __module__=MODULE_NAME,
+        __validators__=validators,
+        **fields,
+    )
+    model.__doc__ = f'Synthetic model {spec.name}.'
+
+    return register(model)
+
+
+def create_models(count: int, fields: int, validators: int) -> List[Type[BaseModel]]:
+    """Create `count` small models with given number of `fields` and
+    `validators` to be inspected. Models are not registered within the
+    benchmark module.
+
+    """
+
+    models = []
+    for idx in range(count):
+        validator_fields = [f'field_{pos % fields}' for pos in range(validators)]
+        model = create_model(
+            f'Inspected{idx}',
+            __base__=DeferredModel,
+            __module__=MODULE_NAME,
+            __validators__={
+                f'check_{pos}': create_validator(f'check_{pos}', field_name)
+                for pos, field_name in enumerate(validator_fields)
+            },
+            **{f'field_{pos}': (int, pos) for pos in range(fields)},
+        )
+        models.append(model)
+
+    return models
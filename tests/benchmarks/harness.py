@@ -0,0 +1,233 @@
+"""Measurement utilities of the benchmark suite. Benchmarks run the real
+auto-documenter path via `do_autodoc` and record wall time, peak memory, call
+counts of expensive functions and timings per documentation phase.
+
+"""
+
+import inspect
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from pydantic import BaseModel
+from sphinx.application import Sphinx
+from sphinx.ext.autodoc import ClassDocumenter, Options
+
+from sphinxcontrib.autodoc_pydantic import cache
+from sphinxcontrib.autodoc_pydantic.directives.options.composites import (
+    AutoDocOptions,
+    DirectiveOptions,
+)
+from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+from sphinxcontrib.autodoc_pydantic.profiling import get_profiler
+
+from ..conftest import do_autodoc
+from .generator import ModelSpec, create_model_from_spec
+
+COUNTED_CALLS: Dict[str, Tuple[Any, str]] = {
+    'inspectors': (ModelInspector, '__init__'),
+    'json_schemas': (BaseModel, 'model_json_schema'),
+    'member_walks': (ClassDocumenter, 'get_object_members'),
+    'option_copies': (Options, '__init__'),
+    'option_names': (AutoDocOptions, 'determine_app_cfg_name'),
+    'option_values': (DirectiveOptions, 'get_value'),
+    'type_hints': (cache, 'get_type_hints'),
+}
+"""Functions whose calls are counted keyed by their name in the result."""
+
+BENCHMARK_CONF = {
+    'autodoc_pydantic_profile': True,
+    'autodoc_pydantic_model_members': True,
+    'autodoc_pydantic_model_undoc_members': True,
+    'autodoc_pydantic_model_show_json': True,
+    'autodoc_pydantic_model_show_config_summary': True,
+    'autodoc_pydantic_model_show_field_summary': True,
+    'autodoc_pydantic_model_show_validator_summary': True,
+    'autodoc_pydantic_model_show_validator_members': True,
+    'autodoc_pydantic_settings_members': True,
+    'autodoc_pydantic_settings_undoc_members': True,
+    'autodoc_pydantic_settings_show_json': True,
+    'autodoc_pydantic_settings_show_config_summary': True,
+    'autodoc_pydantic_settings_show_field_summary': True,
+    'autodoc_pydantic_settings_show_validator_summary': True,
+    'autodoc_pydantic_settings_show_validator_members': True,
+    'autodoc_pydantic_field_list_validators': True,
+    'autodoc_pydantic_field_show_constraints': True,
+    'autodoc_pydantic_validator_list_fields': True,
+    'autodoc_pydantic_model_show_json_error_strategy': 'coerce',
+    'autodoc_pydantic_settings_show_json_error_strategy': 'coerce',
+}
+"""Sphinx configuration enabling all relevant autodoc_pydantic features."""
+
+
+@contextmanager
+def count_calls(
+    targets: Dict[str, Tuple[Any, str]] = COUNTED_CALLS,
+) -> Iterator[Dict[str, int]]:
+    """Count calls of given `targets` which map result names to owner and
+    attribute name. Class and static methods are supported.
+
+    """
+
+    counter = {name: 0 for name in targets}
+    originals = []
+
+    for name, (owner, attribute) in targets.items():
+        original = inspect.getattr_static(owner, attribute)
+        func = getattr(original, '__func__', original)
+
+        def wrapper(*args, _name=name, _func=func, **kwargs):
+            counter[_name] += 1
+            return _func(*args, **kwargs)
+
+        if isinstance(original, (classmethod, staticmethod)):
+            wrapper = type(original)(wrapper)
+
+        originals.append((owner, attribute, original))
+        setattr(owner, attribute, wrapper)
+
+    try:
+        yield counter
+    finally:
+        for owner, attribute, original in reversed(originals):
+            setattr(owner, attribute, original)
+
+
+def get_phases(app: Sphinx) -> Dict[str, Dict[str, float]]:
+    """Aggregate profiled phases of all models. Phases of field and validator
+    documenters are combined irrespective of their member names.
+
+    """
+
+    phases: Dict[str, Dict[str, float]] = {}
+    for entry in get_profiler(app.env).entries:
+        phase = phases.setdefault(entry.phase.split(' ')[0], {'calls': 0, 'total': 0.0})
+        phase['calls'] += entry.calls
+        phase['total'] += entry.total
+
+    return dict(sorted(phases.items()))
+
+
+def run_benchmark(
+    create_app: Callable[[], Sphinx],
+    spec: ModelSpec,
+) -> Dict[str, Any]:
+    """Document synthetic model given by `spec` and return measurements.
+
+    Wall time and call counts are taken from a first run while peak memory is
+    measured in a second run because `tracemalloc` considerably slows down
+    execution. Each run uses a freshly generated model and sphinx application
+    because sphinx modifies annotations of documented classes in place.
+
+    """
+
+    create_model_from_spec(spec)
+    app = create_app()
+    with count_calls() as calls:
+        start = time.perf_counter()
+        lines = do_autodoc(app, spec.documenter, spec.object_path)
+        wall_time = time.perf_counter() - start
+
+    phases = get_phases(app)
+
+    create_model_from_spec(spec)
+    app = create_app()
+    _, peak_memory = measure_peak_memory(
+        lambda: do_autodoc(app, spec.documenter, spec.object_path)
+    )
+
+    return {
+        'wall_time': wall_time,
+        'peak_memory': peak_memory,
+        'lines': len(lines),
+        'calls': calls,
+        'phases': phases,
+    }
+
+
+def measure_peak_memory(func: Callable[[], Any]) -> Tuple[Any, int]:
+    """Call `func` and return its result along with the peak memory in bytes
+    allocated during the call.
+
+    """
+
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak_memory
+
+
+def create_large_schema(fields: int) -> Dict[str, Any]:
+    """Create JSON schema of a model with given number of `fields` resulting
+    in about 11 lines of rendered JSON per field.
+
+    """
+
+    properties = {
+        f'field_{idx}': {
+            'default': idx,
+            'description': f'Field {idx}.',
+            'examples': [idx, idx + 1],
+            'minimum': 0,
+            'title': f'Field {idx}',
+            'type': 'integer',
+        }
+        for idx in range(fields)
+    }
+
+    return {'properties': properties, 'title': 'Large', 'type': 'object'}
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = 0.25,
+) -> List[str]:
+    """Compare benchmark `results` with `baseline` and return descriptions of
+    all regressions. Wall time and peak memory may exceed the baseline by the
+    relative `threshold`. Call counts must not exceed the baseline at all.
+    Measurements missing in either `results` or `baseline` are ignored.
+
+    """
+
+    regressions = []
+
+    for name in sorted(results.keys() & baseline.keys()):
+        result, base = results[name], baseline[name]
+
+        for metric in ('wall_time', 'peak_memory'):
+            if metric not in result or metric not in base:
+                continue
+
+            limit = base[metric] * (1 + threshold)
+            if result[metric] > limit:
+                regressions.append(
+                    f'{name}: {metric} {result[metric]:.4g} exceeds '
+                    f'{base[metric]:.4g} by more than {threshold:.0%}'
+                )
+
+        for call, count in result.get('calls', {}).items():
+            expected = base.get('calls', {}).get(call)
+            if expected is not None and count > expected:
+                regressions.append(f'{name}: {count} calls of {call} exceed {expected}')
+
+    return regressions
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load benchmark results or baseline from JSON file given by `path`."""
+
+    return json.loads(Path(path).read_text())
+
+
+def dump_results(results: Dict[str, Dict[str, Any]], path: Path) -> None:
+    """Write benchmark `results` as JSON file to `path`."""
+
+    Path(path).write_text(json.dumps(results, indent=2, sort_keys=True))
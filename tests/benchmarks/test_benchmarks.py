@@ -0,0 +1,194 @@
+"""This module contains the benchmark suite which documents synthetic pydantic
+models to catch performance regressions of the inspection and auto-documenter
+code paths.
+
+Benchmarks are deselected by default. Run them via ``pytest -m benchmark``
+or ``tox -e benchmark``.
+
+Call counts are compared against the committed `baseline.json` because they
+are independent of the machine. Wall time and peak memory are only compared
+when a baseline of a previous run is provided via environment variables:
+
+- ``AUTODOC_PYDANTIC_BENCHMARK_RESULTS``: write results as JSON to this path.
+- ``AUTODOC_PYDANTIC_BENCHMARK_BASELINE``: compare with results of this path.
+- ``AUTODOC_PYDANTIC_BENCHMARK_THRESHOLD``: allowed relative slowdown (0.25).
+
+For example, run the benchmarks on two commits as follows:
+
+.. code-block:: bash
+
+   AUTODOC_PYDANTIC_BENCHMARK_RESULTS=base.json pytest -m benchmark
+   git checkout feature
+   AUTODOC_PYDANTIC_BENCHMARK_BASELINE=base.json pytest -m benchmark
+
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from sphinxcontrib.autodoc_pydantic.directives.autodocumenters import (
+    PydanticModelDocumenter,
+)
+from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+
+from ..conftest import do_autodoc
+from .generator import ModelSpec, create_model_from_spec, create_models
+from .harness import (
+    BENCHMARK_CONF,
+    compare,
+    count_calls,
+    create_large_schema,
+    dump_results,
+    load_results,
+    measure_peak_memory,
+    run_benchmark,
+)
+
+BASELINE = Path(__file__).parent / 'baseline.json'
+
+SPECS = [
+    ModelSpec('Fields', fields=200),
+    ModelSpec('Validators', fields=50, validators=100),
+    ModelSpec('Nested', fields=10, depth=10),
+    ModelSpec('Inheritance', fields=10, validators=10, inheritance=10),
+    ModelSpec('NonSerializable', fields=20, non_serializable=10),
+    ModelSpec('Settings', fields=50, validators=10, settings=True),
+]
+
+
+@pytest.fixture(scope='session')
+def benchmark_results():
+    """Collect results of all benchmarks and optionally write them to the
+    path given by `AUTODOC_PYDANTIC_BENCHMARK_RESULTS`.
+
+    """
+
+    results = {}
+    yield results
+
+    path = os.environ.get('AUTODOC_PYDANTIC_BENCHMARK_RESULTS')
+    if path and results:
+        dump_results(results, path)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('spec', SPECS, ids=lambda spec: spec.name)
+def test_benchmark(test_app, benchmark_results, spec):
+    result = run_benchmark(
+        lambda: test_app('base', conf=BENCHMARK_CONF, deactivate_all=True),
+        spec,
+    )
+    benchmark_results[spec.name] = result
+
+    assert result['lines'] > spec.fields
+    assert result['calls']['inspectors'] == 1
+
+    baseline = load_results(BASELINE)
+    assert compare({spec.name: result}, baseline) == []
+
+    path = os.environ.get('AUTODOC_PYDANTIC_BENCHMARK_BASELINE')
+    if path:
+        threshold = float(os.environ.get('AUTODOC_PYDANTIC_BENCHMARK_THRESHOLD', 0.25))
+        regressions = compare({spec.name: result}, load_results(path), threshold)
+        assert regressions == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_schema_rendering(benchmark_results):
+    """Ensure that rendering a JSON schema of about 40k lines streams lines
+    into the documenter's content without holding further copies of the
+    rendered schema in memory.
+
+    """
+
+    schema = create_large_schema(fields=4000)
+
+    def render():
+        content = []
+        for line in PydanticModelDocumenter._iter_json_schema_rest(schema):
+            content.append(line)
+        return content
+
+    content, peak_memory = measure_peak_memory(render)
+    content_size = sys.getsizeof(content) + sum(map(sys.getsizeof, content))
+    benchmark_results['SchemaRendering'] = {
+        'peak_memory': peak_memory,
+        'lines': len(content),
+    }
+
+    assert len(content) > 40_000
+    assert peak_memory < 1.25 * content_size
+
+
+@pytest.mark.benchmark
+def test_benchmark_option_resolution(test_app, benchmark_results):
+    """Ensure that configuration names of options are resolved only once per
+    build instead of once per option access of every documenter.
+
+    """
+
+    spec = ModelSpec('Options', fields=1000)
+    create_model_from_spec(spec)
+    app = test_app('base', conf=BENCHMARK_CONF, deactivate_all=True)
+
+    with count_calls() as calls:
+        start = time.perf_counter()
+        do_autodoc(app, spec.documenter, spec.object_path)
+        wall_time = time.perf_counter() - start
+
+    benchmark_results[spec.name] = {'wall_time': wall_time, 'calls': calls}
+
+    assert calls['option_values'] > 10 * spec.fields
+    assert calls['option_names'] < 100
+
+    baseline = load_results(BASELINE)
+    assert compare({spec.name: {'calls': calls}}, baseline) == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_inspection_memory(benchmark_results):
+    """Report the memory held by inspectors of a project with 10k models. Paths
+    of references are shared between mappings instead of being copied.
+
+    """
+
+    models = create_models(count=10_000, fields=5, validators=3)
+
+    inspectors, peak_memory = measure_peak_memory(
+        lambda: [ModelInspector(model) for model in models]
+    )
+    mappings = [
+        mapping for inspector in inspectors for mapping in inspector.references.mappings
+    ]
+    benchmark_results['InspectionMemory'] = {
+        'peak_memory': peak_memory,
+        'models': len(models),
+        'mappings': len(mappings),
+    }
+
+    assert len(mappings) == 3 * len(models)
+    assert len({id(mapping.validator_path) for mapping in mappings}) == 1
+    for inspector in inspectors:
+        paths = {id(mapping.model_path) for mapping in inspector.references.mappings}
+        assert len(paths) == 1
+
+
+def test_compare():
+    baseline = {
+        'Model': {'wall_time': 1.0, 'peak_memory': 100, 'calls': {'schemas': 2}},
+        'Other': {'wall_time': 1.0},
+    }
+    results = {
+        'Model': {'wall_time': 1.2, 'peak_memory': 200, 'calls': {'schemas': 3}},
+        'New': {'wall_time': 5.0},
+    }
+
+    assert compare(results, baseline, threshold=0.25) == [
+        'Model: peak_memory 200 exceeds 100 by more than 25%',
+        'Model: 3 calls of schemas exceed 2',
+    ]
+    assert compare(results, results) == []
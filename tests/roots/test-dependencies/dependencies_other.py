@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class Other(BaseModel):
+    """Other"""
+
+    field: int = 1
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from dependencies_shared import Address
+
+
+class Person(BaseModel):
+    """Person"""
+
+    address: Address = Address()
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class Address(BaseModel):
+    """Address"""
+
+    street: str = ''
@@ -0,0 +1,14 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+extensions = [
+    'sphinx.ext.autodoc',
+    'sphinx.ext.graphviz',
+    'sphinxcontrib.autodoc_pydantic',
+]
+
+graphviz_dot = sys.executable
+graphviz_dot_args = [os.path.abspath('fake_dot.py')]
+graphviz_output_format = 'svg'
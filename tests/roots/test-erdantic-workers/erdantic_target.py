@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class Child(BaseModel):
+    """Child"""
+
+    field: int = 1
+
+
+class Parent(BaseModel):
+    """Parent"""
+
+    child: Child
+
+
+class SlowModel(BaseModel):
+    """SlowModel"""
+
+    field: int = 1
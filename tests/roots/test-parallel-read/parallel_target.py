@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+
+
+class Model0(BaseModel):
+    """Model0"""
+
+    field: int = Field(0, description='Field')
+
+
+class Model1(BaseModel):
+    """Model1"""
+
+    field: int = Field(1, description='Field')
+
+
+class Model2(BaseModel):
+    """Model2"""
+
+    field: int = Field(2, description='Field')
+
+
+class Model3(BaseModel):
+    """Model3"""
+
+    field: int = Field(3, description='Field')
+
+
+class Model4(BaseModel):
+    """Model4"""
+
+    field: int = Field(4, description='Field')
+
+
+class Model5(BaseModel):
+    """Model5"""
+
+    field: int = Field(5, description='Field')
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+
+class Large(BaseModel):
+    """Large"""
+
+    field_a: int = Field(1, description='Field A.', ge=0)
+    """Field A"""
+
+    field_b: str = Field('b', description='Field B.', max_length=10)
+    """Field B"""
+
+    field_c: float = Field(1.0, description='Field C.', le=100)
+    """Field C"""
+
+
+class Small(BaseModel):
+    """Small"""
+
+    field: int = 1
+    """Field"""
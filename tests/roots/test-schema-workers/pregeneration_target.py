@@ -0,0 +1,32 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class Custom:
+    pass
+
+
+class Nested(BaseModel):
+    """Nested"""
+
+    field: int = 1
+    """Field"""
+
+
+class Serializable(BaseModel):
+    """Serializable"""
+
+    nested: Nested
+    """Field"""
+
+
+class NonSerializable(BaseModel):
+    """NonSerializable"""
+
+    custom: Custom
+    """Field"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class NoModel:
+    """NoModel"""
@@ -0,0 +1,155 @@
+"""This module contains tests regarding the `assets` module."""
+
+import json
+import pickle
+import sys
+
+import pytest
+
+from sphinxcontrib.autodoc_pydantic.assets import AssetStore, get_asset_store
+from sphinxcontrib.autodoc_pydantic.cache import (
+    get_model_result_cache,
+    get_schema_store,
+)
+
+CONF = {
+    'autodoc_pydantic_schema_files': True,
+    'autodoc_pydantic_model_show_json': True,
+}
+
+
+def test_asset_store(tmp_path):
+    store = AssetStore(path=tmp_path / 'assets')
+
+    name = store.add('doc', 'schemas', '{"a": 1}', '.json')
+    assert name.startswith('schemas/')
+    assert name.endswith('.json')
+
+    assert store.add('other', 'schemas', '{"a": 1}', '.json') == name
+    assert store.add('other', 'schemas', '{"b": 2}', '.json') != name
+    assert len(list((tmp_path / 'assets' / 'schemas').iterdir())) == 2
+    assert len(store) == 2
+
+    assert store.reference('third', name)
+    assert not store.reference('third', 'schemas/missing.json')
+    assert store.read(name) == '{"a": 1}'
+    assert store.read('schemas/missing.json') is None
+
+    restored = pickle.loads(pickle.dumps(store))
+    assert restored.names == store.names
+
+    outdir = tmp_path / 'html'
+    assert store.copy_to(outdir) == 2
+    assert store.copy_to(outdir) == 0
+    assert (outdir / '_static' / name).read_text() == '{"a": 1}'
+
+
+def test_asset_store_merge_and_purge(tmp_path):
+    store = AssetStore(path=tmp_path)
+    name = store.add('main', 'schemas', 'main', '.json')
+
+    worker = pickle.loads(pickle.dumps(store))
+    worker_name = worker.add('read', 'schemas', 'read', '.json')
+    worker.add('ignored', 'schemas', 'ignored', '.json')
+
+    store.merge(worker, {'read', 'missing'})
+    assert store.names == {name, worker_name}
+
+    store.purge_doc('main')
+    assert name not in store
+    assert worker_name in store
+
+
+@pytest.fixture
+def schema_files_app(test_app):
+    """Build the `schema-files` test root with given configuration."""
+
+    def build(conf):
+        sys.modules.pop('schema_files_target', None)
+        app = test_app('schema-files', conf=conf)
+        app.build()
+        return app
+
+    yield build
+
+    sys.modules.pop('schema_files_target', None)
+
+
+def test_schema_files(schema_files_app):
+    app = schema_files_app(CONF)
+
+    static = app.outdir / '_static'
+    schemas = sorted((static / 'schemas').iterdir())
+    titles = {json.loads(path.read_text())['title'] for path in schemas}
+
+    # model `Large` is documented twice but its schema is written only once
+    assert len(schemas) == 2
+    assert titles == {'Large', 'Small'}
+    assert (static / 'autodoc_pydantic.js').exists()
+
+    for docname in ('index', 'other'):
+        html = (app.outdir / f'{docname}.html').read_text()
+        assert 'data-autodoc-pydantic-src="_static/schemas/' in html
+        assert 'autodoc_pydantic.js' in html
+        assert '&quot;title&quot;' not in html
+
+    store = get_asset_store(app.env)
+    assert store.names == {f'schemas/{path.name}' for path in schemas}
+
+
+def test_schema_files_shrink_doctrees(schema_files_app):
+    app = schema_files_app(CONF)
+    size = (app.doctreedir / 'index.doctree').stat().st_size
+
+    inline = schema_files_app({**CONF, 'autodoc_pydantic_schema_files': False})
+    size_inline = (inline.doctreedir / 'index.doctree').stat().st_size
+
+    assert size < size_inline
+    assert not (inline.outdir / '_static' / 'autodoc_pydantic.js').exists()
+
+
+def test_schema_files_shared_doctrees(schema_files_app, make_app):
+    """Ensure that doctrees of HTML builders can be reused by other builders
+    which inline the JSON schema from its file.
+
+    """
+
+    app = schema_files_app(CONF)
+    doctree = app.doctreedir / 'index.doctree'
+    mtime = doctree.stat().st_mtime_ns
+
+    text = make_app('text', srcdir=app.srcdir, confoverrides=CONF)
+    text.build()
+
+    assert doctree.stat().st_mtime_ns == mtime
+    content = (text.outdir / 'index.txt').read_text()
+    assert '"title": "Large"' in content
+    assert 'autodoc_pydantic_collapsable_json' not in content
+
+
+def test_schema_files_model_result_cache(schema_files_app, make_app):
+    """Ensure that only names of schema files are kept in the model result
+    cache and that existing schema files are reused by subsequent builds.
+
+    """
+
+    app = schema_files_app(CONF)
+    results = get_model_result_cache(app.env)
+    store = get_asset_store(app.env)
+
+    for _, values in results._results.values():
+        non_serializable, name = values['schema-file']
+        assert non_serializable == []
+        assert name in store
+
+    (app.srcdir / 'other.rst').write_text(
+        (app.srcdir / 'other.rst').read_text() + '\nChanged.\n'
+    )
+    incremental = make_app('html', srcdir=app.srcdir, confoverrides=CONF)
+    store_incremental = get_schema_store(incremental.env)
+    incremental.build()
+
+    assert store_incremental.misses == 0
+    html = (incremental.outdir / 'other.html').read_text()
+    assert get_asset_store(incremental.env).names == store.names
+    assert 'data-autodoc-pydantic-src="_static/schemas/' in html
@@ -0,0 +1,611 @@
+"""This module contains tests regarding the `cache` module."""
+
+import gc
+import pickle
+import sqlite3
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from sphinxcontrib.autodoc_pydantic import cache as cache_module
+from sphinxcontrib.autodoc_pydantic.cache import (
+    DiskSchemaCache,
+    DiskSchemaCacheEntry,
+    InspectorRegistry,
+    ModelResultCache,
+    SchemaStore,
+    TypeHintsCache,
+    get_disk_schema_cache,
+    get_inspector_registry,
+    get_model_result_cache,
+    get_schema_store,
+    get_type_hints_cache,
+)
+from sphinxcontrib.autodoc_pydantic.events import (
+    report_schema_store,
+    reset_build_caches,
+)
+from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector
+from sphinxcontrib.autodoc_pydantic.profiling import get_profiler
+
+from .conftest import do_autodoc
+
+
+class RegistryModel(BaseModel):
+    field: int = 1
+
+
+class Geo(BaseModel):
+    lat: float
+    lon: float
+
+
+class Address(BaseModel):
+    """Address of a person."""
+
+    street: str
+    geo: Optional[Geo] = None
+
+
+class Person(BaseModel):
+    home: Address
+    addresses: List[Address] = []
+
+
+class Tree(BaseModel):
+    children: List['Tree'] = []
+
+
+class Forest(BaseModel):
+    trees: List[Tree]
+
+
+@pytest.fixture(scope='function')
+def count_inspectors(monkeypatch):
+    """Count the number of `ModelInspector` instantiations per model."""
+
+    counter = {}
+    init = ModelInspector.__init__
+
+    def counting_init(self, model, *args, **kwargs):
+        counter[model.__name__] = counter.get(model.__name__, 0) + 1
+        init(self, model, *args, **kwargs)
+
+    monkeypatch.setattr(ModelInspector, '__init__', counting_init)
+    return counter
+
+
+def test_inspector_registry_returns_identical_inspector():
+    registry = InspectorRegistry()
+
+    inspector = registry.get(RegistryModel)
+
+    assert registry.get(RegistryModel) is inspector
+    assert inspector.model is RegistryModel
+    assert RegistryModel in registry
+    assert len(registry) == 1
+
+
+def test_inspector_registry_holds_weak_references():
+    registry = InspectorRegistry()
+    model = create_model('ShortLived', field=(int, 1))
+
+    inspector = registry.get(model, docname='index')
+    assert inspector.fields.names == ['field']
+
+    del model
+    gc.collect()
+
+    assert len(registry) == 0
+    with pytest.raises(ReferenceError):
+        _ = inspector.model
+
+
+def test_inspector_registry_purge_doc():
+    registry = InspectorRegistry()
+    other = create_model('Other', field=(int, 1))
+
+    registry.get(RegistryModel, docname='first')
+    registry.get(other, docname='second')
+
+    registry.purge_doc('first')
+    assert RegistryModel not in registry
+    assert other in registry
+
+    registry.purge_doc('not-existing')
+    assert len(registry) == 1
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_inspector_registry_pickles_empty():
+    registry = InspectorRegistry()
+    registry.get(RegistryModel)
+
+    restored = pickle.loads(pickle.dumps(registry))
+
+    assert isinstance(restored, InspectorRegistry)
+    assert len(restored) == 0
+
+
+def test_inspector_registry_single_inspector_per_model(autodocument, count_inspectors):
+    """Ensure that model, field and validator documenters share a single
+    `ModelInspector` instance.
+
+    """
+
+    result = autodocument(
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelShowValidatorsSummary',
+        options_app={
+            'autodoc_pydantic_model_members': True,
+            'autodoc_pydantic_model_undoc_members': True,
+            'autodoc_pydantic_model_show_validator_members': True,
+            'autodoc_pydantic_model_show_validator_summary': True,
+            'autodoc_pydantic_model_show_field_summary': True,
+            'autodoc_pydantic_field_list_validators': True,
+            'autodoc_pydantic_validator_list_fields': True,
+        },
+        deactivate_all=True,
+    )
+
+    assert '   .. py:pydantic_field:: ModelShowValidatorsSummary.field' in result
+    assert '   .. py:pydantic_validator:: ModelShowValidatorsSummary.check' in result
+    assert count_inspectors == {'ModelShowValidatorsSummary': 1}
+
+
+def test_schema_store_hits_and_misses():
+    store = SchemaStore()
+
+    schema = store.get(RegistryModel)
+    assert store.get(RegistryModel) is schema
+    assert schema == RegistryModel.model_json_schema()
+
+    store.get(RegistryModel, by_alias=False)
+    assert (store.hits, store.definition_hits, store.misses) == (1, 0, 2)
+
+    store.clear()
+    assert (store.hits, store.definition_hits, store.misses) == (0, 0, 0)
+
+
+@pytest.mark.parametrize('nested', [Address, Geo])
+def test_schema_store_reuses_definitions(nested):
+    """Ensure that the schema of nested models are assembled from definitions
+    of the parent's schema while being identical to pydantic's schema.
+
+    """
+
+    store = SchemaStore()
+    store.get(Person)
+
+    schema = store.get(nested)
+
+    assert store.definition_hits == 1
+    assert store.misses == 1
+    assert list(schema) == list(nested.model_json_schema())
+    assert schema == nested.model_json_schema()
+
+
+def test_schema_store_ignores_recursive_definitions():
+    store = SchemaStore()
+    store.get(Forest)
+
+    assert store.get(Tree) == Tree.model_json_schema()
+    assert store.definition_hits == 0
+
+
+def test_schema_store_ignores_ambiguous_definitions():
+    first = create_model('Item', __module__='first', value=(int, 1))
+    second = create_model('Item', __module__='second', value=(str, 'a'))
+    container = create_model('Container', first=(first, ...), second=(second, ...))
+
+    store = SchemaStore()
+    store.get(container)
+
+    assert store.get(first) == first.model_json_schema()
+    assert store.get(second) == second.model_json_schema()
+    assert store.definition_hits == 0
+
+
+def test_schema_store_ignores_overridden_json_schema():
+    """Ensure that definitions are not reused for nested models which override
+    pydantic's `model_json_schema` because their definitions may differ from
+    their standalone schemas.
+
+    """
+
+    class Child(BaseModel):
+        value: int = 1
+
+        @classmethod
+        def model_json_schema(cls, *args, **kwargs):
+            schema = super().model_json_schema(*args, **kwargs)
+            return {**schema, 'examples': [{'value': 2}]}
+
+    parent = create_model('Parent', child=(Child, ...))
+
+    store = SchemaStore()
+    store.get(parent)
+
+    assert store.get(Child) == Child.model_json_schema()
+    assert store.definition_hits == 0
+
+
+def test_schema_store_ignores_non_default_settings():
+    store = SchemaStore()
+    store.get(Person, by_alias=False)
+
+    assert store.get(Address, by_alias=False) == Address.model_json_schema(
+        by_alias=False
+    )
+    assert store.definition_hits == 0
+
+
+def test_schema_store_inspector_integration():
+    store = SchemaStore()
+    registry = InspectorRegistry(schema_store=store)
+
+    registry.get(Person).schema.sanitized  # noqa: B018
+    registry.get(Address).schema.sanitized  # noqa: B018
+
+    assert (store.hits, store.definition_hits, store.misses) == (0, 1, 1)
+
+
+def test_schema_store_report(test_app):
+    app = test_app('base')
+    store = get_schema_store(app.env)
+    store.get(Person)
+    store.get(Person)
+    store.get(Address)
+
+    report_schema_store(app, None)
+
+    expected = 'schema store: 1 hits, 1 definition hits, 1 misses'
+    assert expected in app._status.getvalue()
+
+
+def test_disk_schema_cache_roundtrip(tmp_path):
+    cache = DiskSchemaCache(path=tmp_path / 'cache.sqlite', max_size=1024**2)
+    entry = DiskSchemaCacheEntry(non_serializable=['field'], lines=['a', 'b'])
+
+    assert cache.get(RegistryModel) is None
+    cache.set(RegistryModel, entry)
+
+    restored = DiskSchemaCache(path=cache.path, max_size=cache.max_size)
+    assert restored.get(RegistryModel) == entry
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert (restored.hits, restored.misses) == (1, 0)
+
+    # caches are created from the current configuration instead of pickled
+    assert pickle.loads(pickle.dumps(cache)) is None
+
+
+def test_disk_schema_cache_invalidated_by_fingerprint(tmp_path):
+    cache = DiskSchemaCache(path=tmp_path / 'cache.sqlite', max_size=1024**2)
+    entry = DiskSchemaCacheEntry(non_serializable=[], lines=['a'])
+
+    old = create_model('Changing', __module__='target', field=(int, 1))
+    new = create_model('Changing', __module__='target', field=(int, 2))
+
+    cache.set(old, entry)
+    assert new not in cache
+    assert old in cache
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    assert cache.get(new) is None
+    assert cache.get(old) == entry
+
+
+def test_disk_schema_cache_eviction(tmp_path):
+    entry = DiskSchemaCacheEntry(non_serializable=[], lines=['x' * 100])
+    size = len(pickle.dumps(entry))
+    cache = DiskSchemaCache(path=tmp_path / 'cache.sqlite', max_size=2 * size)
+
+    cache.set(Geo, entry)
+    cache.set(Address, entry)
+    cache.get(Geo)
+    cache.set(Person, entry)
+
+    assert cache.get(Geo) == entry
+    assert cache.get(Person) == entry
+    assert cache.get(Address) is None
+
+
+def test_disk_schema_cache_handles_database_errors(tmp_path, monkeypatch):
+    path = tmp_path / 'cache.sqlite'
+    path.write_text('no database')
+    cache = DiskSchemaCache(path=path, max_size=1024**2)
+
+    errors = []
+    monkeypatch.setattr(cache, '_warn', errors.append)
+
+    assert cache.get(RegistryModel) is None
+    cache.set(RegistryModel, DiskSchemaCacheEntry([], []))
+
+    assert len(errors) == 2
+    assert all(isinstance(error, sqlite3.DatabaseError) for error in errors)
+
+
+def test_disk_schema_cache_disabled_by_default(test_app):
+    app = test_app('base')
+
+    assert get_disk_schema_cache(app.env) is None
+
+
+def test_disk_schema_cache_autodoc(test_app):
+    """Ensure that the rendered JSON schema is retrieved from the disk schema
+    cache while producing identical output.
+
+    """
+
+    app = test_app(
+        'base',
+        conf={
+            'autodoc_pydantic_schema_cache': True,
+            'autodoc_pydantic_model_show_json': True,
+        },
+        deactivate_all=True,
+    )
+    kwargs = dict(
+        app=app,
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelShowJson',
+    )
+
+    first = do_autodoc(**kwargs)
+    second = do_autodoc(**kwargs)
+
+    cache = get_disk_schema_cache(app.env)
+    assert cache.path.exists()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first == second
+    assert '.. code-block:: json' in '\n'.join(first)
+
+
+def test_disk_schema_cache_follows_configuration(test_app):
+    """Ensure that changed configuration values are respected once a new build
+    starts instead of reusing the cache of a previous build.
+
+    """
+
+    app = test_app('base', conf={'autodoc_pydantic_schema_cache': True})
+    cache = get_disk_schema_cache(app.env)
+    assert cache.max_size == 50 * 1024**2
+
+    app.config.autodoc_pydantic_schema_cache_max_size = 1
+    reset_build_caches(app)
+    assert get_disk_schema_cache(app.env).max_size == 1024**2
+
+    app.config.autodoc_pydantic_schema_cache = False
+    reset_build_caches(app)
+    assert get_disk_schema_cache(app.env) is None
+
+
+@pytest.fixture(scope='function')
+def count_type_hints(monkeypatch):
+    """Count the number of type hint resolutions per model."""
+
+    counter = {}
+    get_type_hints = cache_module.get_type_hints
+
+    def counting_get_type_hints(obj, *args, **kwargs):
+        counter[obj.__name__] = counter.get(obj.__name__, 0) + 1
+        return get_type_hints(obj, *args, **kwargs)
+
+    monkeypatch.setattr(cache_module, 'get_type_hints', counting_get_type_hints)
+    return counter
+
+
+def test_type_hints_cache(count_type_hints):
+    cache = TypeHintsCache()
+
+    type_hints = cache.get(Person)
+    assert cache.get(Person) is type_hints
+    assert type_hints['home'] == 'tests.test_cache.Address'
+    assert count_type_hints == {'Person': 1}
+
+    aliases = {'Address': 'tests.test_cache.Address'}
+    assert cache.get(Person, aliases) == type_hints
+    assert count_type_hints == {'Person': 2}
+
+    restored = pickle.loads(pickle.dumps(cache))
+    restored.get(Person)
+    assert count_type_hints == {'Person': 3}
+
+
+def test_type_hints_cache_field_summary(test_app, count_type_hints):
+    """Ensure that type hints are resolved only once per model while
+    documenting the field summary.
+
+    """
+
+    app = test_app(
+        'base',
+        conf={'autodoc_pydantic_model_show_field_summary': True},
+        deactivate_all=True,
+    )
+    kwargs = dict(
+        app=app,
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelShowFieldSummary',
+    )
+
+    first = do_autodoc(**kwargs)
+    second = do_autodoc(**kwargs)
+
+    assert count_type_hints == {'ModelShowFieldSummary': 1}
+    assert first == second
+    assert '   - :py:obj:`field1 (int) <target.configuration.' in '\n'.join(first)
+
+    # type hints are restored from the model result cache
+    get_type_hints_cache(app.env).clear()
+    do_autodoc(**kwargs)
+    assert count_type_hints == {'ModelShowFieldSummary': 1}
+
+    get_type_hints_cache(app.env).clear()
+    get_model_result_cache(app.env).clear()
+    do_autodoc(**kwargs)
+    assert count_type_hints == {'ModelShowFieldSummary': 2}
+
+
+def test_model_result_cache():
+    cache = ModelResultCache()
+    old = create_model('Changing', __module__='target', field=(int, 1))
+    new = create_model('Changing', __module__='target', field=(int, 2))
+
+    cache.set(old, 'key', 'old', docname='doc')
+    assert cache.get(old, 'key') == 'old'
+    assert cache.get(old, 'other') is None
+    assert cache.get(new, 'key') is None
+
+    cache.set(new, 'other', 'new', docname='doc')
+    assert cache.get(new, 'other') == 'new'
+    assert cache.get(old, 'key') is None
+    assert len(cache) == 1
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get(new, 'other') == 'new'
+
+
+def test_model_result_cache_purge_and_prune():
+    cache = ModelResultCache()
+    cache.set(Geo, 'key', 1, docname='first')
+    cache.set(Address, 'key', 2, docname='first')
+    cache.set(Address, 'key', 2, docname='second')
+
+    # results are kept for documents which are re-read
+    cache.purge_doc('first')
+    assert cache.get(Geo, 'key') == 1
+
+    cache.prune()
+    assert cache.get(Geo, 'key') is None
+    assert cache.get(Address, 'key') == 2
+
+
+def test_model_result_cache_merge():
+    cache = ModelResultCache()
+    cache.set(Geo, 'key', 1, docname='main')
+
+    worker = pickle.loads(pickle.dumps(cache))
+    worker.set(Address, 'key', 2, docname='read')
+    worker.set(Person, 'key', 3, docname='ignored')
+
+    cache.merge(worker, {'read', 'missing'})
+
+    assert cache.get(Geo, 'key') == 1
+    assert cache.get(Address, 'key') == 2
+    assert cache.get(Person, 'key') is None
+
+    cache.purge_doc('main')
+    cache.prune()
+    assert len(cache) == 1
+
+
+def test_model_result_cache_autodoc(test_app):
+    """Ensure that JSON schemas are not kept in the pickled model result cache
+    but are restored from the disk schema cache while producing identical
+    output.
+
+    """
+
+    app = test_app(
+        'base',
+        conf={
+            'autodoc_pydantic_model_show_json': True,
+            'autodoc_pydantic_schema_cache': True,
+        },
+        deactivate_all=True,
+    )
+    kwargs = dict(
+        app=app,
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelShowJson',
+    )
+
+    first = do_autodoc(**kwargs)
+    store = get_schema_store(app.env)
+    assert store.misses == 1
+    assert len(get_model_result_cache(app.env)) == 0
+
+    store.clear()
+    get_inspector_registry(app.env).clear()
+    second = do_autodoc(**kwargs)
+
+    assert first == second
+    assert store.misses == 0
+
+
+def test_model_result_cache_erdantic(test_app, monkeypatch):
+    """Ensure that erdantic traverses the model graph only once per model while
+    producing identical output.
+
+    """
+
+    erd = pytest.importorskip('erdantic', minversion='1.0')
+
+    calls = []
+    to_dot = erd.to_dot
+
+    def counting_to_dot(model, *args, **kwargs):
+        calls.append(model.__name__)
+        return to_dot(model, *args, **kwargs)
+
+    monkeypatch.setattr(erd, 'to_dot', counting_to_dot)
+
+    app = test_app(
+        'base',
+        conf={'autodoc_pydantic_model_erdantic_figure': True},
+        deactivate_all=True,
+    )
+    kwargs = dict(
+        app=app,
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelErdanticFigure',
+    )
+
+    first = do_autodoc(**kwargs)
+    second = do_autodoc(**kwargs)
+
+    assert first == second
+    assert calls == ['ModelErdanticFigure']
+    assert '   .. graphviz::' in first
+
+
+def test_parallel_read_merges_build_state(test_app, make_app):
+    """Ensure that model results and timings of parallel sphinx read workers
+    are merged into the build environment and are reused along with the disk
+    schema cache by a subsequent incremental build.
+
+    """
+
+    conf = {
+        'autodoc_pydantic_profile': True,
+        'autodoc_pydantic_model_show_json': True,
+        'autodoc_pydantic_model_show_field_summary': True,
+        'autodoc_pydantic_schema_cache': True,
+    }
+    app = test_app('parallel-read', conf=conf)
+    app.parallel = 2
+    app.build()
+
+    docnames = {f'doc{idx}' for idx in range(6)}
+    results = get_model_result_cache(app.env)
+    assert len(results) == 6
+    assert set(results._docnames) == docnames
+
+    profiler = get_profiler(app.env)
+    assert docnames <= set(profiler.timings)
+    assert len(profiler.to_dict()['models']) == 6
+
+    path = app.srcdir / 'doc0.rst'
+    path.write_text(path.read_text() + '\nChanged.\n')
+
+    incremental = make_app('html', srcdir=app.srcdir, confoverrides=conf)
+    store = get_schema_store(incremental.env)
+    incremental.build()
+
+    assert incremental.env.found_docs == docnames | {'index'}
+    assert store.misses == 0
+    assert list(get_profiler(incremental.env).timings) == ['doc0']
@@ -119,6 +119,7 @@ def test_autodoc_pydantic_model_erdantic_figure_true(autodocument):
         '      <summary>Show Entity Relationship Diagram</summary>',
         '',
         '   .. graphviz::',
+        '      :class: autodoc-pydantic-erd',
         '',
         '      digraph "Entity Relationship Diagram created by erdantic" {',
         '         graph [fontcolor=gray66,',
@@ -182,6 +183,7 @@ def test_autodoc_pydantic_model_erdantic_figure_collapsed_false(autodocument):
         '   ModelErdanticFigure.',
         '',
         '   .. graphviz::',
+        '      :class: autodoc-pydantic-erd',
         '',
         '      digraph "Entity Relationship Diagram created by erdantic" {',
         '         graph [fontcolor=gray66,',
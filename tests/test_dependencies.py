@@ -0,0 +1,152 @@
+"""This module contains tests regarding the `dependencies` module."""
+
+import pickle
+import sys
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from sphinxcontrib.autodoc_pydantic.dependencies import (
+    ModelDependencies,
+    get_model_dependencies,
+)
+
+MODULES = ('dependencies_shared', 'dependencies_people', 'dependencies_other')
+
+
+class Model(BaseModel):
+    field: int = 1
+
+
+def test_model_dependencies(monkeypatch):
+    dependencies = ModelDependencies(config={'option': True})
+    dependencies.add_model('doc', Model)
+    dependencies.add_model('other', Model)
+    dependencies.add_document('plain')
+
+    restored = pickle.loads(pickle.dumps(dependencies))
+    assert restored.get_models('doc') == dependencies.get_models('doc')
+    assert restored.get_outdated({'option': True}) == set()
+
+    changed = create_model(
+        'Model',
+        __module__=__name__,
+        field=(int, 2),
+    )
+    monkeypatch.setattr(sys.modules[__name__], 'Model', changed)
+    assert restored.get_outdated({'option': True}) == {'doc', 'other'}
+    assert restored.get_outdated({'option': True}, exclude={'doc'}) == {'other'}
+
+    monkeypatch.setattr(sys.modules[__name__], 'Model', object)
+    assert restored.get_outdated({'option': True}) == {'doc', 'other'}
+
+    monkeypatch.delattr(sys.modules[__name__], 'Model')
+    assert restored.get_outdated({'option': True}) == set()
+
+
+def test_model_dependencies_config():
+    dependencies = ModelDependencies(config={'option': True})
+    dependencies.add_model('doc', Model)
+    dependencies.add_document('plain')
+
+    assert dependencies.get_outdated({'option': False}) == {'doc', 'plain'}
+    assert dependencies.config == {'option': False}
+    assert dependencies.get_outdated({'option': False}) == set()
+
+
+def test_model_dependencies_merge_and_purge():
+    dependencies = ModelDependencies(config={})
+    dependencies.add_document('main')
+
+    worker = pickle.loads(pickle.dumps(dependencies))
+    worker.add_model('read', Model)
+    worker.add_model('ignored', Model)
+
+    dependencies.merge(worker, {'read', 'missing'})
+    assert 'read' in dependencies
+    assert 'ignored' not in dependencies
+
+    dependencies.purge_doc('read')
+    assert len(dependencies) == 1
+
+
+@pytest.fixture
+def dependencies_app(test_app, make_app):
+    """Build the `dependencies` test root once and return a callable which
+    creates a fresh application for an incremental build while collecting
+    the names of all documents being read.
+
+    """
+
+    for module in MODULES:
+        sys.modules.pop(module, None)
+
+    app = test_app('dependencies')
+    app.build()
+
+    def create(conf=None):
+        for module in MODULES:
+            sys.modules.pop(module, None)
+
+        incremental = make_app('html', srcdir=app.srcdir, confoverrides=conf or {})
+        read = []
+        incremental.connect(
+            'env-before-read-docs',
+            lambda app, env, docnames: read.extend(docnames),
+        )
+        return incremental, read
+
+    yield app, create
+
+    for module in MODULES:
+        sys.modules.pop(module, None)
+
+
+def test_dependencies_recorded(dependencies_app):
+    app, _ = dependencies_app
+    dependencies = get_model_dependencies(app.env)
+
+    assert set(dependencies.get_models('person')) == {'dependencies_people.Person'}
+    assert set(dependencies.get_models('other')) == {'dependencies_other.Other'}
+    assert 'index' not in dependencies
+
+
+def test_dependencies_unchanged(dependencies_app):
+    _, create = dependencies_app
+
+    incremental, read = create()
+    incremental.build()
+
+    assert read == []
+
+
+def test_dependencies_nested_model_changed(dependencies_app):
+    """Ensure that a changed nested model defined in another module re-reads
+    only the document rendering the model which references it.
+
+    """
+
+    app, create = dependencies_app
+    path = app.srcdir / 'dependencies_shared.py'
+    path.write_text(path.read_text() + '    city: str = ""\n')
+
+    incremental, read = create()
+    incremental.build()
+
+    assert read == ['person']
+
+
+@pytest.mark.parametrize(
+    ('conf', 'expected'),
+    [
+        ({'autodoc_pydantic_model_show_json': False}, ['other', 'person']),
+        ({'autodoc_pydantic_profile': True}, []),
+    ],
+)
+def test_dependencies_config_changed(dependencies_app, conf, expected):
+    _, create = dependencies_app
+
+    incremental, read = create(conf)
+    incremental.build()
+
+    assert read == expected
@@ -0,0 +1,172 @@
+"""This module contains tests regarding the `diagrams` module."""
+
+import pickle
+import sys
+import time
+
+import pytest
+
+from sphinxcontrib.autodoc_pydantic.diagrams import (
+    DiagramRegistry,
+    DiagramRenderer,
+    get_diagram_registry,
+    get_digest,
+)
+
+pytest.importorskip('erdantic', minversion='1.0', reason='erdantic missing')
+
+SCRIPT = """
+import sys
+from pathlib import Path
+
+output = next(arg[2:] for arg in sys.argv if arg.startswith('-o'))
+Path(output).write_text(sys.stdin.read())
+"""
+
+
+def test_diagram_registry():
+    registry = DiagramRegistry()
+    digest = registry.add('doc', 'digraph {}\n')
+
+    assert registry.add('other', 'digraph {}') == digest
+    assert registry.get('doc') == {digest: 'digraph {}\n'}
+    assert len(registry) == 1
+
+    worker = pickle.loads(pickle.dumps(registry))
+    worker_digest = worker.add('read', 'digraph { a }')
+    worker.add('ignored', 'digraph { b }')
+
+    registry.merge(worker, {'read', 'missing'})
+    assert set(registry.diagrams) == {digest, worker_digest}
+
+    registry.purge_doc('doc')
+    registry.purge_doc('other')
+    assert 'doc' not in registry
+    assert set(registry.diagrams) == {worker_digest}
+
+
+def test_diagram_renderer(tmp_path):
+    script = tmp_path / 'dot.py'
+    script.write_text(SCRIPT)
+
+    renderer = DiagramRenderer(
+        imagedir=tmp_path / '_images',
+        command=[sys.executable, str(script)],
+        workers=2,
+        timeout=30,
+    )
+    diagrams = {get_digest(code): code for code in ('digraph {}', 'digraph { a }')}
+
+    assert renderer.start(diagrams) == 2
+    for digest, code in diagrams.items():
+        filename = renderer.wait(digest)
+        assert (tmp_path / '_images' / filename).read_text() == code
+
+    # already rendered images are reused
+    assert renderer.start(diagrams) == 0
+
+    restored = pickle.loads(pickle.dumps(renderer))
+    assert len(restored) == 0
+    assert restored.start(diagrams) == 0
+
+    renderer.shutdown()
+    assert len(renderer) == 0
+
+
+def test_diagram_renderer_failure(tmp_path):
+    renderer = DiagramRenderer(
+        imagedir=tmp_path,
+        command=[sys.executable, '-c', 'import sys; sys.exit(1)'],
+        workers=1,
+        timeout=30,
+    )
+    digest = get_digest('digraph {}')
+
+    renderer.start({digest: 'digraph {}'})
+    assert renderer.wait(digest) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def erdantic_app(test_app):
+    """Build the `erdantic-workers` test root with given configuration and
+    return the application along with the number of graphviz calls.
+
+    """
+
+    def build(conf):
+        sys.modules.pop('erdantic_target', None)
+        app = test_app('erdantic-workers', conf=conf)
+        app.build()
+
+        log = app.srcdir / 'calls.log'
+        calls = len(log.read_text().splitlines()) if log.exists() else 0
+        return app, calls
+
+    yield build
+
+    sys.modules.pop('erdantic_target', None)
+
+
+def test_erdantic_workers(erdantic_app):
+    start = time.perf_counter()
+    app, calls = erdantic_app(
+        {
+            'autodoc_pydantic_erdantic_workers': 2,
+            'autodoc_pydantic_erdantic_timeout': 1,
+        }
+    )
+
+    # the slow diagram is aborted after the timeout
+    assert time.perf_counter() - start < 8
+
+    # `Parent` is documented twice but its diagram is rendered only once
+    images = list((app.outdir / '_images').glob('erdantic-*.svg'))
+    assert len(images) == 1
+    assert calls == 2
+
+    index = (app.outdir / 'index.html').read_text()
+    other = (app.outdir / 'sub' / 'other.html').read_text()
+    slow = (app.outdir / 'slow.html').read_text()
+
+    assert f'data="_images/{images[0].name}"' in index
+    assert f'data="../_images/{images[0].name}"' in other
+    assert 'Entity Relationship Diagram could not be rendered.' in slow
+
+    registry = get_diagram_registry(app.env)
+    assert len(registry) == 2
+    assert set(registry.get('index')) == set(registry.get('sub/other'))
+
+
+def test_erdantic_workers_disabled(erdantic_app):
+    # graphviz renders the slow diagram without any timeout
+    app, calls = erdantic_app({'exclude_patterns': ['slow.rst']})
+
+    # `Parent` is documented twice but graphviz renders one shared image
+    images = list((app.outdir / '_images').glob('graphviz-*.svg'))
+    assert len(images) == 1
+    assert calls == 1
+
+    index = (app.outdir / 'index.html').read_text()
+    other = (app.outdir / 'sub' / 'other.html').read_text()
+
+    assert f'data="_images/{images[0].name}"' in index
+    assert f'data="../_images/{images[0].name}"' in other
+    assert len(get_diagram_registry(app.env)) == 0
+
+
+def test_erdantic_workers_png(erdantic_app):
+    # diagrams are only rendered as SVG images in a pool
+    app, calls = erdantic_app(
+        {
+            'exclude_patterns': ['slow.rst'],
+            'graphviz_output_format': 'png',
+            'autodoc_pydantic_erdantic_workers': 2,
+        }
+    )
+
+    images = list((app.outdir / '_images').glob('graphviz-*.png'))
+    assert len(images) == 1
+    assert calls == 1
+    assert not list((app.outdir / '_images').glob('erdantic-*'))
+    assert f'src="_images/{images[0].name}"' in (app.outdir / 'index.html').read_text()
@@ -1,6 +1,7 @@
 """This module contains tests for edgecases."""
 
 import copy
+import pickle
 
 import pytest
 import sphinx.errors
@@ -9,6 +10,15 @@ from sphinx.transforms.post_transforms import ReferencesResolver
 from sphinxcontrib.autodoc_pydantic.directives.autodocumenters import (
     PydanticModelDocumenter,
 )
+from sphinxcontrib.autodoc_pydantic.directives.options.composites import (
+    OptionResolver,
+)
+from sphinxcontrib.autodoc_pydantic.directives.templates import (
+    TPL_COLLAPSE,
+    iter_lines,
+    to_collapsable,
+)
+from sphinxcontrib.autodoc_pydantic.directives.utility import NONE
 from tests.compatibility import (
     PYTHON_LT_310,
     TYPEHINTS_PREFIX,
@@ -1118,3 +1128,55 @@ def test_autodoc_module_inherited_members_disabled_with_overwrite(autodocument):
         **kwargs,
     )
     assert result == actual
+
+
+@pytest.mark.parametrize(
+    'chunks',
+    [[], [''], ['a'], ['a', 'b\n', '\nc'], ['\n\n'], ['a\nb\nc', 'd']],
+)
+def test_iter_lines(chunks):
+    """Ensure that streamed lines equal lines of the joined chunks."""
+
+    text = ''.join(chunks)
+    assert list(iter_lines(chunks, prefix='> ')) == [
+        f'> {line}' for line in text.split('\n')
+    ]
+
+
+@pytest.mark.parametrize('lines', [[], [''], ['a'], ['a', '', 'b']])
+def test_to_collapsable(lines):
+    """Ensure that streamed collapsable blocks equal the formatted template."""
+
+    expected = TPL_COLLAPSE.format(
+        lines='\n'.join(lines), summary='Title', details_class='css'
+    ).split('\n')
+
+    assert to_collapsable(lines, 'Title', 'css') == expected
+
+
+def test_option_resolver():
+    """Ensure that configuration names are determined only once per object
+    type and option name.
+
+    """
+
+    class Config:
+        autodoc_pydantic_model_show_json = True
+
+    resolver = OptionResolver()
+    names = []
+
+    def determine(name):
+        names.append(name)
+        return f'autodoc_pydantic_{name.replace("-", "_")}'
+
+    for _ in range(3):
+        assert resolver.get_value(Config, 'model', 'model-show-json', determine)
+        assert resolver.get_value(Config, None, 'missing', determine) is NONE
+
+    assert names == ['model-show-json', 'missing']
+    assert resolver.get_prefixed_name('model', 'show-json') == 'model-show-json'
+
+    assert len(pickle.loads(pickle.dumps(resolver))) == 0
+    resolver.clear()
+    assert len(resolver) == 0
@@ -0,0 +1,76 @@
+"""This module contains tests regarding the import time of the extension."""
+
+import ast
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET = 100_000
+"""Maximum cumulative import time of the extension in microseconds excluding
+sphinx modules which are required anyway."""
+
+DEFERRED_MODULES = {
+    'erdantic',
+    'json',
+    'pydantic',
+    'pydantic_settings',
+    'sphinxcontrib.autodoc_pydantic.cache',
+    'sphinxcontrib.autodoc_pydantic.inspection',
+}
+"""Modules which must not be imported before the first pydantic object is
+documented."""
+
+SCRIPT = """
+import sys
+import sphinx.ext.autodoc, sphinx.domains.python
+before = set(sys.modules)
+import sphinxcontrib.autodoc_pydantic
+print(sorted(set(sys.modules) - before))
+"""
+
+
+@pytest.fixture(scope='module')
+def import_extension():
+    """Import the extension in a fresh interpreter with `-X importtime` after
+    sphinx modules required by the extension were imported. Return newly
+    imported modules and the import times in microseconds keyed by module.
+
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = set(ast.literal_eval(result.stdout))
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+
+    return imported, times
+
+
+def test_deferred_imports(import_extension):
+    imported, _ = import_extension
+
+    assert 'sphinxcontrib.autodoc_pydantic.directives.autodocumenters' in imported
+    assert imported & DEFERRED_MODULES == set()
+
+
+@pytest.mark.benchmark
+def test_import_time_budget(import_extension):
+    """Ensure that the extension imports quickly. It measures wall-clock time
+    which depends on the machine. Hence, it only runs along with benchmarks.
+
+    """
+
+    _, times = import_extension
+
+    assert times['sphinxcontrib.autodoc_pydantic'] < IMPORT_TIME_BUDGET
@@ -1,5 +1,6 @@
 """This module contains tests regarding the `inspection` module."""
 
+import weakref
 from typing import TypeVar, Union
 
 try:
@@ -8,9 +9,22 @@ except ImportError:
     from typing import _ForwardRef as ForwardRef
 
 import pytest
-from pydantic import BaseModel, ConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PydanticInvalidForJsonSchema,
+    PydanticUserError,
+    create_model,
+    field_validator,
+    model_validator,
+)
 
-from sphinxcontrib.autodoc_pydantic.inspection import ModelInspector, StaticInspector
+from sphinxcontrib.autodoc_pydantic.inspection import (
+    ASTERISK_FIELD_NAME,
+    ModelInspector,
+    StaticInspector,
+    ValidatorAdapter,
+)
 
 
 @pytest.fixture(scope='session')
@@ -128,6 +142,73 @@ def test_find_non_json_serializable_fields(serializable, serializable_mix):
     assert serializable_mix.fields.non_json_serializable == non_serial_fields
 
 
+@pytest.fixture(scope='function')
+def count_schema_generation(monkeypatch):
+    """Count the number of models created and schemas generated while
+    inspecting pydantic models.
+
+    """
+
+    from sphinxcontrib.autodoc_pydantic import inspection
+
+    counter = {'create_model': 0, 'model_json_schema': 0}
+
+    def counting_create_model(*args, **kwargs):
+        counter['create_model'] += 1
+        return create_model(*args, **kwargs)
+
+    schema_func = BaseModel.model_json_schema.__func__
+
+    def counting_model_json_schema(cls, *args, **kwargs):
+        counter['model_json_schema'] += 1
+        return schema_func(cls, *args, **kwargs)
+
+    monkeypatch.setattr(inspection, 'create_model', counting_create_model)
+    monkeypatch.setattr(
+        BaseModel, 'model_json_schema', classmethod(counting_model_json_schema)
+    )
+    return counter
+
+
+def test_non_json_serializable_single_schema_generation(count_schema_generation):
+    """Ensure that models with a valid schema require only a single schema
+    generation to determine non serializable fields and the sanitized schema.
+
+    """
+
+    fields = {f'field_{idx}': (int, idx) for idx in range(50)}
+    inspector = ModelInspector(create_model('ValidSchema', **fields))
+
+    assert inspector.fields.non_json_serializable == []
+    assert 'field_0' in inspector.schema.sanitized['properties']
+    assert inspector.fields.is_json_serializable('field_49')
+    assert count_schema_generation == {'create_model': 0, 'model_json_schema': 1}
+
+
+def test_non_json_serializable_bisection(count_schema_generation):
+    """Ensure that non serializable fields are found via bisection instead of
+    probing every field separately.
+
+    """
+
+    class Custom:
+        pass
+
+    fields = {f'field_{idx}': (int, idx) for idx in range(64)}
+    fields['field_invalid'] = (Custom, Custom())
+    model = create_model(
+        'InvalidSchema',
+        __config__=ConfigDict(arbitrary_types_allowed=True),
+        **fields,
+    )
+    inspector = ModelInspector(model)
+
+    assert inspector.fields.non_json_serializable == ['field_invalid']
+    assert not inspector.fields.is_json_serializable('field_invalid')
+    assert inspector.fields.is_json_serializable('field_0')
+    assert count_schema_generation['create_model'] < len(fields) // 4
+
+
 def test_get_safe_schema_json_serializable(serializable):
     json_result = serializable.schema.sanitized
 
@@ -174,3 +255,304 @@ def test_is_pydantic_model_edge_case():
         EdgeCase = Dict[str, str]
 
     assert not StaticInspector.is_pydantic_model(EdgeCase)
+
+
+@pytest.fixture(scope='session')
+def model_500_members():
+    """Provide a pydantic model with 250 fields and 250 validators."""
+
+    def create_validator(name):
+        def validator(cls, v):
+            return v
+
+        validator.__name__ = validator.__qualname__ = f'check_{name}'
+        return field_validator(name)(validator)
+
+    names = [f'field_{idx}' for idx in range(250)]
+    fields = {name: (int, 1) for name in names}
+    validators = {f'check_{name}': create_validator(name) for name in names}
+
+    return create_model('LargeModel', __validators__=validators, **fields)
+
+
+def test_is_validator_by_name(model_500_members):
+    members = list(model_500_members.model_fields) + [
+        f'check_{name}' for name in model_500_members.model_fields
+    ]
+
+    result = {
+        name
+        for name in members
+        if StaticInspector.is_validator_by_name(name, model_500_members)
+    }
+
+    assert result == ModelInspector(model_500_members).validators.names
+    assert not StaticInspector.is_validator_by_name('check_field_0', object)
+
+
+def test_is_validator_by_name_memoized(model_500_members, monkeypatch):
+    """Ensure that checking all 500 members of a large model for being
+    validators reads pydantic's decorators only once instead of creating a
+    `ModelInspector` for every member.
+
+    """
+
+    members = list(model_500_members.model_fields) + [
+        f'check_{name}' for name in model_500_members.model_fields
+    ]
+
+    class CountingDecorators:
+        reads = 0
+
+        def __init__(self, decorators):
+            self._decorators = decorators
+
+        def __getattr__(self, name):
+            CountingDecorators.reads += 1
+            return getattr(self._decorators, name)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('ModelInspector must not be created.')
+
+    decorators = CountingDecorators(model_500_members.__pydantic_decorators__)
+    monkeypatch.setattr(model_500_members, '__pydantic_decorators__', decorators)
+    monkeypatch.setattr(
+        StaticInspector, '_validator_names', weakref.WeakKeyDictionary()
+    )
+    monkeypatch.setattr(ModelInspector, '__init__', fail)
+
+    for name in members:
+        StaticInspector.is_validator_by_name(name, model_500_members)
+
+    # field and model validators are read exactly once
+    assert CountingDecorators.reads == 2
+
+
+def test_get_fingerprint():
+    """Ensure that fingerprints are stable for identical models while changing
+    for modified fields, validators, config, docstrings and nested models.
+
+    """
+
+    def create(doc='Doc.', default=1, config=None, validators=None, nested=int):
+        model = create_model(
+            'Fingerprint',
+            __module__='target',
+            __config__=config,
+            __validators__=validators,
+            field=(int, default),
+            nested=(nested, None),
+        )
+        model.__doc__ = doc
+        return model
+
+    def check(cls, v):
+        return v
+
+    class Nested(BaseModel):
+        value: int = 1
+
+    class NestedChanged(BaseModel):
+        value: int = 2
+
+    NestedChanged.__name__ = NestedChanged.__qualname__ = 'Nested'
+
+    fingerprint = StaticInspector.get_fingerprint(create())
+
+    assert fingerprint == StaticInspector.get_fingerprint(create())
+    assert fingerprint != StaticInspector.get_fingerprint(create(doc='Changed.'))
+    assert fingerprint != StaticInspector.get_fingerprint(create(default=2))
+
+    config = ConfigDict(frozen=True)
+    assert fingerprint != StaticInspector.get_fingerprint(create(config=config))
+
+    validators = {'check': field_validator('field')(check)}
+    assert fingerprint != StaticInspector.get_fingerprint(create(validators=validators))
+
+    nested = StaticInspector.get_fingerprint(create(nested=Nested))
+    nested_changed = StaticInspector.get_fingerprint(create(nested=NestedChanged))
+    assert nested != nested_changed
+
+
+def test_reference_inspector_indexes():
+    """Ensure that indexed lookups of the `ReferenceInspector` match a linear
+    scan over all mappings while preserving the order of definition.
+
+    """
+
+    class References(BaseModel):
+        field_a: int = 1
+        field_b: int = 2
+        field_c: int = 3
+
+        @field_validator('field_b', 'field_a')
+        @classmethod
+        def check_fields(cls, v):
+            return v
+
+        @field_validator('field_a')
+        @classmethod
+        def check_field_a(cls, v):
+            return v
+
+        @model_validator(mode='after')
+        def check_model(self):
+            return self
+
+    references = ModelInspector(References).references
+
+    def scan_by_field(name):
+        return {
+            mapping
+            for mapping in references.mappings
+            if mapping.field_name in (name, ASTERISK_FIELD_NAME)
+        }
+
+    def scan_by_validator(name):
+        return {
+            mapping for mapping in references.mappings if mapping.validator_name == name
+        }
+
+    for name in ('field_a', 'field_b', 'field_c', ASTERISK_FIELD_NAME, 'missing'):
+        result = references.filter_by_field_name(name)
+        assert len(result) == len(set(result))
+        assert set(result) == scan_by_field(name)
+
+    for name in ('check_fields', 'check_field_a', 'check_model', 'missing'):
+        result = references.filter_by_validator_name(name)
+        assert set(result) == scan_by_validator(name)
+
+    validates = references.filter_by_validator_name('check_fields')
+    assert [mapping.field_name for mapping in validates] == ['field_b', 'field_a']
+
+    validated_by = references.filter_by_field_name('field_a')
+    assert [mapping.validator_name for mapping in validated_by] == [
+        'check_fields',
+        'check_field_a',
+        'check_model',
+    ]
+
+    for mapping in references.mappings:
+        expected = mapping.validator_ref.split('.')[-2]
+        assert references.get_validator_class(mapping) == expected == 'References'
+
+
+def test_validator_adapter_identity():
+    """Ensure that validator adapters are hashed and compared by the
+    underlying validator function.
+
+    """
+
+    class Validators(BaseModel):
+        field_a: int = 1
+        field_b: int = 2
+
+        @field_validator('field_a', 'field_b')
+        @classmethod
+        def check_fields(cls, v):
+            return v
+
+    validators = ModelInspector(Validators).validators
+    func = Validators.__pydantic_decorators__.field_validators['check_fields'].func
+
+    assert ValidatorAdapter(func) == ValidatorAdapter(func)
+    assert hash(ValidatorAdapter(func)) == hash(ValidatorAdapter(func))
+    assert ValidatorAdapter(func) != ValidatorAdapter(lambda: None)
+
+    assert validators.values == {ValidatorAdapter(func)}
+    assert validators.values is validators.values
+    assert validators.names == {'check_fields'}
+    assert validators.names is validators.names
+
+
+def test_config_inspector_settings_defaults():
+    """Ensure that only non-default settings config values are shown even if
+    they are unhashable or equal but not identical to the defaults. Values are
+    memoized per model class.
+
+    """
+
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    class Unhashable:
+        __hash__ = None
+
+        def __eq__(self, other):
+            raise TypeError('Not comparable.')
+
+        def __call__(self, schema):
+            pass
+
+    unhashable = Unhashable()
+
+    class Settings(BaseSettings):
+        model_config = SettingsConfigDict(
+            env_prefix='app_',
+            json_schema_extra=unhashable,
+            protected_namespaces=('model_', 'settings_'),
+        )
+
+    expected = {
+        'env_prefix': 'app_',
+        'json_schema_extra': unhashable,
+    }
+
+    inspector = ModelInspector(Settings)
+    assert inspector.config.items == expected
+
+    inspector.config.items.clear()
+    assert ModelInspector(Settings).config.items == expected
+    assert inspector.config._values[Settings] == expected
+    assert inspector.config.get_settings_defaults() is (
+        ModelInspector(Settings).config.get_settings_defaults()
+    )
+
+
+def test_schema_inspector_reraises_cached_errors():
+    """Ensure that failed schema generation raises the cached exception on
+    every access without a growing traceback.
+
+    """
+
+    class NotSerializable:
+        pass
+
+    model = create_model(
+        'NotSerializableModel',
+        __config__=ConfigDict(arbitrary_types_allowed=True),
+        field=(NotSerializable, None),
+    )
+    schema = ModelInspector(model).schema
+
+    errors = []
+    depths = []
+    for _ in range(3):
+        with pytest.raises(PydanticInvalidForJsonSchema) as info:
+            _ = schema.raw
+        errors.append(info.value)
+        depths.append(len(info.traceback))
+
+    assert len({id(error) for error in errors}) == 1
+    assert len(set(depths)) == 1
+    assert not schema.is_serializable
+
+
+def test_schema_inspector_reraises_keyword_only_errors():
+    """Ensure that cached exceptions whose constructor requires keyword-only
+    arguments are raised again with their original type and attributes.
+
+    """
+
+    class FailingModel(BaseModel):
+        field: int = 1
+
+        @classmethod
+        def model_json_schema(cls, *args, **kwargs):
+            raise PydanticUserError('boom', code='schema-for-unknown-type')
+
+    schema = ModelInspector(FailingModel).schema
+
+    for _ in range(2):
+        with pytest.raises(PydanticUserError) as info:
+            _ = schema.raw
+        assert info.value.code == 'schema-for-unknown-type'
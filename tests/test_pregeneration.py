@@ -0,0 +1,104 @@
+"""This module contains tests regarding the `pregeneration` module."""
+
+import os
+import pickle
+
+from pydantic import BaseModel
+
+from sphinxcontrib.autodoc_pydantic.pregeneration import (
+    PregeneratedSchemas,
+    generate_schema,
+    get_pregenerated_schemas,
+    iter_model_paths,
+)
+
+CONF = {
+    'autodoc_pydantic_schema_workers': 2,
+    'autodoc_pydantic_model_show_json': True,
+    'autodoc_pydantic_model_show_json_error_strategy': 'coerce',
+}
+
+
+def test_iter_model_paths():
+    source = '\n'.join(
+        [
+            '.. autopydantic_model:: target.Model',
+            '.. autoclass:: target.Class',
+            '.. py:currentmodule:: target',
+            '   .. autopydantic_settings:: Settings',
+            '```{autopydantic_model} other.Model',
+            '```',
+            ':::{module} other',
+            ':::',
+        ]
+    )
+
+    assert list(iter_model_paths(source)) == [
+        'target.Model',
+        'target.Settings',
+        'Settings',
+        'target.other.Model',
+        'other.Model',
+    ]
+
+
+def test_generate_schema():
+    _, schema = generate_schema('tests.test_pregeneration.SchemaModel')
+
+    assert schema.non_serializable == []
+    assert schema.schema['title'] == 'SchemaModel'
+
+
+class SchemaModel(BaseModel):
+    field: int = 1
+
+
+def test_pregenerated_schemas_pickle():
+    schemas = PregeneratedSchemas()
+    schemas._schemas[SchemaModel] = generate_schema(
+        'tests.test_pregeneration.SchemaModel'
+    )[1]
+
+    assert SchemaModel in schemas
+    assert len(pickle.loads(pickle.dumps(schemas))) == 0
+
+
+def test_pregenerate_schemas(test_app, monkeypatch):
+    """Ensure that JSON schemas of all referenced models are generated in
+    worker processes and that the sphinx process does not generate them again.
+
+    """
+
+    app = test_app('schema-workers', conf=CONF)
+
+    # worker processes are forked and hence call the patched method, too
+    pid = os.getpid()
+    calls = []
+    original = BaseModel.model_json_schema.__func__
+
+    def model_json_schema(cls, *args, **kwargs):
+        if os.getpid() == pid:
+            calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(BaseModel, 'model_json_schema', classmethod(model_json_schema))
+    app.build()
+
+    schemas = get_pregenerated_schemas(app.env)
+    assert len(schemas) == 2
+    assert calls == []
+
+    html = (app.outdir / 'index.html').read_text()
+    assert 'Show JSON schema' in html
+    assert '&quot;nested&quot;' in html
+
+
+def test_pregenerate_schemas_disabled(test_app):
+    conf = {
+        'autodoc_pydantic_schema_workers': 0,
+        'autodoc_pydantic_model_show_json': False,
+    }
+    app = test_app('schema-workers', conf=conf)
+    app.build()
+
+    assert len(get_pregenerated_schemas(app.env)) == 0
@@ -0,0 +1,165 @@
+"""This module contains tests regarding the `profiling` module."""
+
+import json
+import pickle
+from pathlib import Path
+
+from sphinxcontrib.autodoc_pydantic.events import write_profile_report
+from sphinxcontrib.autodoc_pydantic.profiling import (
+    PROFILE_REPORT_FILENAME,
+    ProfileEntry,
+    Profiler,
+    get_profiler,
+)
+
+from .conftest import do_autodoc
+
+
+def test_profiler_record():
+    profiler = Profiler()
+    profiler.record('target.Fast', 'field a', 0.5)
+    profiler.record('target.Slow', 'json-schema', 2.0)
+    profiler.record('target.Slow', 'field b', 0.25)
+    profiler.record('target.Slow', 'field b', 0.25)
+
+    assert len(profiler) == 3
+    assert profiler.entries == [
+        ProfileEntry('target.Slow', 'json-schema', 1, 2.0),
+        ProfileEntry('target.Fast', 'field a', 1, 0.5),
+        ProfileEntry('target.Slow', 'field b', 2, 0.5),
+    ]
+
+    report = profiler.to_dict()
+    assert report['total'] == 3.0
+    assert list(report['models']) == ['target.Slow', 'target.Fast']
+    assert report['models']['target.Slow'] == {
+        'total': 2.5,
+        'phases': {
+            'json-schema': {'calls': 1, 'total': 2.0},
+            'field b': {'calls': 2, 'total': 0.5},
+        },
+    }
+
+    restored = pickle.loads(pickle.dumps(profiler))
+    assert restored.entries == profiler.entries
+
+    profiler.clear()
+    assert len(profiler) == 0
+
+
+def test_profiler_merge():
+    profiler = Profiler()
+    profiler.record('target.Model', 'phase', 1.0, docname='main')
+
+    worker = pickle.loads(pickle.dumps(profiler))
+    worker.record('target.Model', 'phase', 2.0, docname='read')
+    worker.record('target.Other', 'phase', 4.0, docname='ignored')
+
+    profiler.merge(worker, {'read', 'missing'})
+    assert profiler.entries == [ProfileEntry('target.Model', 'phase', 2, 3.0)]
+
+    profiler.purge_doc('main')
+    assert profiler.entries == [ProfileEntry('target.Model', 'phase', 1, 2.0)]
+
+
+def test_profiler_measure():
+    profiler = Profiler()
+
+    with profiler.measure(lambda: 'target.Model', lambda: 'phase'):
+        pass
+
+    with profiler.measure(lambda: None, lambda: 'phase'):
+        pass
+
+    assert [(x.model, x.phase, x.calls) for x in profiler.entries] == [
+        ('target.Model', 'phase', 1)
+    ]
+
+
+def test_profiler_to_table():
+    profiler = Profiler()
+    for idx in range(5):
+        profiler.record('target.Model', f'field f{idx}', idx)
+
+    lines = profiler.to_table(top_n=2).splitlines()
+
+    assert lines[0].split() == [
+        'Total',
+        '(s)',
+        'Calls',
+        'Mean',
+        '(ms)',
+        'Model',
+        'Phase',
+    ]
+    assert set(lines[1]) == {'-', ' '}
+    assert lines[2].split() == [
+        '4.0000',
+        '1',
+        '4000.000',
+        'target.Model',
+        'field',
+        'f4',
+    ]
+    assert lines[3].split() == [
+        '3.0000',
+        '1',
+        '3000.000',
+        'target.Model',
+        'field',
+        'f3',
+    ]
+    assert len(lines) == 4
+
+
+def test_profiler_disabled_by_default(test_app):
+    app = test_app('base')
+
+    assert get_profiler(app.env) is None
+
+
+def test_profiler_autodoc(test_app):
+    """Ensure that all phases of the model documenter as well as all field and
+    validator documenters are measured and written to the report.
+
+    """
+
+    app = test_app(
+        'base',
+        conf={
+            'autodoc_pydantic_profile': True,
+            'autodoc_pydantic_model_members': True,
+            'autodoc_pydantic_model_undoc_members': True,
+            'autodoc_pydantic_model_show_json': True,
+            'autodoc_pydantic_model_show_config_summary': True,
+            'autodoc_pydantic_model_show_field_summary': True,
+            'autodoc_pydantic_model_show_validator_summary': True,
+            'autodoc_pydantic_model_show_validator_members': True,
+        },
+        deactivate_all=True,
+    )
+
+    do_autodoc(
+        app=app,
+        documenter='pydantic_model',
+        object_path='target.configuration.ModelShowValidatorsSummary',
+    )
+
+    profiler = get_profiler(app.env)
+    phases = profiler.to_dict()['models'][
+        'target.configuration.ModelShowValidatorsSummary'
+    ]
+    assert set(phases['phases']) == {
+        'json-schema',
+        'config-summary',
+        'field-summary',
+        'validator-summary',
+        'field field',
+        'validator check',
+    }
+
+    write_profile_report(app, None)
+
+    path = Path(app.outdir) / f'{PROFILE_REPORT_FILENAME}.json'
+    assert json.loads(path.read_text()) == json.loads(json.dumps(profiler.to_dict()))
+    assert 'validator check' in path.with_suffix('.txt').read_text()